@@ -1,5 +1,7 @@
 from gym.envs.registration import register
-from utils.common import methods
+
+from .utils.common import constants
+from .utils.common import methods
 
 
 date_of_instantiation = methods.get_current_timestamp()
@@ -9,3 +11,12 @@ register(
     entry_point="neuro_robotics.environment:NeuroRoboticsEnv",
     max_episode_steps=50,
 )
+
+# one id per realm manifest, a realm is only compiled once an env is made
+for realm in methods.available_realms():
+    register(
+        id=constants.RealmManifest.ENV_IDENTIFIER.value.format(realm=realm),
+        entry_point="neuro_robotics.environment:NeuroRoboticsEnv",
+        max_episode_steps=50,
+        kwargs=dict(realm=realm),
+    )
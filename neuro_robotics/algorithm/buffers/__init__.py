@@ -0,0 +1,7 @@
+from .goal_episode_replay_buffer import GoalEpisodeReplayBuffer
+from .replay_storage import ReplayStorage
+
+__all__ = [
+    GoalEpisodeReplayBuffer,
+    ReplayStorage,
+]
@@ -0,0 +1,383 @@
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+import numpy as np
+import torch as th
+from gym import spaces
+from stable_baselines3.common.buffers import BaseBuffer
+from stable_baselines3.common.type_aliases import DictReplayBufferSamples
+from stable_baselines3.common.vec_env import VecNormalize
+
+from .replay_storage import ReplayStorage
+from neuro_robotics.utils.common import constants
+
+
+class GoalEpisodeReplayBuffer(BaseBuffer):
+    """Hindsight replay buffer storing every goal-conditioned step once.
+
+    Steps of each env are written contiguously into their own lane of a
+    ``(n_envs, buffer_size // n_envs)`` row store, so the next observation of a
+    step is simply the following row and an episode occupies consecutive pages.
+    Only the terminal observation of an episode needs a row of its own. The achieved goal is read back as a slice
+    of ``observation`` (``achieved_goal_offset``) instead of being stored, float
+    keys may be kept as float16 and rewards are recomputed with the env's
+    reward kernel. Sampled transitions are relabeled with ``future`` goals of
+    the same episode for a ``1 - 1 / (n_sampled_goal + 1)`` share of the batch.
+
+    With ``storage_dir`` every array is a memmap file and the bookkeeping is
+    written every ``flush_interval`` steps, a buffer found in ``storage_dir`` is
+    resumed. Steps stored after the last flush are dropped on resume.
+
+    Args:
+        buffer_size (int): Maximum number of stored rows over all envs.
+        observation_space (spaces.Dict): Goal env observation space.
+        action_space (spaces.Space): Action space.
+        device (Union[th.device, str]): Device of the sampled tensors.
+        n_envs (int): Number of parallel envs feeding the buffer.
+        optimize_memory_usage (bool): Unused, rows are never duplicated anyway.
+        handle_timeout_termination (bool): Bootstrap through time limits.
+        compute_reward (Callable): Vectorized ``compute_reward(achieved, desired, info)``.
+        n_sampled_goal (int): Virtual transitions per real one.
+        achieved_goal_offset (Optional[int]): Start of the achieved goal inside
+            ``observation``, None stores it separately.
+        storage_dtype (str): ``float32`` or ``float16`` storage of float keys.
+        storage_dir (Optional[Path]): Directory of the memmap files, None keeps
+            the buffer in memory.
+        flush_interval (int): Steps between two persisted states on disk.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int,
+        observation_space: spaces.Dict,
+        action_space: spaces.Space,
+        device: Union[th.device, str] = "auto",
+        n_envs: int = 1,
+        optimize_memory_usage: bool = False,
+        handle_timeout_termination: bool = True,
+        compute_reward: Optional[Callable] = None,
+        n_sampled_goal: int = 4,
+        achieved_goal_offset: Optional[int] = None,
+        storage_dtype: str = constants.ReplayStorageDtype.FLOAT32.value,
+        storage_dir: Optional[Path] = None,
+        flush_interval: int = 10_000,
+    ):
+        super().__init__(
+            buffer_size, observation_space, action_space, device, n_envs=n_envs
+        )
+        if compute_reward is None:
+            raise SystemError("GoalEpisodeReplayBuffer needs the env compute_reward")
+        self.compute_reward = compute_reward
+        self.handle_timeout_termination = handle_timeout_termination
+        self.her_ratio = 1 - (1.0 / (n_sampled_goal + 1))
+        self.achieved_goal_offset = achieved_goal_offset
+        self.storage_dtype = np.dtype(constants.ReplayStorageDtype(storage_dtype).value)
+        self.goal_dim = self.obs_shape["achieved_goal"][0]
+
+        self.n_rows = max(buffer_size // n_envs, 2)
+        self.flush_interval = flush_interval
+        self.storage = ReplayStorage(storage_dir)
+        lane = (n_envs, self.n_rows)
+        self.observations = {
+            key: self.storage.allocate(
+                f"observation_{key}", lane + shape, self._storage_dtype_of(key)
+            )
+            for key, shape in self.obs_shape.items()
+            if not (key == "achieved_goal" and self.deduplicate_achieved_goal)
+        }
+        self.actions = self.storage.allocate(
+            "actions", lane + (self.action_dim,), self.storage_dtype
+        )
+        self.dones = self.storage.allocate("dones", lane, bool)
+        # rows whose next row holds their next observation
+        self.is_transition = self.storage.allocate("is_transition", lane, bool)
+        # last row of the episode (its terminal observation), -1 while running
+        self.episode_end = self.storage.allocate("episode_end", lane, np.int32, -1)
+
+        self.rows = np.zeros(n_envs, dtype=np.int64)
+        self.filled = np.zeros(n_envs, dtype=np.int64)
+        self.episode_start = np.zeros(n_envs, dtype=np.int64)
+        self.in_episode = np.zeros(n_envs, dtype=bool)
+        self.n_transitions = 0
+        self.n_steps = 0
+        self._goal_slice_checked = False
+        if self.storage.has_state():
+            self._restore(self.storage.load_state())
+
+    @property
+    def deduplicate_achieved_goal(self) -> bool:
+        return self.achieved_goal_offset is not None
+
+    def _storage_dtype_of(self, key: str) -> np.dtype:
+        dtype = np.dtype(self.observation_space.spaces[key].dtype)
+        return self.storage_dtype if dtype.kind == "f" else dtype
+
+    def bytes_per_transition(self) -> float:
+        """storage bytes per environment step, terminal rows amortised over an episode"""
+        row_bytes = sum(
+            buffer[0, 0].nbytes for buffer in self.observations.values()
+        ) + (
+            self.actions[0, 0].nbytes
+            + self.dones.itemsize
+            + self.is_transition.itemsize
+            + self.episode_end.itemsize
+        )
+        max_episode_steps = constants.VectorizedEnvironment.MAX_EPISODE_STEPS.value
+        return row_bytes * (1 + 1 / max_episode_steps)
+
+    @staticmethod
+    def stock_bytes_per_transition(
+        observation_space: spaces.Dict, action_space: spaces.Space
+    ) -> float:
+        """bytes per step of stable-baselines3 ``HerReplayBuffer``
+
+        obs and next obs float32 for every key, action, reward, done and timeout
+        """
+        observation_floats = sum(
+            int(np.prod(space.shape)) for space in observation_space.spaces.values()
+        )
+        action_floats = int(np.prod(action_space.shape))
+        return 4 * (2 * observation_floats + action_floats + 3)
+
+    def size(self) -> int:
+        return self.n_transitions
+
+    def reset(self) -> None:
+        super().reset()
+        self.is_transition[:] = False
+        self.episode_end[:] = -1
+        self.rows[:] = 0
+        self.filled[:] = 0
+        self.in_episode[:] = False
+        self.n_transitions = 0
+
+    def _state(self) -> dict:
+        return {
+            "n_envs": self.n_envs,
+            "n_rows": self.n_rows,
+            "keys": sorted(self.observations),
+            "storage_dtype": self.storage_dtype.name,
+            "rows": self.rows.tolist(),
+            "filled": self.filled.tolist(),
+            "episode_start": self.episode_start.tolist(),
+            "in_episode": self.in_episode.tolist(),
+            "n_steps": self.n_steps,
+        }
+
+    def _restore(self, state: dict) -> None:
+        """Resume from the last flushed state.
+        Rows written between that flush and the crash are not described by the
+        state, they are invalidated and the interrupted episodes are closed at
+        their last flushed row.
+        """
+        layout = ("n_envs", "n_rows", "keys", "storage_dtype")
+        expected = self._state()
+        if any(state[key] != expected[key] for key in layout):
+            raise SystemError(
+                f"Replay storage {self.storage.directory} does not match the buffer "
+                f"layout: {({key: state[key] for key in layout})}"
+            )
+        self.rows[:] = state["rows"]
+        self.filled[:] = state["filled"]
+        self.episode_start[:] = state["episode_start"]
+        self.n_steps = state["n_steps"]
+
+        unflushed_rows = min(2 * self.flush_interval + 1, self.n_rows)
+        for env_idx, row in enumerate(self.rows):
+            lost = (row - 1 + np.arange(unflushed_rows + 1)) % self.n_rows
+            self.is_transition[env_idx, lost] = False
+            if state["in_episode"][env_idx]:
+                self._close_episode(env_idx, (row - 1) % self.n_rows)
+        self.in_episode[:] = False
+        self.n_transitions = int(np.count_nonzero(self.is_transition))
+        self.full = bool(np.all(self.filled == self.n_rows))
+        self.pos = int(self.rows[0])
+
+    def flush(self) -> None:
+        """persist the bookkeeping of a disk backed buffer, a no-op in memory"""
+        self.storage.save_state(self._state())
+
+    def _check_goal_slice(self, obs: Dict[str, np.ndarray]):
+        """the deduplicated goal must really be a slice of the observation"""
+        self._goal_slice_checked = True
+        if not self.deduplicate_achieved_goal:
+            return
+        sliced = self._slice_achieved_goal(obs["observation"])
+        if not np.allclose(sliced, obs["achieved_goal"], atol=1e-3):
+            raise SystemError(
+                f"achieved_goal is not observation[..., {self.achieved_goal_offset}"
+                f":+{self.goal_dim}], disable achieved_goal_offset"
+            )
+
+    def _slice_achieved_goal(self, observation: np.ndarray) -> np.ndarray:
+        start = self.achieved_goal_offset % observation.shape[-1]
+        return observation[..., start : start + self.goal_dim]
+
+    def _set_transition(self, env_idx: int, row: int, value: bool):
+        if self.is_transition[env_idx, row] != value:
+            self.n_transitions += 1 if value else -1
+            self.is_transition[env_idx, row] = value
+
+    def _write_row(self, env_idx: int, row: int, obs: Dict[str, np.ndarray]):
+        """overwrite a row, transitions into or out of it are no longer valid"""
+        for key, buffer in self.observations.items():
+            buffer[env_idx, row] = obs[key][env_idx]
+        self._set_transition(env_idx, row, False)
+        self._set_transition(env_idx, (row - 1) % self.n_rows, False)
+        self.episode_end[env_idx, row] = -1
+        self.filled[env_idx] = min(self.filled[env_idx] + 1, self.n_rows)
+
+    def _close_episode(self, env_idx: int, terminal_row: int):
+        length = (terminal_row - self.episode_start[env_idx]) % self.n_rows + 1
+        rows = (self.episode_start[env_idx] + np.arange(length)) % self.n_rows
+        self.episode_end[env_idx, rows] = terminal_row
+
+    def add(
+        self,
+        obs: Dict[str, np.ndarray],
+        next_obs: Dict[str, np.ndarray],
+        action: np.ndarray,
+        reward: np.ndarray,
+        done: np.ndarray,
+        infos: List[Dict[str, Any]],
+    ) -> None:
+        if not self._goal_slice_checked:
+            self._check_goal_slice(obs)
+        action = action.reshape((self.n_envs, self.action_dim))
+        for env_idx in range(self.n_envs):
+            row = self.rows[env_idx]
+            self._write_row(env_idx, row, obs)
+            if self.in_episode[env_idx]:
+                # obs of this step is the next obs of the previous one
+                self._set_transition(env_idx, (row - 1) % self.n_rows, True)
+            else:
+                self.episode_start[env_idx] = row
+                self.in_episode[env_idx] = True
+
+            self.actions[env_idx, row] = action[env_idx]
+            timeout = infos[env_idx].get("TimeLimit.truncated", False)
+            self.dones[env_idx, row] = done[env_idx] and not (
+                self.handle_timeout_termination and timeout
+            )
+            row = (row + 1) % self.n_rows
+
+            if done[env_idx]:
+                # next_obs already holds the terminal observation
+                self._write_row(env_idx, row, next_obs)
+                self._set_transition(env_idx, (row - 1) % self.n_rows, True)
+                self._close_episode(env_idx, row)
+                self.in_episode[env_idx] = False
+                row = (row + 1) % self.n_rows
+            self.rows[env_idx] = row
+        self.full = bool(np.all(self.filled == self.n_rows))
+        self.pos = int(self.rows[0])
+
+        self.n_steps += 1
+        if self.storage.on_disk and self.n_steps % self.flush_interval == 0:
+            self.flush()
+
+    def _sample_transitions(self, batch_size: int):
+        """rejection sample stored transitions, terminal and pending rows are rare"""
+        upper = int(self.filled.max())
+        env_indices = np.empty(0, dtype=np.int64)
+        rows = np.empty(0, dtype=np.int64)
+        while len(rows) < batch_size:
+            candidate_envs = np.random.randint(0, self.n_envs, size=2 * batch_size)
+            candidate_rows = np.random.randint(0, upper, size=2 * batch_size)
+            valid = self.is_transition[candidate_envs, candidate_rows]
+            env_indices = np.concatenate([env_indices, candidate_envs[valid]])
+            rows = np.concatenate([rows, candidate_rows[valid]])
+        return env_indices[:batch_size], rows[:batch_size]
+
+    def _future_rows(self, env_indices: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """a row in ``(row, episode_end]``, running episodes end at the newest row"""
+        episode_end = self.episode_end[env_indices, rows].astype(np.int64)
+        running = episode_end < 0
+        episode_end[running] = (self.rows[env_indices[running]] - 1) % self.n_rows
+        steps_left = (episode_end - rows) % self.n_rows
+        offset = 1 + (np.random.uniform(size=len(rows)) * steps_left).astype(np.int64)
+        return (rows + np.minimum(offset, steps_left)) % self.n_rows
+
+    def _achieved_goal(self, env_indices: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        if self.deduplicate_achieved_goal:
+            observation = self.observations["observation"][env_indices, rows]
+            return self._slice_achieved_goal(observation).astype(np.float32)
+        return self.observations["achieved_goal"][env_indices, rows].astype(np.float32)
+
+    def _gather(self, env_indices: np.ndarray, rows: np.ndarray, desired_goal):
+        observation = {
+            key: buffer[env_indices, rows]
+            for key, buffer in self.observations.items()
+            if key != "desired_goal"
+        }
+        observation = {
+            key: value.astype(np.float32) if value.dtype.kind == "f" else value
+            for key, value in observation.items()
+        }
+        observation["achieved_goal"] = self._achieved_goal(env_indices, rows)
+        observation["desired_goal"] = desired_goal
+        return observation
+
+    def sample(
+        self, batch_size: int, env: Optional[VecNormalize] = None
+    ) -> DictReplayBufferSamples:
+        if self.size() == 0:
+            raise SystemError("Can not sample an empty replay buffer")
+        env_indices, rows = self._sample_transitions(batch_size)
+        return self._get_samples(env_indices * self.n_rows + rows, env)
+
+    def _get_samples(
+        self, batch_inds: np.ndarray, env: Optional[VecNormalize] = None
+    ) -> DictReplayBufferSamples:
+        """Relabel and gather stored transitions.
+        Args:
+            batch_inds (np.ndarray): Flat ``env_idx * n_rows + row`` indices of
+                rows holding a transition.
+            env (Optional[VecNormalize]): Normalizes observations and rewards.
+        Returns:
+            DictReplayBufferSamples: The batch, a share of it with future goals.
+        """
+        env_indices, rows = np.divmod(
+            np.asarray(batch_inds, dtype=np.int64), self.n_rows
+        )
+        if not np.all(self.is_transition[env_indices, rows]):
+            raise SystemError("Sampled rows do not all hold a stored transition")
+        next_rows = (rows + 1) % self.n_rows
+
+        desired_goal = self.observations["desired_goal"][env_indices, rows].astype(
+            np.float32
+        )
+        relabel = np.random.uniform(size=len(rows)) < self.her_ratio
+        if np.any(relabel):
+            future_rows = self._future_rows(env_indices[relabel], rows[relabel])
+            desired_goal[relabel] = self._achieved_goal(
+                env_indices[relabel], future_rows
+            )
+
+        observation = self._gather(env_indices, rows, desired_goal)
+        next_observation = self._gather(env_indices, next_rows, desired_goal)
+        rewards = np.array(
+            self.compute_reward(next_observation["achieved_goal"], desired_goal, None),
+            dtype=np.float32,
+        ).reshape(-1, 1)
+
+        observation = self._normalize_obs(observation, env)
+        next_observation = self._normalize_obs(next_observation, env)
+        return DictReplayBufferSamples(
+            observations={
+                key: self.to_torch(value) for key, value in observation.items()
+            },
+            actions=self.to_torch(self.actions[env_indices, rows].astype(np.float32)),
+            next_observations={
+                key: self.to_torch(value) for key, value in next_observation.items()
+            },
+            dones=self.to_torch(
+                self.dones[env_indices, rows].astype(np.float32).reshape(-1, 1)
+            ),
+            rewards=self.to_torch(self._normalize_reward(rewards, env)),
+        )
@@ -0,0 +1,83 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+# bump when the on-disk layout changes, older buffers are then refused
+STORAGE_VERSION = 1
+
+
+class ReplayStorage:
+    """Allocate replay arrays in memory or as ``numpy.memmap`` files.
+
+    On disk every array is a ``.npy`` file under ``directory`` opened as a
+    memmap, so only the pages that are touched stay resident and the kernel
+    writes them back on its own. ``save_state`` flushes the arrays and then
+    atomically replaces ``state.json``, the bookkeeping of the owning buffer.
+    A directory holding a state is reopened instead of being overwritten.
+    """
+
+    STATE_FILE = "state.json"
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory is not None else None
+        self.arrays: Dict[str, np.ndarray] = {}
+        if self.on_disk:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def on_disk(self) -> bool:
+        return self.directory is not None
+
+    @property
+    def state_path(self) -> Path:
+        return self.directory / self.STATE_FILE
+
+    def has_state(self) -> bool:
+        return self.on_disk and self.state_path.exists()
+
+    def allocate(self, name: str, shape: Tuple[int, ...], dtype, fill=0) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        if not self.on_disk:
+            array = np.full(shape, fill, dtype=dtype)
+        elif self.has_state():
+            array = np.lib.format.open_memmap(self.directory / f"{name}.npy", mode="r+")
+            if array.shape != tuple(shape) or array.dtype != dtype:
+                raise SystemError(
+                    f"Replay array {name} on disk is {array.shape} {array.dtype}, "
+                    f"expected {tuple(shape)} {dtype}"
+                )
+        else:
+            array = np.lib.format.open_memmap(
+                self.directory / f"{name}.npy", mode="w+", dtype=dtype, shape=shape
+            )
+            if fill:
+                array[:] = fill
+        self.arrays[name] = array
+        return array
+
+    def load_state(self) -> dict:
+        state = json.loads(self.state_path.read_text())
+        if state.get("version") != STORAGE_VERSION:
+            raise SystemError(
+                f"Replay storage {self.directory} has version {state.get('version')}, "
+                f"expected {STORAGE_VERSION}"
+            )
+        return state
+
+    def save_state(self, state: dict) -> None:
+        """arrays first, a state never describes rows that are not on disk"""
+        if not self.on_disk:
+            return
+        for array in self.arrays.values():
+            array.flush()
+        temporary_path = self.state_path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps({**state, "version": STORAGE_VERSION}))
+        os.replace(temporary_path, self.state_path)
+
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self.arrays.values())
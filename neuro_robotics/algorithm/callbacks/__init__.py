@@ -1,5 +1,9 @@
+from .curriculum_callback import CurriculumCallback
 from .history_callback import HistoryCallback
+from .profiling_callback import ProfilingCallback
 
 __all__ = [
+    CurriculumCallback,
     HistoryCallback,
+    ProfilingCallback,
 ]
@@ -0,0 +1,33 @@
+import numpy as np
+from stable_baselines3.common.callbacks import BaseCallback
+
+from neuro_robotics.utils.common import constants
+
+
+class CurriculumCallback(BaseCallback):
+    """
+    Log the goal curriculum level the envs report in their step infos.
+    Levels are read from ``info["curriculum_level"]``, so every vectorized
+    backend is covered, worker curricula are averaged.
+    :param log_interval: (int) Number of callback calls between two readouts
+    :param verbose: (int) Verbosity level 0: not output 1: info 2: debug
+    """
+
+    def __init__(
+        self, log_interval=constants.Curriculum.LOG_INTERVAL.value, verbose=0
+    ) -> None:
+        super().__init__(verbose)
+        self.log_interval = log_interval
+
+    def _on_step(self) -> bool:
+        if self.n_calls % self.log_interval:
+            return True
+        levels = [
+            info["curriculum_level"]
+            for info in self.locals.get("infos", [])
+            if "curriculum_level" in info
+        ]
+        if levels:
+            self.logger.record("curriculum/level", float(np.mean(levels)))
+            self.logger.record("curriculum/max_level", max(levels))
+        return True
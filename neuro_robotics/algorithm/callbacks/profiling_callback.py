@@ -0,0 +1,31 @@
+from stable_baselines3.common.callbacks import BaseCallback
+
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common.profiling import StepProfiler
+
+
+class ProfilingCallback(BaseCallback):
+    """
+    Stream the step phase latencies of profiled envs into the sb3 logger.
+    Worker histograms are merged and cleared every ``log_interval`` calls, so
+    every logged value covers the window since the previous one.
+    :param log_interval: (int) Number of callback calls between two readouts
+    :param verbose: (int) Verbosity level 0: not output 1: info 2: debug
+    """
+
+    def __init__(
+        self, log_interval=constants.Profiling.LOG_INTERVAL.value, verbose=0
+    ) -> None:
+        super().__init__(verbose)
+        self.log_interval = log_interval
+
+    def _on_step(self) -> bool:
+        if self.n_calls % self.log_interval:
+            return True
+        snapshot = StepProfiler.merge(self.training_env.env_method("profile_snapshot"))
+        self.training_env.env_method("reset_profile")
+        for phase, statistics in StepProfiler.summarize(snapshot).items():
+            for name, value in statistics.items():
+                if name != "count":
+                    self.logger.record(f"profile/{phase}_{name}", value)
+        return True
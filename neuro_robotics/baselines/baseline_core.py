@@ -2,21 +2,24 @@ import logging
 from pathlib import Path
 
 import gym
-import pandas as pd
-import wandb
 from stable_baselines3 import HerReplayBuffer
 from stable_baselines3.common.callbacks import CallbackList
 from stable_baselines3.common.callbacks import EvalCallback
 from stable_baselines3.common.env_checker import check_env
 from stable_baselines3.common.evaluation import evaluate_policy
 from stable_baselines3.common.monitor import Monitor
-from stable_baselines3.common.vec_env import DummyVecEnv
-from stable_baselines3.common.vec_env import VecVideoRecorder
 from utils.common import constants
-from wandb.integration.sb3 import WandbCallback
 
 import neuro_robotics
+from neuro_robotics.algorithm.buffers import GoalEpisodeReplayBuffer
+from neuro_robotics.algorithm.callbacks import CurriculumCallback
 from neuro_robotics.algorithm.callbacks import HistoryCallback
+from neuro_robotics.algorithm.callbacks import ProfilingCallback
+from neuro_robotics.environment.model import realm_registry
+from neuro_robotics.environment.reward import SparseRewardKernel
+from neuro_robotics.environment.rollouts import RolloutLogger
+from neuro_robotics.environment.vectorized import AsyncVecVideoRecorder
+from neuro_robotics.environment.vectorized import make_vec_env
 
 
 class BaselineCore:
@@ -37,13 +40,73 @@ class BaselineCore:
     def _check_env_implementation(self, env):
         check_env(env)
 
-    def _instantiate_env(self):
+    def _environment_kwargs(self):
+        """recording and pixel observations need the visual meshes"""
+        env_kwargs = dict(self.baseline_configuration["environment"])
+        observation_mode = (env_kwargs.get("observation") or {}).get(
+            "mode", constants.ObservationMode.STATE.value
+        )
+        if (
+            self.baseline_configuration["baseline"]["record"]
+            or observation_mode != constants.ObservationMode.STATE.value
+        ):
+            env_kwargs["headless"] = False
+        return env_kwargs
+
+    def _rollout_kwargs(self, experiment_dir):
+        """RolloutLogger arguments, None unless rollouts are logged"""
+        rollout_settings = self.baseline_configuration["rollouts"]
+        if experiment_dir is None or not rollout_settings["use"]:
+            return None
+        return dict(
+            directory=experiment_dir / rollout_settings["dir"],
+            shard_size=rollout_settings["shard_size"],
+        )
+
+    def _instantiate_env(self, experiment_dir=None):
         env_identifier = self.baseline_configuration["baseline"]["env"]
-        env = gym.make(env_identifier)
+        env = gym.make(env_identifier, **self._environment_kwargs())
+        seed = self.baseline_configuration["baseline"]["seed"]
+        if seed is not None:
+            env.seed(seed)
+        rollout_kwargs = self._rollout_kwargs(experiment_dir)
+        if rollout_kwargs is not None:
+            env = RolloutLogger(env, **rollout_kwargs)
         env = Monitor(env)
         return env
 
+    def _instantiate_vec_env(self, experiment_dir=None):
+        env_identifier = self.baseline_configuration["baseline"]["env"]
+        parallel_settings = self.baseline_configuration["parallel"]
+        if (
+            parallel_settings["backend"] == "batched"
+            and self.baseline_configuration["baseline"]["record"]
+        ):
+            raise SystemError(
+                "The batched backend can not render frames, set record to False"
+            )
+        env = make_vec_env(
+            env_identifier,
+            num_envs=parallel_settings["num_envs"],
+            backend=parallel_settings["backend"],
+            start_method=parallel_settings["start_method"],
+            env_kwargs=self._environment_kwargs(),
+            rollout_kwargs=self._rollout_kwargs(experiment_dir),
+            seed=self.baseline_configuration["baseline"]["seed"],
+        )
+        return env
+
+    def _use_vec_env(self):
+        parallel_settings = self.baseline_configuration["parallel"]
+        return (
+            self.baseline_configuration["baseline"]["record"]
+            or parallel_settings["num_envs"] > 1
+            or parallel_settings["backend"] != "dummy"
+        )
+
     def _instantiate_wandb(self, wandb_configuration, datapoint):
+        import wandb
+
         wandb.login()
         run = wandb.init(
             entity=wandb_configuration["entity"],
@@ -80,6 +143,8 @@ class BaselineCore:
             callback_list.append(checkpoint_callback)
 
         if performance_callback_settings["use"]:
+            from wandb.integration.sb3 import WandbCallback
+
             performance_callback = WandbCallback(
                 gradient_save_freq=performance_callback_settings["grad_save_freq"],
                 model_save_path=datapoint / performance_callback_settings["checkpoint"],
@@ -97,17 +162,94 @@ class BaselineCore:
             )
             callback_list.append(history_callback)
 
+        if self.baseline_configuration["environment"]["profile"]:
+            profiling_callback_settings = self.baseline_configuration["callback"][
+                "profiling"
+            ]
+            callback_list.append(
+                ProfilingCallback(
+                    log_interval=profiling_callback_settings["log_interval"]
+                )
+            )
+
+        if self.baseline_configuration["environment"]["goal_sampling"]["curriculum"][
+            "use"
+        ]:
+            curriculum_callback_settings = self.baseline_configuration["callback"][
+                "curriculum"
+            ]
+            callback_list.append(
+                CurriculumCallback(
+                    log_interval=curriculum_callback_settings["log_interval"]
+                )
+            )
+
         callbacks = CallbackList(callback_list)
         return callbacks
 
-    def _instantiate_model(self, env, policy, verbose, tensorboard_log):
+    def _replay_storage_dir(self, experiment_dir):
+        """memmap directory of the buffer, a crashed experiment is resumed in place"""
+        disk_settings = self.baseline_configuration["replay_buffer"]["disk"]
+        if not disk_settings["use"]:
+            return None
+        if disk_settings["resume"]:
+            experiment_dir = (
+                constants.DATA_SAVE_DIRECTORY_PATH / disk_settings["resume"]
+            )
+            if not experiment_dir.exists():
+                raise SystemError(f"Can not resume replay buffer of {experiment_dir}")
+        return experiment_dir / disk_settings["dir"]
+
+    def _reward_kernel(self):
+        """kernel of the configured realm, built here instead of fetched from the
+        env, a process backend would pickle a whole worker env to hand it over"""
+        realm = self.baseline_configuration["environment"].get(
+            "realm", constants.Realm.PANDA.value
+        )
+        return SparseRewardKernel(realm_registry.depiction(realm).distance_threshold)
+
+    def _replay_buffer(self, env, experiment_dir):
+        """replay buffer class and kwargs selected by the ``replay_buffer`` settings"""
+        buffer_settings = self.baseline_configuration["replay_buffer"]
+        backend = constants.ReplayBufferBackend(buffer_settings["backend"])
+        storage_dir = self._replay_storage_dir(experiment_dir)
+        if backend == constants.ReplayBufferBackend.HER:
+            if storage_dir is not None:
+                raise SystemError("Disk replay storage needs the episode backend")
+            return HerReplayBuffer, None
+
+        observation_space = env.observation_space
+        state_observation = (
+            observation_space["observation"].dtype
+            == observation_space["achieved_goal"].dtype
+        )
+        achieved_goal_offset = None
+        if buffer_settings["deduplicate_achieved_goal"] and state_observation:
+            # generate_observation_matrix appends the achieved goal to the state
+            achieved_goal_offset = -observation_space["achieved_goal"].shape[0]
+        replay_buffer_kwargs = dict(
+            compute_reward=self._reward_kernel().compute_reward,
+            n_sampled_goal=buffer_settings["n_sampled_goal"],
+            achieved_goal_offset=achieved_goal_offset,
+            storage_dtype=buffer_settings["storage_dtype"],
+            storage_dir=storage_dir,
+            flush_interval=buffer_settings["disk"]["flush_interval"],
+        )
+        return GoalEpisodeReplayBuffer, replay_buffer_kwargs
+
+    def _instantiate_model(self, env, policy, verbose, tensorboard_log, experiment_dir):
+        replay_buffer_class, replay_buffer_kwargs = self._replay_buffer(
+            env, experiment_dir
+        )
         model = self.baseline_model(
             policy=policy,
             env=env,
-            replay_buffer_class=HerReplayBuffer,
+            replay_buffer_class=replay_buffer_class,
+            replay_buffer_kwargs=replay_buffer_kwargs,
             verbose=verbose,
             tensorboard_log=tensorboard_log,
             device=self.device,
+            seed=self.baseline_configuration["baseline"]["seed"],
         )
         return model
 
@@ -115,6 +257,8 @@ class BaselineCore:
         return self.baseline_model.load(path_to_model, env, device=self.device)
 
     def _fetch_best_model_from_csv(self, csv_file: Path, score_thr) -> Path:
+        import pandas as pd
+
         best_model = None
         csv_exists = csv_file.exists()
         if csv_exists:
@@ -130,6 +274,8 @@ class BaselineCore:
         return best_model
 
     def _update_csv_file(self, model, csv_f):
+        import pandas as pd
+
         frame = {
             "model": [model],
             "mean_reward": ["pretrained"],
@@ -143,8 +289,12 @@ class BaselineCore:
         date = neuro_robotics.date_of_instantiation
         experiment_identifier = self._register_experiment(date)
 
+        if self._use_vec_env():
+            env = self._instantiate_vec_env(experiment_identifier)
+        else:
+            env = self._instantiate_env(experiment_identifier)
+
         if self.baseline_configuration["baseline"]["record"]:
-            env = DummyVecEnv([self._instantiate_env])
             video_save_pth = str(
                 experiment_identifier
                 / self.baseline_configuration["baseline"]["video_path"]
@@ -152,14 +302,13 @@ class BaselineCore:
             record_frequency = self.baseline_configuration["baseline"][
                 "record_frequency"
             ]
-            env = VecVideoRecorder(
+            env = AsyncVecVideoRecorder(
                 env,
                 video_save_pth,
                 record_video_trigger=lambda x: not (x % record_frequency),
                 video_length=200,
+                queue_size=self.baseline_configuration["baseline"]["record_queue_size"],
             )
-        else:
-            env = self._instantiate_env()
 
         tensorboard_log = (
             experiment_identifier
@@ -208,30 +357,39 @@ class BaselineCore:
             if best_model_path is not None:
                 model = self._load_pretrained_model(best_model_path, env)
             else:
-                model = self._instantiate_model(env, policy, verbose, tensorboard_log)
+                model = self._instantiate_model(
+                    env, policy, verbose, tensorboard_log, experiment_identifier
+                )
         elif self.baseline_configuration["inference"]["pretrained"]:
             model_pth = constants.PRETRAINED_MODEL_PATH
             model = self._load_pretrained_model(model_pth, env)
         else:
-            model = self._instantiate_model(env, policy, verbose, tensorboard_log)
+            model = self._instantiate_model(
+                env, policy, verbose, tensorboard_log, experiment_identifier
+            )
 
         callback_chain = self._chain_callbacks(env, experiment_identifier)
 
-        if datapoint is not None:
-            with datapoint:
+        try:
+            if datapoint is not None:
+                with datapoint:
+                    model.learn(
+                        total_timesteps=self.baseline_configuration["baseline"][
+                            "total_timesteps"
+                        ],
+                        callback=callback_chain,
+                    )
+            else:
                 model.learn(
                     total_timesteps=self.baseline_configuration["baseline"][
                         "total_timesteps"
                     ],
                     callback=callback_chain,
                 )
-        else:
-            model.learn(
-                total_timesteps=self.baseline_configuration["baseline"][
-                    "total_timesteps"
-                ],
-                callback=callback_chain,
-            )
+        finally:
+            # a disk backed buffer persists its bookkeeping, even on failure
+            if isinstance(model.replay_buffer, GoalEpisodeReplayBuffer):
+                model.replay_buffer.flush()
 
     def evaluate_model(self):
         eval_settings = self.baseline_configuration["evaluator"]
@@ -0,0 +1,141 @@
+import json
+import logging
+import time
+from pathlib import Path
+
+import click
+import gym
+import stable_baselines3
+from stable_baselines3 import HerReplayBuffer
+from stable_baselines3.common.callbacks import EvalCallback
+from stable_baselines3.common.callbacks import StopTrainingOnRewardThreshold
+from stable_baselines3.common.monitor import Monitor
+
+import neuro_robotics  # noqa: F401 registers the env ids
+from neuro_robotics.algorithm.callbacks import CurriculumCallback
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common import methods
+
+
+def make_env(curriculum: bool, configuration: dict, seed: int) -> gym.Env:
+    """state observation env of the settings, with or without the goal curriculum"""
+    env_kwargs = dict(configuration["environment"])
+    env_kwargs.update(
+        headless=True,
+        observation=None,
+        profile=False,
+    )
+    goal_sampling = dict(env_kwargs.get("goal_sampling") or {})
+    goal_sampling["curriculum"] = {
+        **(goal_sampling.get("curriculum") or {}),
+        "use": curriculum,
+    }
+    env_kwargs["goal_sampling"] = goal_sampling
+    env = gym.make(configuration["baseline"]["env"], **env_kwargs)
+    env.seed(seed)
+    return Monitor(env)
+
+
+def time_to_threshold(
+    curriculum: bool, configuration: dict, seed: int, settings: dict
+) -> dict:
+    """Train until the evaluation reward reaches the online score threshold.
+    Args:
+        curriculum (bool): Sample training goals through the goal curriculum.
+        configuration (dict): Parsed baseline settings.
+        seed (int): Seed of the envs and the model.
+        settings (dict): Timestep budget and evaluation cadence.
+
+    Returns:
+        dict: Wall clock seconds and timesteps until the threshold, None when
+        the budget ran out first, and the best evaluation reward.
+    """
+    env = make_env(curriculum, configuration, seed)
+    # evaluation always covers the full goal distribution
+    eval_env = make_env(False, configuration, seed + 1)
+
+    score_threshold = configuration["online"]["score_threshold"]
+    stop_callback = StopTrainingOnRewardThreshold(reward_threshold=score_threshold)
+    eval_callback = EvalCallback(
+        eval_env,
+        callback_on_new_best=stop_callback,
+        eval_freq=settings["eval_freq"],
+        n_eval_episodes=settings["n_eval_episodes"],
+        deterministic=True,
+        verbose=0,
+    )
+    callbacks = [eval_callback]
+    if curriculum:
+        callbacks.append(CurriculumCallback(log_interval=settings["eval_freq"]))
+
+    model_class = getattr(stable_baselines3, configuration["baseline"]["model"])
+    model = model_class(
+        configuration["baseline"]["policy_type"],
+        env,
+        replay_buffer_class=HerReplayBuffer,
+        replay_buffer_kwargs=dict(
+            n_sampled_goal=configuration["replay_buffer"]["n_sampled_goal"]
+        ),
+        seed=seed,
+        verbose=0,
+    )
+    start = time.perf_counter()
+    model.learn(total_timesteps=settings["total_timesteps"], callback=callbacks)
+    elapsed = time.perf_counter() - start
+    reached = eval_callback.best_mean_reward >= score_threshold
+    result = dict(
+        curriculum=curriculum,
+        seed=seed,
+        reached=bool(reached),
+        seconds=elapsed if reached else None,
+        timesteps=model.num_timesteps if reached else None,
+        best_mean_reward=float(eval_callback.best_mean_reward),
+        curriculum_statistics=env.unwrapped.curriculum_statistics(),
+    )
+    env.close()
+    eval_env.close()
+    return result
+
+
+@click.command()
+@click.option("--settings", default="baseline", help="Settings yaml file id")
+@click.option("--total-timesteps", default=300_000, help="Budget of every run")
+@click.option("--eval-freq", default=5000, help="Steps between two evaluations")
+@click.option("--n-eval-episodes", default=50, help="Episodes per evaluation")
+@click.option("--seeds", default="0,1,2", help="Comma separated run seeds")
+@click.option("--output", default="curriculum_threshold.json", help="JSON report")
+def launch(settings, total_timesteps, eval_freq, n_eval_episodes, seeds, output):
+    """wall clock time to the online score threshold, uniform goals against the curriculum"""
+    logging.basicConfig(level=logging.INFO)
+    configuration = methods.load_yaml(constants.SETTINGS_DIR / f"{settings}.yml")
+    run_settings = dict(
+        total_timesteps=total_timesteps,
+        eval_freq=eval_freq,
+        n_eval_episodes=n_eval_episodes,
+    )
+    results = []
+    for seed in map(int, seeds.split(",")):
+        for curriculum in (False, True):
+            result = time_to_threshold(curriculum, configuration, seed, run_settings)
+            results.append(result)
+            logging.info(
+                f"{'curriculum' if curriculum else 'uniform':>10} seed={seed} "
+                f"reached={result['reached']} seconds={result['seconds']} "
+                f"timesteps={result['timesteps']} "
+                f"best={result['best_mean_reward']:.1f}"
+            )
+    Path(output).write_text(
+        json.dumps(
+            dict(
+                score_threshold=configuration["online"]["score_threshold"],
+                settings=run_settings,
+                results=results,
+            ),
+            indent=2,
+        )
+    )
+    logging.info(f"curriculum report: {output}")
+
+
+if __name__ == "__main__":
+    launch()
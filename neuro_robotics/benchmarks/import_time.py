@@ -0,0 +1,95 @@
+import logging
+import subprocess
+import sys
+
+import click
+
+from neuro_robotics.utils.common import constants
+
+# modules a worker constructing the env must never import
+FORBIDDEN_MODULES = (
+    "matplotlib",
+    "yaml",
+    "pandas",
+    "wandb",
+    "stable_baselines3",
+    "torch",
+)
+
+IMPORT_STATEMENT = 'import neuro_robotics, gym; gym.make("NeuroRobotics-v1").close()'
+IMPORT_BUDGET_MS = 1500.0
+# printed after the statement, every top level package left in sys.modules
+LOADED_PACKAGES_STATEMENT = (
+    "import sys; print(' '.join({name.split('.')[0] for name in sys.modules}))"
+)
+
+
+def profile_import(statement: str):
+    """run the statement under -X importtime in a fresh interpreter
+    Returns:
+        Tuple[float, set, dict]: Total import time in ms, the top level packages
+        in ``sys.modules`` afterwards and the time of every outermost package.
+    """
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}\n{LOADED_PACKAGES_STATEMENT}",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=constants.CORE_DIR.parent,
+    )
+    total_us, outermost = 0, {}
+    packages = set(completed.stdout.split())
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, module = line[len("import time:") :].split("|")
+        if not cumulative_us.strip().isdigit():
+            continue
+        package = module.strip().split(".")[0]
+        # nested imports are indented, outermost entries already include them
+        if module[1:2] != " ":
+            total_us += int(cumulative_us)
+            outermost[package] = outermost.get(package, 0) + int(cumulative_us)
+    return total_us / 1e3, packages, outermost
+
+
+def profile_env_construction():
+    """profile IMPORT_STATEMENT once the configuration bundles are compiled
+    Returns:
+        Tuple[float, List[str], dict]: Total import time in ms, the forbidden
+        modules that were imported and the time of every outermost package.
+    """
+    # the first run in a fresh checkout parses the ymls and writes the bundles
+    profile_import(IMPORT_STATEMENT)
+    total_ms, packages, outermost = profile_import(IMPORT_STATEMENT)
+    return total_ms, sorted(set(FORBIDDEN_MODULES) & packages), outermost
+
+
+@click.command()
+@click.option(
+    "--budget-ms", default=IMPORT_BUDGET_MS, help="Allowed cumulative import time"
+)
+@click.option("--top", default=10, help="Slowest packages to report")
+def launch(budget_ms, top):
+    logging.basicConfig(level=logging.INFO)
+    total_ms, leaked, outermost = profile_env_construction()
+    for package, elapsed_us in sorted(outermost.items(), key=lambda x: -x[1])[:top]:
+        logging.info(f"{package:>24} {elapsed_us / 1e3:>8.1f}ms")
+
+    if leaked:
+        raise SystemError(f"Env construction imported heavy modules: {leaked}")
+    if total_ms > budget_ms:
+        raise SystemError(
+            f"Import time budget exceeded: {total_ms:.1f}ms > {budget_ms:.1f}ms"
+        )
+    logging.info(f"total import time {total_ms:.1f}ms within {budget_ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    launch()
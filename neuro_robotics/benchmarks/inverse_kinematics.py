@@ -0,0 +1,113 @@
+import logging
+import time
+
+import click
+import numpy as np
+import pybullet as p
+from pybullet_utils import bullet_client as bc
+
+from neuro_robotics.environment.abstract import RobotEntity
+from neuro_robotics.environment.kinematics import DampedLeastSquaresSolver
+from neuro_robotics.environment.kinematics import KinematicChain
+from neuro_robotics.environment.model.configuration import realm_registry
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common import methods
+
+
+def sample_problems(chain, neutral_position, n_problems, displacement, rng):
+    """warm starts around the neutral pose and targets one action step away"""
+    warm_start = chain.clip(
+        neutral_position + rng.normal(0.0, 0.2, (n_problems, chain.n_joints))
+    )
+    tip_transform, _, _ = chain.forward_kinematics(warm_start)
+    target_position = tip_transform[:, :3, 3] + rng.uniform(
+        -displacement, displacement, (n_problems, 3)
+    )
+    return warm_start, target_position
+
+
+def position_residual(chain, joint_angles, target_position):
+    tip_transform, _, _ = chain.forward_kinematics(joint_angles)
+    return np.linalg.norm(tip_transform[:, :3, 3] - target_position, axis=1)
+
+
+def solve_with_bullet(metadata, chain, warm_start, target_position):
+    client = bc.BulletClient(connection_mode=p.DIRECT)
+    model = client.loadURDF(metadata.description_file_location, useFixedBase=True)
+    solutions = np.empty_like(warm_start)
+    start = time.perf_counter()
+    for idx, (angles, target) in enumerate(zip(warm_start, target_position)):
+        for joint, angle in zip(chain.joint_indices, angles):
+            client.resetJointState(model, joint, angle)
+        joint_state = client.calculateInverseKinematics(
+            model, metadata.effector_link_id, target, RobotEntity.effector_orientation
+        )
+        solutions[idx] = joint_state[: chain.n_joints]
+    elapsed = time.perf_counter() - start
+    client.disconnect()
+    return solutions, elapsed
+
+
+def solve_with_dls(solver, warm_start, target_position, batch_size):
+    solutions = np.empty_like(warm_start)
+    start = time.perf_counter()
+    for idx in range(0, len(warm_start), batch_size):
+        batch = slice(idx, idx + batch_size)
+        solution = solver.solve(
+            target_position[batch], RobotEntity.effector_orientation, warm_start[batch]
+        )
+        solutions[batch] = solution.joint_angles
+    return solutions, time.perf_counter() - start
+
+
+def report(name, residual, elapsed):
+    logging.info(
+        f"{name:>12} solves/sec={len(residual) / elapsed:>10.1f} "
+        f"residual median={np.median(residual) * 1e3:.3f}mm "
+        f"p95={np.percentile(residual, 95) * 1e3:.3f}mm"
+    )
+
+
+@click.command()
+@click.option("--n-problems", default=2048, help="Inverse kinematics problems")
+@click.option("--displacement", default=0.05, help="Target distance per axis [m]")
+@click.option("--batch-sizes", default="1,16,256", help="Batch sizes of the solver")
+@click.option("--seed", default=0, help="Sampling seed")
+@click.option(
+    "--realm",
+    default=constants.Realm.PANDA.value,
+    type=click.Choice(methods.available_realms()),
+)
+def launch(n_problems, displacement, batch_sizes, seed, realm):
+    logging.basicConfig(level=logging.INFO)
+    metadata = realm_registry.depiction(realm).robot
+    chain = KinematicChain.from_urdf(
+        metadata.description_file_location, metadata.effector_link_id
+    )
+    neutral_position = np.array(
+        metadata.control_joints_neutral_position[: chain.n_joints]
+    )
+    rng = np.random.default_rng(seed)
+    warm_start, target_position = sample_problems(
+        chain, neutral_position, n_problems, displacement, rng
+    )
+
+    solutions, elapsed = solve_with_bullet(metadata, chain, warm_start, target_position)
+    report("bullet", position_residual(chain, solutions, target_position), elapsed)
+
+    solver = DampedLeastSquaresSolver(
+        chain,
+        damping=metadata.inverse_kinematics_damping,
+        max_iterations=metadata.inverse_kinematics_max_iterations,
+        tolerance=metadata.inverse_kinematics_tolerance,
+    )
+    for batch_size in map(int, batch_sizes.split(",")):
+        solutions, elapsed = solve_with_dls(
+            solver, warm_start, target_position, batch_size
+        )
+        residual = position_residual(chain, solutions, target_position)
+        report(f"dls/{batch_size}", residual, elapsed)
+
+
+if __name__ == "__main__":
+    launch()
@@ -0,0 +1,65 @@
+import logging
+import time
+
+import click
+import numpy as np
+import pybullet as p
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.utils.common import constants
+
+
+def legacy_render(env, width, height):
+    """the former render path, matrices and arrays rebuilt per frame, sleep left out"""
+    view_matrix = env.physics_client.computeViewMatrixFromYawPitchRoll(
+        cameraTargetPosition=[0.5, 0.4, -0.8],
+        distance=3,
+        yaw=0,
+        pitch=-50,
+        roll=1,
+        upAxisIndex=2,
+    )
+    proj_matrix = env.physics_client.computeProjectionMatrixFOV(
+        fov=60, aspect=float(width) / height, nearVal=0.1, farVal=100.0
+    )
+    (_, _, px, _, _) = env.physics_client.getCameraImage(
+        width=width,
+        height=height,
+        viewMatrix=view_matrix,
+        projectionMatrix=proj_matrix,
+        renderer=p.ER_BULLET_HARDWARE_OPENGL,
+    )
+    rgb_array = np.array(px, dtype=np.uint8)
+    rgb_array = np.reshape(rgb_array, (height, width, 4))
+    return rgb_array[:, :, :3]
+
+
+def measure_fps(render, n_frames: int) -> float:
+    render()
+    start = time.perf_counter()
+    for _ in range(n_frames):
+        render()
+    return n_frames / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option("--n-frames", default=100, help="Frames per configuration")
+@click.option("--resolutions", default="960x720,480x360,240x180", help="WxH list")
+def launch(n_frames, resolutions):
+    logging.basicConfig(level=logging.INFO)
+    for resolution in resolutions.split(","):
+        width, height = map(int, resolution.split("x"))
+        for backend in constants.RendererBackend:
+            env = NeuroRoboticsEnv(
+                rendering={"width": width, "height": height, "renderer": backend.value}
+            )
+            fps = measure_fps(lambda: env.render(mode="rgb_array"), n_frames)
+            logging.info(f"{resolution:>9} {backend.value:>7} fps={fps:>8.1f}")
+            if backend == constants.RendererBackend.OPENGL:
+                fps = measure_fps(lambda: legacy_render(env, width, height), n_frames)
+                logging.info(f"{resolution:>9} {'legacy':>7} fps={fps:>8.1f}")
+            env.close()
+
+
+if __name__ == "__main__":
+    launch()
@@ -0,0 +1,93 @@
+import logging
+import time
+
+import click
+import numpy as np
+
+from neuro_robotics.algorithm.buffers import GoalEpisodeReplayBuffer
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.utils.common import constants
+
+
+def single_env(observation):
+    return {key: value[np.newaxis] for key, value in observation.items()}
+
+
+def fill_buffer(env, buffer, n_steps: int):
+    """random rollouts, returns the stored (obs, next obs) pairs of the observation key"""
+    transitions = set()
+    obs = env.reset()
+    for step in range(n_steps):
+        action = env.action_space.sample()
+        next_obs, reward, done, info = env.step(action)
+        if step % 50 == 49:
+            info["TimeLimit.truncated"] = not done
+            done = True
+        buffer.add(
+            single_env(obs),
+            single_env(next_obs),
+            action[np.newaxis],
+            np.array([reward]),
+            np.array([done]),
+            [info],
+        )
+        transitions.add(
+            (obs["observation"].tobytes(), next_obs["observation"].tobytes())
+        )
+        obs = env.reset() if done else next_obs
+    return transitions
+
+
+@click.command()
+@click.option("--n-steps", default=5000, help="Environment steps stored")
+@click.option("--batch-size", default=256, help="Sampled transitions per call")
+@click.option("--n-batches", default=200, help="Timed sample calls")
+def launch(n_steps, batch_size, n_batches):
+    logging.basicConfig(level=logging.INFO)
+    env = NeuroRoboticsEnv(headless=True)
+    stock = GoalEpisodeReplayBuffer.stock_bytes_per_transition(
+        env.observation_space, env.action_space
+    )
+    logging.info(f"{'stock her':>24} bytes/transition={stock:8.1f}")
+    goal_dim = env.observation_space["achieved_goal"].shape[0]
+    for storage_dtype in constants.ReplayStorageDtype:
+        for achieved_goal_offset in (None, -goal_dim):
+            buffer = GoalEpisodeReplayBuffer(
+                n_steps * 2,
+                env.observation_space,
+                env.action_space,
+                device="cpu",
+                compute_reward=env.compute_reward,
+                achieved_goal_offset=achieved_goal_offset,
+                storage_dtype=storage_dtype.value,
+            )
+            transitions = fill_buffer(env, buffer, n_steps)
+            start = time.perf_counter()
+            for _ in range(n_batches):
+                samples = buffer.sample(batch_size)
+            elapsed = time.perf_counter() - start
+
+            # the next observation must be the one stored with the step, float16 rounds
+            unmatched = "-"
+            if storage_dtype == constants.ReplayStorageDtype.FLOAT32:
+                pairs = zip(
+                    samples.observations["observation"].numpy(),
+                    samples.next_observations["observation"].numpy(),
+                )
+                unmatched = sum(
+                    (obs.tobytes(), next_obs.tobytes()) not in transitions
+                    for obs, next_obs in pairs
+                )
+            name = f"{storage_dtype.value}/dedup={achieved_goal_offset is not None}"
+            bytes_per_transition = buffer.bytes_per_transition()
+            logging.info(
+                f"{name:>24} bytes/transition={bytes_per_transition:8.1f} "
+                f"saving={stock / bytes_per_transition:.2f}x "
+                f"sample={elapsed / n_batches * 1e3:.3f}ms "
+                f"unmatched pairs={unmatched}"
+            )
+    env.close()
+
+
+if __name__ == "__main__":
+    launch()
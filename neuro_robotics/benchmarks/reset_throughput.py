@@ -0,0 +1,39 @@
+import logging
+import time
+
+import click
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.utils.common import constants
+
+
+def measure_resets_per_second(reset_mode: str, n_resets: int) -> float:
+    env = NeuroRoboticsEnv(reset_mode=reset_mode, copy_observations=False)
+    try:
+        start = time.perf_counter()
+        for _ in range(n_resets):
+            env.reset()
+        elapsed = time.perf_counter() - start
+    finally:
+        env.close()
+    return n_resets / elapsed
+
+
+@click.command()
+@click.option("--n-resets", default=5000, help="Resets per reset mode")
+def launch(n_resets):
+    logging.basicConfig(level=logging.INFO)
+    results = {
+        mode.value: measure_resets_per_second(mode.value, n_resets)
+        for mode in constants.ResetMode
+    }
+    full = results[constants.ResetMode.FULL.value]
+    for mode, resets_per_second in results.items():
+        logging.info(
+            f"{mode:>8} resets/sec={resets_per_second:>10.1f} "
+            f"speedup={resets_per_second / full:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    launch()
@@ -0,0 +1,54 @@
+import logging
+import timeit
+
+import click
+import numpy as np
+
+from neuro_robotics.environment.reward import SparseRewardKernel
+from neuro_robotics.utils.common import methods
+
+DISTANCE_THRESHOLD = 0.05
+
+
+def legacy_compute_reward(achieved_goal, desired_goal, info=None):
+    """reward path used before the kernel: norm of an ``a - b`` temporary"""
+    computed_distance = methods.distance(achieved_goal, desired_goal)
+    return -np.array(computed_distance > DISTANCE_THRESHOLD, dtype=np.float32)
+
+
+@click.command()
+@click.option("--batch-size", default=256_000, help="Relabeled goals per call")
+@click.option("--repeat", default=50, help="Timed calls per implementation")
+def launch(batch_size, repeat):
+    logging.basicConfig(level=logging.INFO)
+    rng = np.random.default_rng(0)
+    achieved_goal = rng.uniform(0.0, 0.3, size=(batch_size, 3)).astype(np.float32)
+    desired_goal = rng.uniform(0.0, 0.3, size=(batch_size, 3)).astype(np.float32)
+    kernel = SparseRewardKernel(DISTANCE_THRESHOLD)
+
+    reference = legacy_compute_reward(achieved_goal, desired_goal)
+    candidate = kernel.compute_reward(achieved_goal, desired_goal, None)
+    mismatches = np.count_nonzero(reference != candidate)
+
+    legacy_time = min(
+        timeit.repeat(
+            lambda: legacy_compute_reward(achieved_goal, desired_goal),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    kernel_time = min(
+        timeit.repeat(
+            lambda: kernel.compute_reward(achieved_goal, desired_goal, None),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    logging.info(f"batch={batch_size} mismatches={mismatches}")
+    logging.info(f"legacy  {legacy_time * 1e3:8.3f} ms/call")
+    logging.info(f"kernel  {kernel_time * 1e3:8.3f} ms/call")
+    logging.info(f"speedup {legacy_time / kernel_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    launch()
@@ -0,0 +1,52 @@
+import logging
+import shutil
+import time
+
+import click
+
+from neuro_robotics.environment import BatchedNeuroRoboticsEnv
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.utils.common import constants
+
+
+def measure_construction_time(env_factory, n_repeats: int) -> float:
+    """mean seconds from constructor call to a closed env"""
+    elapsed = 0.0
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        env = env_factory()
+        elapsed += time.perf_counter() - start
+        env.close()
+    return elapsed / n_repeats
+
+
+@click.command()
+@click.option("--n-repeats", default=20, help="Constructions per variant")
+@click.option("--num-envs", default=16, help="Realms of the batched env")
+@click.option("--clear-cache", is_flag=True, help="Start from an empty asset cache")
+def launch(n_repeats, num_envs, clear_cache):
+    logging.basicConfig(level=logging.INFO)
+    if clear_cache:
+        shutil.rmtree(constants.ASSET_CACHE_DIR, ignore_errors=True)
+
+    variants = {
+        "single/visual": lambda: NeuroRoboticsEnv(headless=False),
+        "single/headless": lambda: NeuroRoboticsEnv(headless=True),
+        f"batched{num_envs}/visual": lambda: BatchedNeuroRoboticsEnv(
+            num_envs, headless=False
+        ),
+        f"batched{num_envs}/headless": lambda: BatchedNeuroRoboticsEnv(
+            num_envs, headless=True
+        ),
+    }
+    for name, env_factory in variants.items():
+        # the first construction pays for building the cache entries
+        first = measure_construction_time(env_factory, 1)
+        mean = measure_construction_time(env_factory, n_repeats)
+        logging.info(
+            f"{name:>20} first={first * 1e3:>8.1f}ms mean={mean * 1e3:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    launch()
@@ -0,0 +1,223 @@
+import ctypes
+import logging
+import time
+
+import click
+import numpy as np
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.utils.common import constants
+
+try:
+    from numpy._core import _multiarray_umath
+except ImportError:  # numpy < 2
+    from numpy.core import _multiarray_umath
+
+# PyDataMem_SetHandler and PyDataMem_GetHandler in the numpy C API table (>= 1.22),
+# the slots are fixed within the numpy 1.x and 2.x ABIs
+SET_HANDLER_SLOT = 304
+GET_HANDLER_SLOT = 305
+KNOWN_ABI_VERSIONS = (0x01000009, 0x02000000)
+HANDLER_CAPSULE_NAME = b"mem_handler"
+HANDLER_NAME = b"allocation_counter"
+
+_MALLOC = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t)
+_CALLOC = ctypes.CFUNCTYPE(
+    ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t
+)
+_REALLOC = ctypes.CFUNCTYPE(
+    ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t
+)
+_FREE = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t)
+
+
+class _DataMemAllocator(ctypes.Structure):
+    _fields_ = [
+        ("ctx", ctypes.c_void_p),
+        ("malloc", _MALLOC),
+        ("calloc", _CALLOC),
+        ("realloc", _REALLOC),
+        ("free", _FREE),
+    ]
+
+
+class _DataMemHandler(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_char * 127),
+        ("version", ctypes.c_uint8),
+        ("allocator", _DataMemAllocator),
+    ]
+
+
+class NumpyAllocationCounter:
+    """Count the numpy data buffers allocated inside a ``with`` block.
+
+    tracemalloc only reports the blocks still alive when a snapshot is taken,
+    temporaries freed inside the block never show up. This installs a numpy
+    memory handler forwarding to the default one and counting every malloc,
+    calloc and realloc, freed temporaries included. Numpy scalars and views
+    allocate no data buffer and are not counted. The handler is reached through
+    the numpy C API table, so it is only installed on ABIs whose table layout is
+    known, see ``supported``.
+    """
+
+    _handler = None
+    # counter of the open block, arrays from a closed block free through the handler
+    _active = None
+
+    def __init__(self):
+        self.count = 0
+        self._previous_handler = None
+
+    @staticmethod
+    def supported() -> bool:
+        """the running numpy exposes memory handlers at the known table slots"""
+        abi_version = _multiarray_umath._get_ndarray_c_version()
+        handler_api = hasattr(_multiarray_umath, "get_handler_name")
+        return abi_version in KNOWN_ABI_VERSIONS and handler_api
+
+    @classmethod
+    def _counting_handler(cls):
+        """built once, arrays allocated through it keep freeing through it"""
+        if not cls.supported():
+            raise SystemError(
+                f"Cannot count numpy allocations with numpy {np.__version__}"
+            )
+        if cls._handler is None:
+            api = ctypes.pythonapi
+            api.PyCapsule_GetPointer.restype = ctypes.c_void_p
+            api.PyCapsule_GetPointer.argtypes = [ctypes.py_object, ctypes.c_char_p]
+            api.PyCapsule_New.restype = ctypes.py_object
+            api.PyCapsule_New.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_char_p,
+                ctypes.c_void_p,
+            ]
+            table = ctypes.cast(
+                api.PyCapsule_GetPointer(_multiarray_umath._ARRAY_API, None),
+                ctypes.POINTER(ctypes.c_void_p),
+            )
+            set_handler = ctypes.PYFUNCTYPE(ctypes.py_object, ctypes.py_object)(
+                table[SET_HANDLER_SLOT]
+            )
+            get_handler = ctypes.PYFUNCTYPE(ctypes.py_object)(table[GET_HANDLER_SLOT])
+            default = _DataMemHandler.from_address(
+                api.PyCapsule_GetPointer(get_handler(), HANDLER_CAPSULE_NAME)
+            ).allocator
+
+            def malloc(ctx, size):
+                cls._count()
+                return default.malloc(ctx, size)
+
+            def calloc(ctx, nelem, elsize):
+                cls._count()
+                return default.calloc(ctx, nelem, elsize)
+
+            def realloc(ctx, ptr, new_size):
+                cls._count()
+                return default.realloc(ctx, ptr, new_size)
+
+            handler = _DataMemHandler(
+                HANDLER_NAME,
+                1,
+                _DataMemAllocator(
+                    default.ctx,
+                    _MALLOC(malloc),
+                    _CALLOC(calloc),
+                    _REALLOC(realloc),
+                    default.free,
+                ),
+            )
+            capsule_name = ctypes.c_char_p(HANDLER_CAPSULE_NAME)
+            capsule = api.PyCapsule_New(ctypes.addressof(handler), capsule_name, None)
+            # the struct, its callbacks and the capsule name must outlive the arrays
+            cls._handler = (set_handler, capsule, handler, capsule_name)
+        return cls._handler
+
+    @classmethod
+    def _count(cls) -> None:
+        if cls._active is not None:
+            cls._active.count += 1
+
+    def __enter__(self) -> "NumpyAllocationCounter":
+        set_handler, capsule = self._counting_handler()[:2]
+        NumpyAllocationCounter._active = self
+        self._previous_handler = set_handler(capsule)
+        if _multiarray_umath.get_handler_name() != HANDLER_NAME.decode():
+            self.__exit__()
+            raise SystemError("The numpy memory handler could not be installed")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        set_handler = self._counting_handler()[0]
+        set_handler(self._previous_handler)
+        NumpyAllocationCounter._active = None
+
+
+def measure(env: NeuroRoboticsEnv, actions: np.ndarray, n_warmup: int) -> dict:
+    """Count the numpy buffers allocated by the steps of an env in steady state.
+    Args:
+        env (NeuroRoboticsEnv): Env stepped with ``actions``.
+        actions (np.ndarray): One action per step, warmup steps included.
+        n_warmup (int): Uncounted steps filling lazily allocated buffers.
+    Returns:
+        dict: Allocations per step, counted resets excluded, and the step throughput.
+    """
+    max_episode_steps = constants.VectorizedEnvironment.MAX_EPISODE_STEPS.value
+    env.reset()
+    for action in actions[:n_warmup]:
+        env.step(action)
+    env.reset()
+
+    n_steps = len(actions) - n_warmup
+    allocations = 0
+    elapsed = 0.0
+    for step, action in enumerate(actions[n_warmup:]):
+        start = time.perf_counter()
+        with NumpyAllocationCounter() as counter:
+            # the observation stays referenced like a learner holding on to it
+            observation, _, done, _ = env.step(action)
+        elapsed += time.perf_counter() - start
+        allocations += counter.count
+        if done or step % max_episode_steps == max_episode_steps - 1:
+            env.reset()
+    return dict(
+        allocations_per_step=allocations / n_steps,
+        counted_steps_per_sec=n_steps / elapsed,
+    )
+
+
+@click.command()
+@click.option("--n-steps", default=500, help="Counted environment steps")
+@click.option("--n-warmup", default=100, help="Uncounted steps before measuring")
+@click.option("--seed", default=0, help="Seed of the env and the actions")
+def launch(n_steps, n_warmup, seed):
+    """numpy allocations per step, realm buffer views against owned copies"""
+    logging.basicConfig(level=logging.INFO)
+    rng = np.random.default_rng(seed)
+    actions = rng.uniform(-1.0, 1.0, size=(n_warmup + n_steps, 4)).astype(np.float32)
+    if not NumpyAllocationCounter.supported():
+        logging.error(f"cannot count numpy allocations with numpy {np.__version__}")
+        raise SystemExit(1)
+    results = {}
+    for copy_observations in (False, True):
+        env = NeuroRoboticsEnv(
+            reset_mode=constants.ResetMode.SNAPSHOT.value,
+            headless=True,
+            seed=seed,
+            copy_observations=copy_observations,
+        )
+        results[copy_observations] = measure(env, actions, n_warmup)
+        env.close()
+        logging.info(
+            f"{'copies' if copy_observations else 'views':>6} "
+            f"allocations/step={results[copy_observations]['allocations_per_step']:.2f} "
+            f"counted steps/s={results[copy_observations]['counted_steps_per_sec']:.0f}"
+        )
+    if results[False]["allocations_per_step"]:
+        logging.error("the step path allocates numpy buffers")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    launch()
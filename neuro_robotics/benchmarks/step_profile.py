@@ -0,0 +1,38 @@
+import logging
+
+import click
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.utils.common import constants
+
+
+@click.command()
+@click.option("--n-steps", default=5000, help="Random environment steps")
+@click.option(
+    "--reset-mode",
+    default=constants.ResetMode.SNAPSHOT.value,
+    type=click.Choice([mode.value for mode in constants.ResetMode]),
+)
+def launch(n_steps, reset_mode):
+    logging.basicConfig(level=logging.INFO)
+    env = NeuroRoboticsEnv(
+        reset_mode=reset_mode, headless=True, profile=True, copy_observations=False
+    )
+    env.reset()
+    for step in range(n_steps):
+        _, _, done, _ = env.step(env.action_space.sample())
+        if done or step % 50 == 49:
+            env.reset()
+    for phase, statistics in env.get_profile().items():
+        logging.info(
+            f"{phase:>12} n={statistics['count']:>6} "
+            f"mean={statistics['mean_us']:9.1f}us "
+            f"p50={statistics['p50_us']:9.1f}us "
+            f"p99={statistics['p99_us']:9.1f}us "
+            f"max={statistics['max_us']:9.1f}us"
+        )
+    env.close()
+
+
+if __name__ == "__main__":
+    launch()
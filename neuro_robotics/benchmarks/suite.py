@@ -0,0 +1,312 @@
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+from typing import List
+
+import click
+import numpy as np
+import pybullet
+
+from neuro_robotics.environment.model import realm_registry
+from neuro_robotics.environment.vectorized.vec_env_factory import PARALLEL_BACKENDS
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common import methods
+
+SUITE_VERSION = 1
+ENV_IDENTIFIER = "NeuroRobotics-v1"
+# metric -> True when larger is better, used to flag regressions
+METRICS = {
+    "construction_ms": False,
+    "resets_per_sec": True,
+    "steps_per_sec": True,
+    "reward_goals_per_sec": True,
+    "render_fps": True,
+    "peak_rss_mb": False,
+}
+
+
+def peak_rss_mb() -> float:
+    """peak resident set of this process and its reaped children"""
+    # linux reports kilobytes, macos bytes
+    scale = 1 if sys.platform == "darwin" else 1024
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return peak * scale / 2**20
+
+
+def random_actions(seed: int, n_steps: int, num_envs: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-1.0, 1.0, size=(n_steps, num_envs, 4)).astype(np.float32)
+
+
+def single_env_case(realm: str, settings: dict) -> Dict[str, float]:
+    """construction, reset, step, reward and render throughput of one env"""
+    from neuro_robotics.environment import NeuroRoboticsEnv
+
+    env_kwargs = dict(
+        realm=realm,
+        reset_mode=constants.ResetMode.SNAPSHOT.value,
+        headless=True,
+        seed=settings["seed"],
+        copy_observations=False,
+    )
+    start = time.perf_counter()
+    env = NeuroRoboticsEnv(**env_kwargs)
+    metrics = {"construction_ms": (time.perf_counter() - start) * 1e3}
+
+    start = time.perf_counter()
+    for _ in range(settings["n_resets"]):
+        env.reset()
+    metrics["resets_per_sec"] = settings["n_resets"] / (time.perf_counter() - start)
+
+    env.reset()
+    start = time.perf_counter()
+    for step, action in enumerate(
+        random_actions(settings["seed"], settings["n_steps"])
+    ):
+        _, _, done, _ = env.step(action[0])
+        max_episode_steps = constants.VectorizedEnvironment.MAX_EPISODE_STEPS.value
+        if done or step % max_episode_steps == max_episode_steps - 1:
+            env.reset()
+    metrics["steps_per_sec"] = settings["n_steps"] / (time.perf_counter() - start)
+
+    rng = np.random.default_rng(settings["seed"])
+    batch_size = settings["reward_batch_size"]
+    achieved_goal = rng.uniform(0.0, 0.3, (batch_size, 3)).astype(np.float32)
+    desired_goal = rng.uniform(0.0, 0.3, (batch_size, 3)).astype(np.float32)
+    env.compute_reward(achieved_goal, desired_goal, None)
+    start = time.perf_counter()
+    for _ in range(settings["reward_repeat"]):
+        env.compute_reward(achieved_goal, desired_goal, None)
+    metrics["reward_goals_per_sec"] = (
+        batch_size * settings["reward_repeat"] / (time.perf_counter() - start)
+    )
+    env.close()
+
+    width, height = settings["render_resolution"]
+    env = NeuroRoboticsEnv(
+        **{**env_kwargs, "headless": False},
+        rendering={"width": width, "height": height},
+    )
+    env.render(mode="rgb_array")
+    start = time.perf_counter()
+    for _ in range(settings["n_frames"]):
+        env.render(mode="rgb_array")
+    metrics["render_fps"] = settings["n_frames"] / (time.perf_counter() - start)
+    env.close()
+    return metrics
+
+
+def vec_env_case(realm: str, backend: str, settings: dict) -> Dict[str, float]:
+    """construction and summed step throughput of ``num_envs`` workers"""
+    import neuro_robotics  # noqa: F401 registers the env id in a spawned process
+    from neuro_robotics.environment.vectorized import make_vec_env
+
+    num_envs = settings["num_envs"]
+    # realms of the batched env share a client, a snapshot would reset all of them
+    reset_mode = (
+        constants.ResetMode.FULL
+        if backend == "batched"
+        else constants.ResetMode.SNAPSHOT
+    )
+    start = time.perf_counter()
+    env = make_vec_env(
+        ENV_IDENTIFIER,
+        num_envs=num_envs,
+        backend=backend,
+        env_kwargs=dict(
+            realm=realm,
+            reset_mode=reset_mode.value,
+            headless=True,
+        ),
+        seed=settings["seed"],
+    )
+    metrics = {"construction_ms": (time.perf_counter() - start) * 1e3}
+    try:
+        env.reset()
+        actions = random_actions(settings["seed"], settings["n_steps"], num_envs)
+        start = time.perf_counter()
+        for action in actions:
+            env.step(action)
+        elapsed = time.perf_counter() - start
+        metrics["steps_per_sec"] = num_envs * settings["n_steps"] / elapsed
+    finally:
+        env.close()
+    return metrics
+
+
+def _run_case(case, args) -> Dict[str, float]:
+    metrics = case(*args)
+    metrics["peak_rss_mb"] = peak_rss_mb()
+    return metrics
+
+
+def run_isolated(case, *args) -> Dict[str, float]:
+    """run a case in a fresh spawned process, peak rss is then its own"""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(_run_case, (case, args))
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=constants.CORE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(realms: List[str], backends: List[str], settings: dict) -> dict:
+    results = []
+    for realm in realms:
+        # an alias runs the robot of another realm, its numbers are not its own
+        alias_of = realm_registry.depiction(realm).alias_of
+        if alias_of is not None:
+            logging.warning(f"{realm} is an alias of {alias_of}, same robot measured")
+        cases = [("single", None, single_env_case, (realm, settings))]
+        cases += [
+            (f"vec/{backend}", backend, vec_env_case, (realm, backend, settings))
+            for backend in backends
+        ]
+        for name, backend, case, args in cases:
+            metrics = run_isolated(case, *args)
+            logging.info(
+                f"{realm:>7} {name:>18} "
+                + " ".join(f"{key}={value:.1f}" for key, value in metrics.items())
+            )
+            results.append(
+                dict(
+                    realm=realm,
+                    alias_of=alias_of,
+                    configuration=name,
+                    backend=backend,
+                    num_envs=1 if backend is None else settings["num_envs"],
+                    metrics=metrics,
+                )
+            )
+    return dict(
+        version=SUITE_VERSION,
+        created=datetime.now().isoformat(timespec="seconds"),
+        revision=git_revision(),
+        machine=dict(
+            platform=platform.platform(),
+            processor=platform.processor(),
+            cpu_count=multiprocessing.cpu_count(),
+            python=platform.python_version(),
+            numpy=np.__version__,
+            pybullet=pybullet.getAPIVersion(),
+        ),
+        settings=settings,
+        results=results,
+    )
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Compare two reports case by case.
+    Args:
+        report (dict): The report of this run.
+        baseline (dict): A report written by an earlier run.
+        tolerance (float): Relative slowdown accepted before a metric regresses.
+    Returns:
+        List[str]: One line per regressed metric.
+    """
+    baseline_metrics = {
+        (result["realm"], result["configuration"]): result["metrics"]
+        for result in baseline["results"]
+    }
+    regressions = []
+    for result in report["results"]:
+        key = (result["realm"], result["configuration"])
+        if key not in baseline_metrics:
+            continue
+        for metric, value in result["metrics"].items():
+            reference = baseline_metrics[key].get(metric)
+            if not reference:
+                continue
+            ratio = value / reference
+            higher_is_better = METRICS[metric]
+            regressed = (
+                ratio < 1.0 - tolerance if higher_is_better else ratio > 1.0 + tolerance
+            )
+            line = f"{key[0]} {key[1]} {metric}: {reference:.1f} -> {value:.1f} ({ratio:.2f}x)"
+            if regressed:
+                regressions.append(line)
+            logging.info(("REGRESSION " if regressed else "") + line)
+    return regressions
+
+
+@click.command()
+@click.option("--output", default="benchmark.json", help="JSON report written here")
+@click.option("--baseline", default=None, help="Earlier report to compare with")
+@click.option("--tolerance", default=0.1, help="Accepted relative slowdown")
+@click.option(
+    "--realms",
+    default=",".join(methods.available_realms()),
+    help="Comma separated realms",
+)
+@click.option(
+    "--backends",
+    default="dummy,shared_memory,batched",
+    help=f"Comma separated vectorized backends out of {PARALLEL_BACKENDS}",
+)
+@click.option("--num-envs", default=4, help="Workers of the vectorized cases")
+@click.option("--n-steps", default=2000, help="Steps per throughput measurement")
+@click.option("--n-resets", default=500, help="Resets per measurement")
+@click.option("--n-frames", default=50, help="Rendered frames")
+@click.option("--render-resolution", default="240x180", help="WxH of rendered frames")
+@click.option("--reward-batch-size", default=256_000, help="Goals per reward call")
+@click.option("--reward-repeat", default=20, help="Timed reward calls")
+@click.option("--seed", default=0, help="Seed of envs, actions and goals")
+def launch(
+    output,
+    baseline,
+    tolerance,
+    realms,
+    backends,
+    num_envs,
+    n_steps,
+    n_resets,
+    n_frames,
+    render_resolution,
+    reward_batch_size,
+    reward_repeat,
+    seed,
+):
+    logging.basicConfig(level=logging.INFO)
+    backends = [backend for backend in backends.split(",") if backend]
+    unknown = set(backends) - set(PARALLEL_BACKENDS)
+    if unknown:
+        raise click.BadParameter(f"Unknown backends: {sorted(unknown)}")
+    settings = dict(
+        num_envs=num_envs,
+        n_steps=n_steps,
+        n_resets=n_resets,
+        n_frames=n_frames,
+        render_resolution=[int(size) for size in render_resolution.split("x")],
+        reward_batch_size=reward_batch_size,
+        reward_repeat=reward_repeat,
+        seed=seed,
+    )
+    report = run_suite(realms.split(","), backends, settings)
+    Path(output).write_text(json.dumps(report, indent=2))
+    logging.info(f"benchmark report: {output}")
+
+    if baseline is not None:
+        regressions = compare(report, json.loads(Path(baseline).read_text()), tolerance)
+        if regressions:
+            raise SystemExit(1)
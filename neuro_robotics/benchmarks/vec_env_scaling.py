@@ -0,0 +1,56 @@
+import logging
+import time
+
+import click
+import numpy as np
+
+import neuro_robotics  # noqa: F401 registers the env id
+from neuro_robotics.environment.vectorized import make_vec_env
+from neuro_robotics.environment.vectorized.vec_env_factory import PARALLEL_BACKENDS
+
+NUM_ENVS_SWEEP = (1, 2, 4, 8, 16, 32)
+
+
+def measure_steps_per_second(env_identifier, num_envs, backend, n_steps):
+    """Time ``n_steps`` vectorized random-action steps.
+    Returns:
+        float: Environment steps per second summed over all workers.
+    """
+    env = make_vec_env(env_identifier, num_envs=num_envs, backend=backend)
+    try:
+        env.reset()
+        actions = np.random.uniform(-1.0, 1.0, size=(n_steps, num_envs, 4))
+        start = time.perf_counter()
+        for action in actions:
+            env.step(action)
+        elapsed = time.perf_counter() - start
+    finally:
+        env.close()
+    return num_envs * n_steps / elapsed
+
+
+@click.command()
+@click.option("--env", "env_identifier", default="NeuroRobotics-v1")
+@click.option(
+    "--backend", type=click.Choice(PARALLEL_BACKENDS), default="shared_memory"
+)
+@click.option("--max-envs", default=32, help="Largest number of parallel envs")
+@click.option("--n-steps", default=1000, help="Vectorized steps per measurement")
+def launch(env_identifier, backend, max_envs, n_steps):
+    logging.basicConfig(level=logging.INFO)
+    baseline = None
+    for num_envs in NUM_ENVS_SWEEP:
+        if num_envs > max_envs:
+            break
+        steps_per_second = measure_steps_per_second(
+            env_identifier, num_envs, backend, n_steps
+        )
+        baseline = baseline or steps_per_second
+        logging.info(
+            f"{backend} num_envs={num_envs:>2} steps/sec={steps_per_second:>10.1f} "
+            f"scaling={steps_per_second / baseline:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    launch()
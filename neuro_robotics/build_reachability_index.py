@@ -0,0 +1,73 @@
+import logging
+
+import click
+import numpy as np
+
+from neuro_robotics.environment.kinematics import KinematicChain
+from neuro_robotics.environment.kinematics import ReachabilityIndex
+from neuro_robotics.environment.model.configuration import realm_registry
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common import methods
+
+
+def load_chain(robot_metadata):
+    chain = KinematicChain.from_urdf(
+        robot_metadata.description_file_location, robot_metadata.effector_link_id
+    )
+    return chain, np.array(robot_metadata.init_position)
+
+
+def unreachable_share(index, goal_metadata, robot_position, n_samples, rng):
+    """share of goals and targets the uniform box sampling puts out of reach"""
+    lift = np.array([0.0, 0.0, goal_metadata.object_size / 2])
+    goal_low = np.array(goal_metadata.range_low)
+    goal_high = np.array(goal_metadata.range_high)
+    goals = rng.uniform(goal_low, goal_high, (n_samples, 3))
+    goals[rng.random(n_samples) < goal_metadata.floor_probability, 2] = 0.0
+    targets = rng.uniform(goal_low, goal_high, (n_samples, 3))
+    targets[:, 2] = goal_low[2]
+    goal_reached = index.contains(goals + lift - robot_position)
+    target_reached = index.contains(targets + lift - robot_position)
+    return 1.0 - goal_reached.mean(), 1.0 - (goal_reached & target_reached).mean()
+
+
+@click.command()
+@click.option(
+    "--realm",
+    default=constants.Realm.PANDA.value,
+    type=click.Choice(methods.available_realms()),
+)
+@click.option("--n-samples", default=1_000_000, help="Joint configurations swept")
+@click.option("--voxel-size", default=0.025, help="Voxel edge [m]")
+@click.option("--orientation-tolerance", default=30.0, help="Tool tilt [deg]")
+@click.option("--seed", default=0, help="Sampling seed")
+def launch(realm, n_samples, voxel_size, orientation_tolerance, seed):
+    logging.basicConfig(level=logging.INFO)
+    depiction = realm_registry.depiction(realm)
+    chain, robot_position = load_chain(depiction.robot)
+    index = ReachabilityIndex.build(
+        chain,
+        n_samples=n_samples,
+        voxel_size=voxel_size,
+        orientation_tolerance=np.deg2rad(orientation_tolerance),
+        seed=seed,
+    )
+    index.save(depiction.reachability_index_path)
+    logging.info(f"saved reachability index: {depiction.reachability_index_path}")
+
+    goal_share, episode_share = unreachable_share(
+        index, depiction.goal, robot_position, 1_000_000, np.random.default_rng(seed)
+    )
+    episodes_per_million_steps = (
+        1_000_000 / constants.VectorizedEnvironment.MAX_EPISODE_STEPS.value
+    )
+    logging.info(
+        f"uniform sampling: {goal_share:.2%} unreachable goals, "
+        f"{episode_share:.2%} episodes with an unreachable goal or target, "
+        f"{episode_share * episodes_per_million_steps:.0f} episodes saved "
+        f"per million steps"
+    )
+
+
+if __name__ == "__main__":
+    launch()
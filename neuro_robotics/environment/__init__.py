@@ -1 +1,12 @@
 from .neuro_robotics import NeuroRoboticsEnv
+
+# the vector envs pull in stable_baselines3 (and torch), resolve them on first access
+_LAZY_VECTORIZED = ("BatchedNeuroRoboticsEnv", "SharedMemoryVecEnv")
+
+
+def __getattr__(name):
+    if name in _LAZY_VECTORIZED:
+        from . import vectorized
+
+        return getattr(vectorized, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
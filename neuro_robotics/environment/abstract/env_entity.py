@@ -1,10 +1,5 @@
 import abc
 
-import numpy as np
-import pybullet as p
-
-from neuro_robotics.utils.common import constants
-
 
 class EnvEntity(abc.ABC):
     """force subclass to implement abstract method"""
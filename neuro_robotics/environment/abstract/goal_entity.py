@@ -1,9 +1,6 @@
 import abc
 
 import numpy as np
-import pybullet as p
-
-from neuro_robotics.utils.common import constants
 
 
 class GoalEntity(abc.ABC):
@@ -12,6 +9,11 @@ class GoalEntity(abc.ABC):
     def __init__(self, client, model):
         self.sim_client = client
         self.model = model
+        self.np_random = np.random.default_rng()
+
+    def set_generator(self, np_random: np.random.Generator) -> None:
+        """goal and target sampling draw from the generator of the owning env"""
+        self.np_random = np_random
 
     @abc.abstractmethod
     def _load_model(self):
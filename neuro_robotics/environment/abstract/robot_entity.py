@@ -1,14 +1,48 @@
 import abc
+from typing import Dict
+from typing import Sequence
 
 import numpy as np
+from attrs import define
+
+
+@define
+class RobotStateSnapshot:
+    """joint and link state read in bulk once per simulation step"""
+
+    joint_positions: Dict[int, float]
+    joint_velocities: Dict[int, float]
+    link_positions: Dict[int, tuple]
+    link_velocities: Dict[int, tuple]
 
 
 class RobotEntity(abc.ABC):
     """force subclass to implement abstract method"""
 
-    def __init__(self, client, model):
+    # end-effector pointing down, as quaternion (x, y, z, w)
+    effector_orientation = np.array([1.0, 0.0, 0.0, 0.0])
+
+    def __init__(
+        self,
+        client,
+        model,
+        snapshot_joints: Sequence[int] = (),
+        snapshot_links: Sequence[int] = (),
+    ):
         self.sim_client = client
         self.model = model
+        self._snapshot_joints = list(snapshot_joints)
+        self._snapshot_links = list(snapshot_links)
+        self._state_snapshot = None
+        self.inverse_kinematics_solver = None
+        self.inverse_kinematics_base = np.zeros(3)
+        self.inverse_kinematics_residual = None
+        # reused by every act, float64 like the positions bullet reports
+        self._effector_target = np.zeros(3)
+        self._effector_step = np.zeros(3)
+        # a python float operand would be boxed into a fresh 0-d array every act
+        self._effector_limit = np.zeros((), dtype=np.float32)
+        self._joint_state = None
 
     @abc.abstractmethod
     def _load_model(self):
@@ -33,28 +67,80 @@ class RobotEntity(abc.ABC):
         self.sim_client.resetBasePositionAndOrientation(
             bodyUniqueId=self.model, posObj=position, ornObj=orientation
         )
+        self.invalidate_state_snapshot()
+
+    def invalidate_state_snapshot(self) -> None:
+        """Drop the cached state, must be called whenever the simulation moves."""
+        self._state_snapshot = None
 
-    def _get_link_position(self, link: int) -> np.ndarray:
+    def _read_state_snapshot(self) -> RobotStateSnapshot:
+        """Read all snapshot joints and links with one bulk query each.
+        Returns:
+            RobotStateSnapshot: State shared by ``act`` and ``get_observation``
+            until the next ``invalidate_state_snapshot``.
+        """
+        if self._state_snapshot is None:
+            joint_states = self.sim_client.getJointStates(
+                self.model, self._snapshot_joints
+            )
+            link_states = self.sim_client.getLinkStates(
+                self.model, self._snapshot_links, computeLinkVelocity=True
+            )
+            self._state_snapshot = RobotStateSnapshot(
+                joint_positions={
+                    joint: state[0]
+                    for joint, state in zip(self._snapshot_joints, joint_states)
+                },
+                joint_velocities={
+                    joint: state[1]
+                    for joint, state in zip(self._snapshot_joints, joint_states)
+                },
+                link_positions={
+                    link: state[0]
+                    for link, state in zip(self._snapshot_links, link_states)
+                },
+                link_velocities={
+                    link: state[6]
+                    for link, state in zip(self._snapshot_links, link_states)
+                },
+            )
+        return self._state_snapshot
+
+    def _get_link_position(self, link: int, out=None) -> np.ndarray:
         """Get the position of the link of the body.
         Args:
             link (int): Link index in the body.
+            out (np.ndarray): Optional array filled in place.
         Returns:
             np.ndarray: The position, as (x, y, z).
         """
-        position = self.sim_client.getLinkState(self.model, link)[0]
-        return np.array(position)
+        if link in self._snapshot_links:
+            position = self._read_state_snapshot().link_positions[link]
+        else:
+            position = self.sim_client.getLinkState(self.model, link)[0]
+        if out is None:
+            return np.array(position)
+        out[:] = position
+        return out
 
-    def _get_link_velocity(self, link: int) -> np.ndarray:
+    def _get_link_velocity(self, link: int, out=None) -> np.ndarray:
         """Get the velocity of the link of the body.
         Args:
             link (int): Link index in the body.
+            out (np.ndarray): Optional array filled in place.
         Returns:
             np.ndarray: The velocity, as (vx, vy, vz).
         """
-        velocity = self.sim_client.getLinkState(
-            self.model, link, computeLinkVelocity=True
-        )[6]
-        return np.array(velocity, dtype=np.float32)
+        if link in self._snapshot_links:
+            velocity = self._read_state_snapshot().link_velocities[link]
+        else:
+            velocity = self.sim_client.getLinkState(
+                self.model, link, computeLinkVelocity=True
+            )[6]
+        if out is None:
+            return np.array(velocity, dtype=np.float32)
+        out[:] = velocity
+        return out
 
     def _set_joint_angle(self, joint: int, angle: float) -> None:
         """Set the angle of the joint of the body.
@@ -65,6 +151,7 @@ class RobotEntity(abc.ABC):
         self.sim_client.resetJointState(
             bodyUniqueId=self.model, jointIndex=joint, targetValue=angle
         )
+        self.invalidate_state_snapshot()
 
     def _get_joint_angle(self, joint: int) -> float:
         """Get the angle of the joint of the body.
@@ -74,24 +161,61 @@ class RobotEntity(abc.ABC):
         Returns:
             float: The angle.
         """
+        if joint in self._snapshot_joints:
+            return self._read_state_snapshot().joint_positions[joint]
         return self.sim_client.getJointState(self.model, joint)[0]
 
     def _set_joint_angles(self, joints: np.ndarray, angles: np.ndarray) -> None:
-        """Set the angles of the joints of the body.
+        """Set the angles of the joints of the body with a single reset call.
         Args:
             joints (np.ndarray): List of joint indices, as a list of ints.
             angles (np.ndarray): List of target angles, as a list of floats.
         """
-        for joint, angle in zip(joints, angles):
-            self._set_joint_angle(joint=joint, angle=angle)
+        self.sim_client.resetJointStatesMultiDof(
+            bodyUniqueId=self.model,
+            jointIndices=list(joints),
+            targetValues=[[angle] for angle in angles],
+            targetVelocities=[[0.0] for _ in angles],
+        )
+        self.invalidate_state_snapshot()
 
-    def _get_ee_position(self, ee_link_id: int) -> np.ndarray:
+    def _get_ee_position(self, ee_link_id: int, out=None) -> np.ndarray:
         """Returns the position of the end-effector as (x, y, z)"""
-        return self._get_link_position(ee_link_id)
+        return self._get_link_position(ee_link_id, out=out)
 
-    def _get_ee_velocity(self, ee_link_id) -> np.ndarray:
+    def _get_ee_velocity(self, ee_link_id, out=None) -> np.ndarray:
         """Returns the velocity of the end-effector as (vx, vy, vz)"""
-        return self._get_link_velocity(ee_link_id)
+        return self._get_link_velocity(ee_link_id, out=out)
+
+    def _configure_inverse_kinematics(self, solver, base_position: np.ndarray) -> None:
+        """Replace the bullet solver with a kinematic chain solver.
+        Args:
+            solver (DampedLeastSquaresSolver): Solver of the chain ending at the effector link.
+            base_position (np.ndarray): World position of the chain root, the base is
+                expected to be loaded without rotation.
+        """
+        self.inverse_kinematics_solver = solver
+        self.inverse_kinematics_base = np.array(base_position, dtype=np.float64)
+
+    def inverse_kinematics_warm_start(self) -> np.ndarray:
+        """Current angles of the chain joints, the starting point of the solver"""
+        return np.array(
+            [
+                self._get_joint_angle(joint)
+                for joint in self.inverse_kinematics_solver.chain.joint_indices
+            ]
+        )
+
+    def accept_inverse_kinematics(self, solution, idx: int = 0) -> np.ndarray:
+        """Record the residual of one solved arm and return its joint angles.
+        Args:
+            solution (InverseKinematicsSolution): Single or batched solution.
+            idx (int): Row of this arm in the solution.
+        Returns:
+            np.ndarray: The joint angles of the chain.
+        """
+        self.inverse_kinematics_residual = float(solution.position_residual[idx])
+        return solution.joint_angles[idx].astype(np.float32)
 
     def _inverse_kinematics(
         self, link: int, position: np.ndarray, orientation: np.ndarray
@@ -104,13 +228,49 @@ class RobotEntity(abc.ABC):
         Returns:
             np.ndarray: The new joint state.
         """
+        if self.inverse_kinematics_solver is not None:
+            solution = self.inverse_kinematics_solver.solve(
+                target_position=position - self.inverse_kinematics_base,
+                target_orientation=orientation,
+                initial_joint_angles=self.inverse_kinematics_warm_start(),
+            )
+            return self.accept_inverse_kinematics(solution)
+
         joint_state = self.sim_client.calculateInverseKinematics(
             bodyIndex=self.model,
             endEffectorLinkIndex=link,
             targetPosition=position,
             targetOrientation=orientation,
         )
-        return np.array(joint_state, dtype=np.float32)
+        if self._joint_state is None:
+            self._joint_state = np.zeros(len(joint_state), dtype=np.float32)
+        self._joint_state[:] = joint_state
+        return self._joint_state
+
+    def _effector_target_position(
+        self, ee_displacement: np.ndarray, ee_limit: float, ee_link_id: int
+    ) -> np.ndarray:
+        """Compute the world target of the end-effector from its displacement.
+        Args:
+            ee_displacement (np.ndarray): End-effector displacement, as (dx, dy, dy).
+            ee_limit (float): Inverse kinematics limit.
+            ee_link_id (int): Index of End-effector link.
+        Returns:
+            np.ndarray: Target position, as (x, y, z), valid until the next call.
+        """
+        # limit maximum change in position, computed in the dtype of the action
+        if self._effector_limit.dtype != ee_displacement.dtype:
+            self._effector_limit = np.zeros((), dtype=ee_displacement.dtype)
+        self._effector_limit[()] = ee_limit
+        np.multiply(ee_displacement[:3], self._effector_limit, out=self._effector_step)
+        # get the current position and the target position
+        target_ee_position = self._get_ee_position(
+            ee_link_id, out=self._effector_target
+        )
+        target_ee_position += self._effector_step
+        # Clip the height target. For some reason, it has a great impact on learning
+        target_ee_position[2] = max(0.0, target_ee_position[2])
+        return target_ee_position
 
     def _effector_displacement_to_target_arm_angles(
         self, ee_displacement: np.ndarray, ee_limit: float, ee_link_id: int
@@ -123,18 +283,14 @@ class RobotEntity(abc.ABC):
         Returns:
             np.ndarray: Target arm angles, as the angles of the 7 arm joints.
         """
-        # limit maximum change in position
-        ee_displacement = ee_displacement[:3] * ee_limit
-        # get the current position and the target position
-        ee_position = self._get_ee_position(ee_link_id)
-        target_ee_position = ee_position + ee_displacement
-        # Clip the height target. For some reason, it has a great impact on learning
-        target_ee_position[2] = np.max((0, target_ee_position[2]))
+        target_ee_position = self._effector_target_position(
+            ee_displacement, ee_limit, ee_link_id
+        )
         # compute the new joint angles
         target_arm_angles = self._inverse_kinematics(
             link=ee_link_id,
             position=target_ee_position,
-            orientation=np.array([1.0, 0.0, 0.0, 0.0]),
+            orientation=self.effector_orientation,
         )
         target_arm_angles = target_arm_angles[:7]  # remove fingers angles
         return target_arm_angles
@@ -0,0 +1,2 @@
+from .asset_cache import AssetCache
+from .asset_cache import resolve_description_file
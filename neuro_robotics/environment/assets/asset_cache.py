@@ -0,0 +1,118 @@
+import hashlib
+import logging
+import os
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict
+from typing import Tuple
+
+from neuro_robotics.utils.common import constants
+
+PACKAGE_PREFIX = "package://"
+# bumped whenever compacted meshes change, older cache entries are never reused
+COMPACT_FORMAT_VERSION = 2
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()[:16]
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    """write next to the target and rename, concurrent workers never see partial files"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(content)
+    os.replace(tmp_path, path)
+
+
+class AssetCache:
+    """On-disk cache of preprocessed description files.
+
+    The headless variant of an URDF drops every ``<visual>`` element and points
+    the collision meshes at compacted copies holding only vertex, face, object
+    and group records, so bullet never parses the visual meshes in ``p.DIRECT``
+    training. Objects and groups are kept because bullet builds one convex hull
+    per obj shape, dropping them would merge a convex decomposition into a
+    single hull.
+    Cached files are keyed by the hash of their source, an edited URDF or mesh
+    produces a new entry instead of a stale one.
+    """
+
+    def __init__(self, cache_dir: Path = constants.ASSET_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self._resolved: Dict[Tuple[str, bool], str] = {}
+
+    def resolve(self, description_file: str, headless: bool) -> str:
+        """return the URDF bullet should load for the requested variant"""
+        key = (description_file, headless)
+        if key not in self._resolved:
+            if headless:
+                self._resolved[key] = str(
+                    self._headless_variant(Path(description_file))
+                )
+            else:
+                self._resolved[key] = description_file
+        return self._resolved[key]
+
+    def _headless_variant(self, description_file: Path) -> Path:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tree = ET.parse(description_file)
+        for link in tree.getroot().iter("link"):
+            for visual in link.findall("visual"):
+                link.remove(visual)
+            for mesh in link.iter("mesh"):
+                mesh_file = self._locate_mesh(description_file, mesh.get("filename"))
+                mesh.set("filename", str(self._compact_mesh(mesh_file)))
+
+        # compacted mesh names carry their own hash, so an edited mesh changes the key
+        content = ET.tostring(tree.getroot(), encoding="unicode")
+        digest = hashlib.sha1(content.encode()).hexdigest()[:16]
+        cached_file = self.cache_dir / f"{description_file.stem}-{digest}.urdf"
+        if not cached_file.exists():
+            _atomic_write(cached_file, content)
+            logging.info(f"cached headless description: {cached_file.name}")
+        return cached_file
+
+    def _locate_mesh(self, description_file: Path, filename: str) -> Path:
+        if filename.startswith(PACKAGE_PREFIX):
+            filename = filename[len(PACKAGE_PREFIX) :]
+        mesh_file = Path(filename)
+        if not mesh_file.is_absolute():
+            mesh_file = description_file.parent / mesh_file
+        if not mesh_file.exists():
+            raise SystemError(f"Could not locate mesh: {mesh_file}")
+        return mesh_file.resolve()
+
+    def _compact_mesh(self, mesh_file: Path) -> Path:
+        """keep the vertex, face, object and group records of an obj mesh, other
+        formats are linked as is"""
+        if mesh_file.suffix.lower() != ".obj":
+            return mesh_file
+        digest = _file_digest(mesh_file)
+        cached_file = (
+            self.cache_dir / f"{mesh_file.stem}-{digest}-v{COMPACT_FORMAT_VERSION}.obj"
+        )
+        if cached_file.exists():
+            return cached_file
+
+        records = []
+        with open(mesh_file) as f:
+            for line in f:
+                if line.startswith(("v ", "o ", "g ")):
+                    records.append(" ".join(line.split()))
+                elif line.startswith("f "):
+                    # drop texture and normal indices, f 1/2/3 -> f 1
+                    face = [vertex.split("/")[0] for vertex in line.split()[1:]]
+                    records.append("f " + " ".join(face))
+        _atomic_write(cached_file, "\n".join(records) + "\n")
+        return cached_file
+
+
+_asset_cache = None
+
+
+def resolve_description_file(description_file: str, headless: bool) -> str:
+    """process-wide entry point, every realm of every env shares one cache"""
+    global _asset_cache
+    if _asset_cache is None:
+        _asset_cache = AssetCache()
+    return _asset_cache.resolve(description_file, headless)
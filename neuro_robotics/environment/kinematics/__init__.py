@@ -0,0 +1,7 @@
+from .inverse_kinematics import DampedLeastSquaresSolver
+from .inverse_kinematics import InverseKinematicsSolution
+from .inverse_kinematics import quaternion_to_rotation_matrix
+from .kinematic_chain import KinematicChain
+from .reachability_index import ReachabilityIndex
+from .reachability_index import ReachableRegion
+from .reachability_index import load_reachability_index
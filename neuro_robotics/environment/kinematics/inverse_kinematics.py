@@ -0,0 +1,119 @@
+import numpy as np
+from attrs import define
+
+from .kinematic_chain import KinematicChain
+
+
+def quaternion_to_rotation_matrix(quaternion: np.ndarray) -> np.ndarray:
+    """bullet quaternion (x, y, z, w) to rotation matrix, vectorized over leading axes"""
+    quaternion = np.asarray(quaternion, dtype=np.float64)
+    quaternion = quaternion / np.linalg.norm(quaternion, axis=-1, keepdims=True)
+    x, y, z, w = np.moveaxis(quaternion, -1, 0)
+    return np.stack(
+        (
+            np.stack(
+                (1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)), -1
+            ),
+            np.stack(
+                (2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)), -1
+            ),
+            np.stack(
+                (2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)), -1
+            ),
+        ),
+        -2,
+    )
+
+
+@define
+class InverseKinematicsSolution:
+    """joint angles and the remaining tip error of every solved arm"""
+
+    joint_angles: np.ndarray
+    position_residual: np.ndarray
+    orientation_residual: np.ndarray
+    iterations: int
+
+
+class DampedLeastSquaresSolver:
+    """Batched damped least squares inverse kinematics over a KinematicChain.
+
+    Every arm starts from its own initial joint state, typically the current one,
+    so a small end-effector displacement converges in a handful of iterations.
+    Position and orientation are solved together, the damping keeps the update
+    bounded close to singular configurations and joint limits are enforced after
+    every iteration.
+    """
+
+    def __init__(
+        self,
+        chain: KinematicChain,
+        damping: float = 0.05,
+        max_iterations: int = 20,
+        tolerance: float = 1e-4,
+    ):
+        self.chain = chain
+        self.damping = damping
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+
+    def _pose_error(self, tip_transform, target_position, target_rotation):
+        position_error = target_position - tip_transform[:, :3, 3]
+        # small angle rotation error, half the sum of column cross products
+        orientation_error = 0.5 * np.cross(
+            tip_transform[:, :3, :3], target_rotation, axisa=1, axisb=1
+        ).sum(axis=1)
+        return position_error, orientation_error
+
+    def solve(
+        self,
+        target_position: np.ndarray,
+        target_orientation: np.ndarray,
+        initial_joint_angles: np.ndarray,
+    ) -> InverseKinematicsSolution:
+        """Solve the chain for a batch of tip poses expressed in the root frame.
+        Args:
+            target_position (np.ndarray): Tip positions, as (batch, 3).
+            target_orientation (np.ndarray): Tip quaternions (x, y, z, w), as (batch, 4) or (4,).
+            initial_joint_angles (np.ndarray): Warm start, as (batch, n_joints).
+        Returns:
+            InverseKinematicsSolution: Joint angles and residuals per arm.
+        """
+        target_position = np.atleast_2d(target_position)
+        joint_angles = self.chain.clip(
+            np.array(np.atleast_2d(initial_joint_angles), dtype=np.float64)
+        )
+        target_rotation = np.broadcast_to(
+            quaternion_to_rotation_matrix(target_orientation),
+            (target_position.shape[0], 3, 3),
+        )
+        damping = self.damping**2 * np.eye(6)
+
+        for iteration in range(self.max_iterations + 1):
+            kinematics = self.chain.forward_kinematics(joint_angles)
+            position_error, orientation_error = self._pose_error(
+                kinematics[0], target_position, target_rotation
+            )
+            position_residual = np.linalg.norm(position_error, axis=1)
+            orientation_residual = np.linalg.norm(orientation_error, axis=1)
+            active = (
+                np.maximum(position_residual, orientation_residual) > self.tolerance
+            )
+            if iteration == self.max_iterations or not active.any():
+                break
+
+            jacobian = self.chain.jacobian(*kinematics)[active]
+            error = np.concatenate((position_error, orientation_error), axis=1)[active]
+            # dq = J^T (J J^T + lambda^2 I)^-1 e
+            step = np.linalg.solve(
+                jacobian @ jacobian.transpose(0, 2, 1) + damping, error[..., None]
+            )
+            joint_angles[active] += (jacobian.transpose(0, 2, 1) @ step)[..., 0]
+            joint_angles = self.chain.clip(joint_angles)
+
+        return InverseKinematicsSolution(
+            joint_angles=joint_angles,
+            position_residual=position_residual,
+            orientation_residual=orientation_residual,
+            iterations=iteration,
+        )
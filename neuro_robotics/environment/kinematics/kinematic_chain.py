@@ -0,0 +1,167 @@
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from typing import List
+from typing import Tuple
+
+import numpy as np
+from attrs import define
+
+MOVABLE_JOINT_TYPES = ("revolute", "continuous")
+
+
+def _rpy_to_rotation_matrix(roll: float, pitch: float, yaw: float) -> np.ndarray:
+    """urdf fixed axis convention, R = Rz(yaw) Ry(pitch) Rx(roll)"""
+    cr, sr = np.cos(roll), np.sin(roll)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    return np.array(
+        [
+            [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+            [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+            [-sp, cp * sr, cp * cr],
+        ]
+    )
+
+
+def _parse_vector(text, default) -> np.ndarray:
+    return np.array(default if text is None else text.split(), dtype=np.float64)
+
+
+@define(frozen=True)
+class ChainJoint:
+    """joint of a serial chain, ``origin`` is the 4x4 transform parent -> joint"""
+
+    name: str
+    index: int
+    origin: np.ndarray
+    axis: np.ndarray
+    movable: bool
+    lower: float
+    upper: float
+
+
+class KinematicChain:
+    """Serial chain from the root link to one link of an URDF.
+
+    Joints are indexed the way bullet indexes them, in the order they appear in
+    the URDF, so link ``i`` is the child link of joint ``i``. All kinematics is
+    vectorized over a leading batch dimension and expressed in the root frame.
+    """
+
+    def __init__(self, joints: List[ChainJoint]):
+        self.joints = joints
+        movable = [joint for joint in joints if joint.movable]
+        self.n_joints = len(movable)
+        self.joint_indices = [joint.index for joint in movable]
+        self.lower_limits = np.array([joint.lower for joint in movable])
+        self.upper_limits = np.array([joint.upper for joint in movable])
+        # rodrigues terms of every movable axis, R = I + sin(q) K + (1 - cos(q)) K^2
+        self._skew = np.array([self._skew_matrix(joint.axis) for joint in movable])
+        self._skew_squared = self._skew @ self._skew
+
+    @classmethod
+    def from_urdf(cls, description_file: str, tip_link: int) -> "KinematicChain":
+        return _load_chain(str(description_file), tip_link)
+
+    @staticmethod
+    def _skew_matrix(axis: np.ndarray) -> np.ndarray:
+        x, y, z = axis
+        return np.array([[0.0, -z, y], [z, 0.0, -x], [-y, x, 0.0]])
+
+    def clip(self, joint_angles: np.ndarray) -> np.ndarray:
+        return np.clip(joint_angles, self.lower_limits, self.upper_limits)
+
+    def forward_kinematics(
+        self, joint_angles: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the tip pose and the world placement of every movable joint.
+        Args:
+            joint_angles (np.ndarray): Joint angles, as (batch, n_joints).
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Tip transforms (batch, 4, 4),
+            joint positions (batch, n_joints, 3) and joint axes (batch, n_joints, 3).
+        """
+        joint_angles = np.atleast_2d(joint_angles)
+        batch_size = joint_angles.shape[0]
+        transform = np.tile(np.eye(4), (batch_size, 1, 1))
+        joint_positions = np.empty((batch_size, self.n_joints, 3))
+        joint_axes = np.empty((batch_size, self.n_joints, 3))
+
+        sin, cos = np.sin(joint_angles), np.cos(joint_angles)
+        idx = 0
+        for joint in self.joints:
+            transform = transform @ joint.origin
+            if not joint.movable:
+                continue
+            joint_positions[:, idx] = transform[:, :3, 3]
+            joint_axes[:, idx] = transform[:, :3, :3] @ joint.axis
+            rotation = (
+                np.eye(3)
+                + sin[:, idx, None, None] * self._skew[idx]
+                + (1.0 - cos[:, idx, None, None]) * self._skew_squared[idx]
+            )
+            transform[:, :3, :3] = transform[:, :3, :3] @ rotation
+            idx += 1
+        return transform, joint_positions, joint_axes
+
+    def jacobian(
+        self,
+        tip_transform: np.ndarray,
+        joint_positions: np.ndarray,
+        joint_axes: np.ndarray,
+    ) -> np.ndarray:
+        """Geometric jacobian of the tip, as (batch, 6, n_joints), linear rows first"""
+        tip_position = tip_transform[:, None, :3, 3]
+        linear = np.cross(joint_axes, tip_position - joint_positions)
+        return np.concatenate((linear, joint_axes), axis=2).transpose(0, 2, 1)
+
+
+@lru_cache(maxsize=None)
+def _load_chain(description_file: str, tip_link: int) -> KinematicChain:
+    """walk the urdf from the tip link back to the root, parsed once per process"""
+    urdf_joints = ET.parse(description_file).getroot().findall("joint")
+    if not 0 <= tip_link < len(urdf_joints):
+        raise SystemError(f"Link {tip_link} is not part of {description_file}")
+    joints_by_child = {joint.find("child").get("link"): joint for joint in urdf_joints}
+
+    chain = []
+    urdf_joint = urdf_joints[tip_link]
+    while urdf_joint is not None:
+        chain.append(urdf_joint)
+        urdf_joint = joints_by_child.get(urdf_joint.find("parent").get("link"))
+
+    joints = []
+    for urdf_joint in reversed(chain):
+        index = urdf_joints.index(urdf_joint)
+        origin_element = urdf_joint.find("origin")
+        origin = np.eye(4)
+        if origin_element is not None:
+            origin[:3, :3] = _rpy_to_rotation_matrix(
+                *_parse_vector(origin_element.get("rpy"), (0, 0, 0))
+            )
+            origin[:3, 3] = _parse_vector(origin_element.get("xyz"), (0, 0, 0))
+
+        joint_type = urdf_joint.get("type")
+        if joint_type not in MOVABLE_JOINT_TYPES + ("fixed",):
+            raise SystemError(f"Unsupported joint type in chain: {joint_type}")
+        axis_element = urdf_joint.find("axis")
+        axis = _parse_vector(
+            None if axis_element is None else axis_element.get("xyz"), (1, 0, 0)
+        )
+        limit = urdf_joint.find("limit")
+        lower, upper = -np.inf, np.inf
+        if joint_type == "revolute" and limit is not None:
+            lower, upper = float(limit.get("lower")), float(limit.get("upper"))
+
+        joints.append(
+            ChainJoint(
+                name=urdf_joint.get("name"),
+                index=index,
+                origin=origin,
+                axis=axis,
+                movable=joint_type in MOVABLE_JOINT_TYPES,
+                lower=lower,
+                upper=upper,
+            )
+        )
+    return KinematicChain(joints)
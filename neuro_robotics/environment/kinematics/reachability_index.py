@@ -0,0 +1,214 @@
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .kinematic_chain import KinematicChain
+
+# tool pointing down, as quaternion (x, y, z, w)
+DOWNWARD_ORIENTATION = np.array([1.0, 0.0, 0.0, 0.0])
+
+
+def _dilate(occupancy: np.ndarray) -> np.ndarray:
+    """26-neighbourhood binary dilation"""
+    padded = np.pad(occupancy, 1)
+    dilated = np.zeros_like(occupancy)
+    for x, y, z in np.ndindex(3, 3, 3):
+        dilated |= padded[
+            x : x + occupancy.shape[0],
+            y : y + occupancy.shape[1],
+            z : z + occupancy.shape[2],
+        ]
+    return dilated
+
+
+class ReachableRegion:
+    """Reachable cells clipped to a box, sampling is uniform over the cells.
+    A box with zero height selects the cells crossing that plane.
+    """
+
+    def __init__(self, low: np.ndarray, high: np.ndarray):
+        self.low = low
+        self.high = high
+
+    def __len__(self):
+        return len(self.low)
+
+    def translate(self, offset: np.ndarray) -> "ReachableRegion":
+        return ReachableRegion(self.low + offset, self.high + offset)
+
+    def sample(self, np_random) -> np.ndarray:
+        """pick a cell in O(1) and a uniform point inside it"""
+        # uniform works for both RandomState and Generator
+        idx = int(np_random.uniform(0, len(self.low)))
+        return np_random.uniform(self.low[idx], self.high[idx])
+
+    def sample_batch(self, np_random, n_samples: int) -> np.ndarray:
+        """vectorized sample, as (n_samples, 3)"""
+        idx = np_random.uniform(0, len(self.low), n_samples).astype(np.int64)
+        return np_random.uniform(self.low[idx], self.high[idx])
+
+
+class ReachabilityIndex:
+    """Voxel occupancy of the end-effector positions an arm can reach.
+
+    Built once offline by sweeping the joint space through the kinematic chain
+    and stored next to the robot metadata, positions are expressed in the frame
+    of the chain root. Lookups index the occupancy grid directly.
+    """
+
+    def __init__(self, origin: np.ndarray, voxel_size: float, occupancy: np.ndarray):
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.voxel_size = float(voxel_size)
+        self.occupancy = np.asarray(occupancy, dtype=bool)
+
+    @classmethod
+    def build(
+        cls,
+        chain: KinematicChain,
+        n_samples: int,
+        voxel_size: float,
+        orientation_tolerance: float = np.pi,
+        batch_size: int = 65536,
+        padding: int = 2,
+        seed: int = 0,
+    ) -> "ReachabilityIndex":
+        """Sweep the joint space, then grow the reached set with inverse kinematics.
+
+        Uniform joint samples leave holes in the workspace, so every empty voxel
+        next to a reached one is solved for, warm-started from the configuration
+        of its reached neighbour, until the reached set stops growing.
+        Args:
+            chain (KinematicChain): Chain ending at the end-effector link.
+            n_samples (int): Number of joint configurations of the sweep.
+            voxel_size (float): Edge of a voxel [m].
+            orientation_tolerance (float): Maximum angle between the tool axis and
+                the downward vertical [rad], pi keeps every configuration.
+            batch_size (int): Configurations per forward kinematics call.
+            padding (int): Voxels added around the swept bounding box.
+            seed (int): Sampling seed.
+        Returns:
+            ReachabilityIndex: The occupancy of the reached voxels.
+        """
+        rng = np.random.default_rng(seed)
+        min_alignment = np.cos(orientation_tolerance)
+        reached_positions, reached_angles = [], []
+        for start in range(0, n_samples, batch_size):
+            size = min(batch_size, n_samples - start)
+            joint_angles = rng.uniform(
+                chain.lower_limits, chain.upper_limits, (size, chain.n_joints)
+            )
+            tip_transform, _, _ = chain.forward_kinematics(joint_angles)
+            # tool axis is the tip z axis, pointing down means -z alignment
+            accepted = -tip_transform[:, 2, 2] >= min_alignment
+            reached_positions.append(tip_transform[accepted, :3, 3])
+            reached_angles.append(joint_angles[accepted])
+        reached_positions = np.concatenate(reached_positions)
+        reached_angles = np.concatenate(reached_angles)
+        if not len(reached_positions):
+            raise SystemError("No configuration satisfies the orientation tolerance")
+
+        origin = (
+            np.floor(reached_positions.min(axis=0) / voxel_size) - padding
+        ) * voxel_size
+        cells = np.floor((reached_positions - origin) / voxel_size).astype(np.int64)
+        shape = tuple(cells.max(axis=0) + 1 + padding)
+        occupancy = np.zeros(shape, dtype=bool)
+        occupancy[tuple(cells.T)] = True
+        seeds = np.zeros(shape + (chain.n_joints,))
+        seeds[tuple(cells.T)] = reached_angles
+        swept = occupancy.sum()
+
+        index = cls(origin, voxel_size, occupancy)
+        index._grow(chain, seeds, orientation_tolerance)
+        logging.info(
+            f"reachability: {len(reached_positions)}/{n_samples} configurations, "
+            f"{swept} voxels swept, {index.occupancy.sum()} of "
+            f"{index.occupancy.size} voxels reachable"
+        )
+        return index
+
+    def _grow(self, chain, seeds, orientation_tolerance):
+        """flood the empty neighbours of newly reached voxels with warm-started solves"""
+        # imported here, the solver module depends on this one only through the chain
+        from .inverse_kinematics import DampedLeastSquaresSolver
+
+        solver = DampedLeastSquaresSolver(chain, max_iterations=100)
+        min_alignment = np.cos(orientation_tolerance)
+        offsets = np.array(list(np.ndindex(3, 3, 3))) - 1
+        frontier = self.occupancy.copy()
+        while frontier.any():
+            candidates = np.argwhere(_dilate(frontier) & ~self.occupancy)
+            if not len(candidates):
+                break
+
+            # warm start from a frontier neighbour, a failed voxel is retried
+            # whenever one of its neighbours is newly reached
+            warm_start = np.empty((len(candidates), chain.n_joints))
+            assigned = np.zeros(len(candidates), dtype=bool)
+            for offset in offsets:
+                neighbours = candidates + offset
+                valid = np.all(
+                    (neighbours >= 0) & (neighbours < frontier.shape), axis=1
+                )
+                valid[valid] = frontier[tuple(neighbours[valid].T)]
+                valid &= ~assigned
+                warm_start[valid] = seeds[tuple(neighbours[valid].T)]
+                assigned |= valid
+
+            centers = self.origin + (candidates + 0.5) * self.voxel_size
+            solution = solver.solve(centers, DOWNWARD_ORIENTATION, warm_start)
+            tip_transform, _, _ = chain.forward_kinematics(solution.joint_angles)
+            solved = (solution.position_residual < 0.25 * self.voxel_size) & (
+                -tip_transform[:, 2, 2] >= min_alignment
+            )
+            solved_cells = tuple(candidates[solved].T)
+            self.occupancy[solved_cells] = True
+            seeds[solved_cells] = solution.joint_angles[solved]
+            frontier = np.zeros_like(frontier)
+            frontier[solved_cells] = True
+
+    @classmethod
+    def load(cls, path: Path) -> "ReachabilityIndex":
+        with np.load(path) as index:
+            return cls(index["origin"], index["voxel_size"], index["occupancy"])
+
+    def save(self, path: Path) -> None:
+        np.savez_compressed(
+            path,
+            origin=self.origin,
+            voxel_size=self.voxel_size,
+            occupancy=self.occupancy,
+        )
+
+    def contains(self, positions: np.ndarray) -> np.ndarray:
+        """Look up positions in the chain root frame, vectorized over leading axes"""
+        cells = np.floor((np.asarray(positions) - self.origin) / self.voxel_size)
+        cells = cells.astype(np.int64)
+        inside = np.all((cells >= 0) & (cells < self.occupancy.shape), axis=-1)
+        reachable = np.zeros(inside.shape, dtype=bool)
+        reachable[inside] = self.occupancy[tuple(cells[inside].T)]
+        return reachable
+
+    def region(self, low: np.ndarray, high: np.ndarray) -> ReachableRegion:
+        """Reachable cells overlapping the box [low, high], clipped to it"""
+        cells = np.argwhere(self.occupancy)
+        cell_low = self.origin + cells * self.voxel_size
+        cell_high = cell_low + self.voxel_size
+        overlapping = np.all((cell_low <= high) & (cell_high >= low), axis=1)
+        if not overlapping.any():
+            raise SystemError(f"No reachable cell between {low} and {high}")
+        return ReachableRegion(
+            np.maximum(cell_low[overlapping], low),
+            np.minimum(cell_high[overlapping], high),
+        )
+
+
+@lru_cache(maxsize=None)
+def load_reachability_index(path: Path):
+    """process-wide index of a robot, None when it has not been built yet"""
+    if not Path(path).exists():
+        logging.info(f"no reachability index at {path}, sampling the full boxes")
+        return None
+    return ReachabilityIndex.load(path)
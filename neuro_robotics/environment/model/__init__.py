@@ -1 +1,12 @@
-from .franka_emika_panda import PandaEnv
+from .configuration import realm_registry
+from .realm import RealmEnv
+
+
+def create_realm(realm: str, client, base_offset=None, headless=False) -> RealmEnv:
+    """instantiate the realm described by the manifest ``<realm>.yml``"""
+    return RealmEnv(
+        client,
+        realm_registry.depiction(realm),
+        base_offset=base_offset,
+        headless=headless,
+    )
@@ -1 +1,4 @@
-from .inject_env_metadata import InjectEnvMetadata
+from .configuration_registry import configuration_registry
+from .dataclass import RealmDepiction
+from .realm_registry import realm_registry
+from .realm_registry import RealmRegistry
@@ -0,0 +1,98 @@
+import copy
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+from typing import Dict
+
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common import methods
+
+# bump when the bundle layout changes, old bundles are then ignored
+BUNDLE_VERSION = 1
+
+
+class ConfigurationRegistry:
+    """Parse each metadata yml once per process and share it across processes.
+
+    The parsed yaml tree is kept in memory and pickled into a compiled bundle
+    next to the other caches. A bundle is reused as is while the yml mtime and
+    size are unchanged, otherwise the yml content hash decides whether it has to
+    be parsed again, so freshly spawned env workers skip the yaml parser.
+    Environment variables are expanded after loading, never stored.
+    """
+
+    def __init__(self, cache_dir: Path = constants.CONFIGURATION_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self._parsed: Dict[Path, Any] = {}
+
+    def load(self, yaml_path) -> dict:
+        yaml_path = Path(yaml_path).resolve()
+        if yaml_path not in self._parsed:
+            self._parsed[yaml_path] = self._load_compiled(yaml_path)
+        # callers own their copy, expanding variables mutates the tree
+        return methods.expand_environment_variables(
+            copy.deepcopy(self._parsed[yaml_path])
+        )
+
+    def clear(self) -> None:
+        self._parsed.clear()
+
+    def _bundle_path(self, yaml_path: Path) -> Path:
+        path_digest = hashlib.sha1(str(yaml_path).encode()).hexdigest()[:12]
+        return self.cache_dir / f"{yaml_path.stem}-{path_digest}.pickle"
+
+    def _load_compiled(self, yaml_path: Path):
+        stat = yaml_path.stat()
+        bundle_path = self._bundle_path(yaml_path)
+        bundle = self._read_bundle(bundle_path)
+        if (
+            bundle is not None
+            and bundle["mtime_ns"] == stat.st_mtime_ns
+            and bundle["size"] == stat.st_size
+        ):
+            return bundle["content"]
+
+        digest = hashlib.sha1(yaml_path.read_bytes()).hexdigest()
+        if bundle is not None and bundle["digest"] == digest:
+            content = bundle["content"]
+        else:
+            content = methods.parse_yaml(yaml_path)
+            logging.debug(f"compiled configuration: {yaml_path.name}")
+        self._write_bundle(
+            bundle_path,
+            {
+                "version": BUNDLE_VERSION,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "digest": digest,
+                "content": content,
+            },
+        )
+        return content
+
+    def _read_bundle(self, bundle_path: Path):
+        try:
+            with open(bundle_path, "rb") as f:
+                bundle = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if bundle.get("version") != BUNDLE_VERSION:
+            return None
+        return bundle
+
+    def _write_bundle(self, bundle_path: Path, bundle: dict) -> None:
+        """best effort, a read-only checkout still works without the bundle"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = bundle_path.with_name(f"{bundle_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, bundle_path)
+        except OSError as e:
+            logging.warning(f"Could not write configuration bundle: {e}")
+
+
+configuration_registry = ConfigurationRegistry()
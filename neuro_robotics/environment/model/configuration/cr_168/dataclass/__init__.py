@@ -1,5 +0,0 @@
-from .goal_depiction import GoalDepiction
-from .plane_depiction import PlaneDepiction
-from .robot_depiction import RobotDepiction
-from .table_depiction import TableDepiction
-from .tray_depiction import TrayDepiction
@@ -1,5 +1,7 @@
+from .camera_depiction import CameraDepiction
 from .goal_depiction import GoalDepiction
 from .plane_depiction import PlaneDepiction
+from .realm_depiction import RealmDepiction
 from .robot_depiction import RobotDepiction
 from .table_depiction import TableDepiction
 from .tray_depiction import TrayDepiction
@@ -0,0 +1,11 @@
+from attrs import define
+from attrs import field
+
+
+@define(frozen=True)
+class CameraDepiction:
+
+    target_position: tuple = field(converter=tuple)
+    distance: float = field(converter=float)
+    yaw: float = field(converter=float)
+    pitch: float = field(converter=float)
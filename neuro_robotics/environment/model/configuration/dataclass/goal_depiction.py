@@ -0,0 +1,13 @@
+from attrs import define
+from attrs import field
+
+
+@define(frozen=True)
+class GoalDepiction:
+
+    description_file_location: str
+    init_position: tuple = field(converter=tuple)
+    object_size: float = field(converter=float)
+    floor_probability: float = field(converter=float)
+    range_low: tuple = field(converter=tuple)
+    range_high: tuple = field(converter=tuple)
@@ -0,0 +1,9 @@
+from attrs import define
+from attrs import field
+
+
+@define(frozen=True)
+class PlaneDepiction:
+
+    description_file_location: str
+    init_position: tuple = field(converter=tuple)
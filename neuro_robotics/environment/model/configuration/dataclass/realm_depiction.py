@@ -0,0 +1,28 @@
+from typing import Optional
+
+from attrs import define
+from attrs import field
+
+from .camera_depiction import CameraDepiction
+from .goal_depiction import GoalDepiction
+from .plane_depiction import PlaneDepiction
+from .robot_depiction import RobotDepiction
+from .table_depiction import TableDepiction
+from .tray_depiction import TrayDepiction
+
+
+@define(frozen=True)
+class RealmDepiction:
+
+    realm: str
+    distance_threshold: float = field(converter=float)
+    reachability_index_path: str
+
+    robot: RobotDepiction
+    goal: GoalDepiction
+    plane: PlaneDepiction
+    table: TableDepiction
+    tray: TrayDepiction
+    camera: CameraDepiction
+    # realm whose robot this one still runs, None when it has its own description
+    alias_of: Optional[str] = None
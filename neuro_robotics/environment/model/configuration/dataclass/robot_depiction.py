@@ -0,0 +1,25 @@
+from attrs import define
+from attrs import field
+
+
+@define(frozen=True)
+class RobotDepiction:
+
+    description_file_location: str
+
+    init_position: tuple = field(converter=tuple)
+
+    control_joints_id: tuple = field(converter=tuple)
+    control_joints_neutral_position: tuple = field(converter=tuple)
+
+    effector_joint_id: tuple = field(converter=tuple)
+    effector_link_id: int = field(converter=int)
+    effector_displacement_limit: float = field(converter=float)
+    effector_lateral_friction: float = field(converter=float)
+    effector_spinning_friction: float = field(converter=float)
+
+    inverse_kinematics_displacement_limit: float = field(converter=float)
+    inverse_kinematics_backend: str = field(converter=str)
+    inverse_kinematics_damping: float = field(converter=float)
+    inverse_kinematics_max_iterations: int = field(converter=int)
+    inverse_kinematics_tolerance: float = field(converter=float)
@@ -1,5 +0,0 @@
-from .engram import GoalDataclassEngram
-from .engram import PlaneDataclassEngram
-from .engram import RobotDataclassEngram
-from .engram import TableDataclassEngram
-from .engram import TrayDataclassEngram
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+from .configuration_registry import configuration_registry
+from .dataclass import CameraDepiction
+from .dataclass import GoalDepiction
+from .dataclass import PlaneDepiction
+from .dataclass import RealmDepiction
+from .dataclass import RobotDepiction
+from .dataclass import TableDepiction
+from .dataclass import TrayDepiction
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common.constants import RealmManifest as manifest
+
+CFG_KEY = manifest.CFG_KEY.value
+
+
+class RealmManifestEngram:
+    def __init__(self, manifest_path):
+        """load and resolve the realm manifest yml file, the realm id is its stem"""
+        self.manifest_path = Path(manifest_path)
+        self.manifest = configuration_registry.load(self.manifest_path)
+        self.dataclass_entity = self._initialize_dataclass_fields()
+
+    def _initialize_dataclass_fields(self):
+        realm_dataclass = RealmDepiction(
+            realm=self.manifest_path.stem,
+            distance_threshold=self.manifest[CFG_KEY.DISTANCE_THRESHOLD_ATTR.value],
+            reachability_index_path=self._core_path(
+                self.manifest[CFG_KEY.REACHABILITY_INDEX_ATTR.value]
+            ),
+            robot=self.robot,
+            goal=self.goal,
+            plane=PlaneDepiction(**self._body(CFG_KEY.PLANE_ATTR.value)),
+            table=TableDepiction(**self._body(CFG_KEY.TABLE_ATTR.value)),
+            tray=TrayDepiction(**self._body(CFG_KEY.TRAY_ATTR.value)),
+            camera=self.camera,
+            alias_of=self.manifest.get(CFG_KEY.ALIAS_OF_ATTR.value),
+        )
+        return realm_dataclass
+
+    @staticmethod
+    def _core_path(location):
+        return str(constants.CORE_DIR) + "/" + location
+
+    @staticmethod
+    def _position(position_attr):
+        x_pos = position_attr[CFG_KEY._X_ATTR.value]
+        y_pos = position_attr[CFG_KEY._Y_ATTR.value]
+        z_pos = position_attr[CFG_KEY._Z_ATTR.value]
+        return [x_pos, y_pos, z_pos]
+
+    def _body(self, entity):
+        """description file and position every loaded body has"""
+        body_attr = self.manifest[entity]
+        return dict(
+            description_file_location=self._core_path(
+                body_attr[CFG_KEY.DESC_FILE_LOC_ATTR.value]
+            ),
+            init_position=self._position(body_attr[CFG_KEY.INIT_POSITION_ATTR.value]),
+        )
+
+    @property
+    def robot(self):
+        robot_attr = self.manifest[CFG_KEY.ROBOT_ATTR.value]
+        control_joints_attr = robot_attr[CFG_KEY.CONTROL_JOINTS_ATTR.value]
+        effector_attr = robot_attr[CFG_KEY.EFFECTOR_ATTR.value]
+        inverse_kinematics_attr = robot_attr[CFG_KEY.INVERSE_KINEMATICS_ATTR.value]
+        return RobotDepiction(
+            **self._body(CFG_KEY.ROBOT_ATTR.value),
+            control_joints_id=control_joints_attr[CFG_KEY._ID.value],
+            control_joints_neutral_position=control_joints_attr[
+                CFG_KEY._NEUTRAL_POSITION.value
+            ],
+            effector_joint_id=effector_attr[CFG_KEY._JOINT_ID.value],
+            effector_link_id=effector_attr[CFG_KEY._LINK_ID.value],
+            effector_displacement_limit=effector_attr[
+                CFG_KEY._SOFT_DISPLACEMENT_LIMIT.value
+            ],
+            effector_lateral_friction=effector_attr[CFG_KEY._LATERAL_FRICTION.value],
+            effector_spinning_friction=effector_attr[CFG_KEY._SPINNING_FRICTION.value],
+            inverse_kinematics_displacement_limit=inverse_kinematics_attr[
+                CFG_KEY._DISPLACEMENT_LIMIT.value
+            ],
+            inverse_kinematics_backend=inverse_kinematics_attr[CFG_KEY._BACKEND.value],
+            inverse_kinematics_damping=inverse_kinematics_attr[CFG_KEY._DAMPING.value],
+            inverse_kinematics_max_iterations=inverse_kinematics_attr[
+                CFG_KEY._MAX_ITERATIONS.value
+            ],
+            inverse_kinematics_tolerance=inverse_kinematics_attr[
+                CFG_KEY._TOLERANCE.value
+            ],
+        )
+
+    @property
+    def goal(self):
+        goal_attr = self.manifest[CFG_KEY.GOAL_ATTR.value]
+        range_attr = goal_attr[CFG_KEY.RANGE_ATTR.value]
+        return GoalDepiction(
+            **self._body(CFG_KEY.GOAL_ATTR.value),
+            object_size=goal_attr[CFG_KEY.OBJECT_SIZE_ATTR.value],
+            floor_probability=goal_attr[CFG_KEY.FLOOR_PROBABILITY_ATTR.value],
+            range_low=self._position(range_attr[CFG_KEY._LOW.value]),
+            range_high=self._position(range_attr[CFG_KEY._HIGH.value]),
+        )
+
+    @property
+    def camera(self):
+        camera_attr = self.manifest[CFG_KEY.CAMERA_ATTR.value]
+        return CameraDepiction(
+            target_position=camera_attr[CFG_KEY._TARGET_POSITION.value],
+            distance=camera_attr[CFG_KEY._DISTANCE.value],
+            yaw=camera_attr[CFG_KEY._YAW.value],
+            pitch=camera_attr[CFG_KEY._PITCH.value],
+        )
@@ -0,0 +1,46 @@
+from pathlib import Path
+from typing import Dict
+from typing import List
+
+from .dataclass import RealmDepiction
+from .realm_manifest_engram import RealmManifestEngram
+from neuro_robotics.utils.common import methods
+from neuro_robotics.utils.common.constants import RealmManifest as manifest
+
+
+class RealmRegistry:
+    """Describe every realm by one yml manifest instead of a package per robot.
+
+    A manifest holds the bodies (urdf and pose), the control and effector
+    joints, the goal box, the camera and the reachability index of a realm.
+    It is compiled into a frozen ``RealmDepiction`` on first use and kept for
+    the lifetime of the process, the yaml tree itself is shared across
+    processes by the configuration registry bundles. Every realm runs on the
+    same generic entities, so adding a robot means adding a manifest.
+    """
+
+    def __init__(self, manifest_dir: Path = manifest.MANIFEST_DIR.value):
+        self.manifest_dir = Path(manifest_dir)
+        self._compiled: Dict[str, RealmDepiction] = {}
+
+    def available(self) -> List[str]:
+        return methods.available_realms(self.manifest_dir)
+
+    def manifest_path(self, realm: str) -> Path:
+        return self.manifest_dir / f"{realm}{manifest.MANIFEST_SUFFIX.value}"
+
+    def depiction(self, realm: str) -> RealmDepiction:
+        if realm not in self._compiled:
+            manifest_path = self.manifest_path(realm)
+            if not manifest_path.exists():
+                raise SystemError(
+                    f"Unknown realm: {realm}, expected one of {self.available()}"
+                )
+            self._compiled[realm] = RealmManifestEngram(manifest_path).dataclass_entity
+        return self._compiled[realm]
+
+    def clear(self) -> None:
+        self._compiled.clear()
+
+
+realm_registry = RealmRegistry()
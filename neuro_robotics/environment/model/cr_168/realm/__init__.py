@@ -1,5 +0,0 @@
-from .goal import Goal
-from .plane import Plane
-from .robot import Robot
-from .table import Table
-from .tray import Tray
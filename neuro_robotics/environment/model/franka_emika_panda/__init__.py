@@ -1 +0,0 @@
-from .panda_env import PandaEnv
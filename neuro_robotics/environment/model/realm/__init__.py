@@ -1,5 +1,6 @@
 from .goal import Goal
 from .plane import Plane
+from .realm_env import RealmEnv
 from .robot import Robot
 from .table import Table
 from .tray import Tray
@@ -0,0 +1,158 @@
+import numpy as np
+import pybullet as p
+
+from neuro_robotics.environment.abstract import GoalEntity
+from neuro_robotics.environment.assets import resolve_description_file
+
+
+class Goal(GoalEntity):
+    def __init__(self, client, metadata, base_offset=None, headless=False):
+        """metadata is the depiction of this body in the realm manifest"""
+        self.headless = headless
+        self._implant_metadata(metadata)
+        self.base_offset = (
+            np.zeros(3) if base_offset is None else np.array(base_offset, dtype=float)
+        )
+        self._position = np.zeros(3)
+        self.goal_client = client
+        self.model = self._load_model(self.goal_client)
+
+        self.goal_range_low = np.array(self.range_low, dtype=np.float32)
+        self.goal_range_high = np.array(self.range_high, dtype=np.float32)
+        # targets lie on the floor of the goal box
+        self.target_range_low = self.goal_range_low.copy()
+        self.target_range_high = self.goal_range_high.copy()
+        self.target_range_high[2] = self.goal_range_low[2]
+
+        self.reachable_goals = None
+        self.reachable_floor_goals = None
+        self.reachable_targets = None
+
+        super().__init__(self.goal_client, self.model)
+
+    def _implant_metadata(self, goal_metadata):
+        self.init_position = goal_metadata.init_position
+        self.description_file = goal_metadata.description_file_location
+        self.object_size = goal_metadata.object_size
+        self.floor_probability = goal_metadata.floor_probability
+        self.range_low = goal_metadata.range_low
+        self.range_high = goal_metadata.range_high
+
+    def _load_model(self, client):
+        model = client.loadURDF(
+            fileName=resolve_description_file(self.description_file, self.headless),
+            basePosition=np.add(self.init_position, self.base_offset),
+            flags=p.URDF_ENABLE_CACHED_GRAPHICS_SHAPES,
+        )
+        return model
+
+    def attach_reachability_index(self, index, robot_position):
+        """Sample goals and targets only from the cells the arm can reach.
+        Args:
+            index (ReachabilityIndex): Index expressed in the robot base frame.
+            robot_position (np.ndarray): Robot base position in the realm frame.
+        """
+        lift = np.array([0.0, 0.0, self.object_size / 2])
+        floor_low, floor_high = self.goal_range_low.copy(), self.goal_range_high.copy()
+        floor_low[2] = floor_high[2] = 0.0
+
+        def reachable_region(low, high):
+            return index.region(
+                low + lift - robot_position, high + lift - robot_position
+            ).translate(robot_position)
+
+        self.reachable_goals = reachable_region(
+            self.goal_range_low, self.goal_range_high
+        )
+        self.reachable_floor_goals = reachable_region(floor_low, floor_high)
+        self.reachable_targets = reachable_region(
+            self.target_range_low, self.target_range_high
+        )
+
+    def _update_desired_goal(self, position):
+        self.goal_position = position
+
+    def reset_model(self, sample=True, pose_restored=False, desired_goal=None):
+        """pose_restored skips re-posing the target after a bullet state restore,
+        a given desired_goal replaces the sampled one"""
+        if not sample:
+            if not pose_restored:
+                self._set_base_pose(
+                    position=np.add(self.init_position, self.base_offset),
+                    orientation=np.array([0, 0, 1, 1]),
+                )
+        else:
+            sampled_position = self.sample_target()
+            self._set_base_pose(
+                position=sampled_position + self.base_offset,
+                orientation=np.array([0, 0, 1, 1]),
+            )
+
+        if desired_goal is None:
+            desired_goal = self.sample_goal()
+        self._update_desired_goal(desired_goal)
+        self.target_position = self._get_base_position() - self.base_offset
+
+    def get_observation(self, out=None):
+        """out receives the position in place instead of a new array"""
+        if out is None:
+            observation = self._get_base_position() - self.base_offset
+            return observation.astype(np.float32)
+        self._position[:] = self.goal_client.getBasePositionAndOrientation(self.model)[
+            0
+        ]
+        np.subtract(self._position, self.base_offset, out=self._position)
+        out[:] = self._position
+        return out
+
+    def get_desired_goal(self):
+        return self.goal_position
+
+    def sample_goal(self):
+        if self.reachable_goals is not None:
+            if self.np_random.random() < self.floor_probability:
+                desired_goal = self.reachable_floor_goals.sample(self.np_random)
+            else:
+                desired_goal = self.reachable_goals.sample(self.np_random)
+            desired_goal = desired_goal.astype(np.float32)
+            self._update_desired_goal(desired_goal)
+            return desired_goal
+
+        desired_goal = np.array([0.0, 0.0, self.object_size / 2], dtype=np.float32)
+        noise = self.np_random.uniform(self.goal_range_low, self.goal_range_high)
+        if self.np_random.random() < self.floor_probability:
+            """let the bodies hit the floor"""
+            noise[2] = 0.0
+        desired_goal += noise
+        self._update_desired_goal(desired_goal)
+        return desired_goal
+
+    def sample_goals(self, np_random, n_goals: int) -> np.ndarray:
+        """Draw goals like ``sample_goal``, vectorized.
+        Args:
+            np_random (np.random.Generator): Generator to draw from.
+            n_goals (int): Number of goals.
+        Returns:
+            np.ndarray: Goals in the realm frame, as (n_goals, 3).
+        """
+        on_floor = np_random.random(n_goals) < self.floor_probability
+        if self.reachable_goals is not None:
+            desired_goals = self.reachable_goals.sample_batch(np_random, n_goals)
+            floor_goals = self.reachable_floor_goals.sample_batch(np_random, n_goals)
+            desired_goals[on_floor] = floor_goals[on_floor]
+            return desired_goals.astype(np.float32)
+
+        desired_goals = np_random.uniform(
+            self.goal_range_low, self.goal_range_high, (n_goals, 3)
+        )
+        desired_goals[on_floor, 2] = 0.0
+        desired_goals[:, 2] += self.object_size / 2
+        return desired_goals.astype(np.float32)
+
+    def sample_target(self):
+        if self.reachable_targets is not None:
+            return self.reachable_targets.sample(self.np_random)
+        target_position = np.array([0.0, 0.0, self.object_size / 2])
+        noise = self.np_random.uniform(self.target_range_low, self.target_range_high)
+        target_position += noise
+        return target_position
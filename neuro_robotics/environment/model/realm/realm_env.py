@@ -0,0 +1,160 @@
+from typing import Dict
+
+import numpy as np
+import pybullet as p
+
+from .goal import Goal
+from .plane import Plane
+from .robot import Robot
+from .table import Table
+from neuro_robotics.environment.kinematics import load_reachability_index
+from neuro_robotics.environment.model.configuration import RealmDepiction
+from neuro_robotics.environment.reward import SparseRewardKernel
+
+
+class RealmEnv:
+    """One workcell of a vectorized or single env, built from a realm manifest.
+    Robot, goal and scene bodies are generic, the depiction compiled by the
+    realm registry supplies their descriptions, poses and limits.
+    """
+
+    def __init__(
+        self, client: int, depiction: RealmDepiction, base_offset=None, headless=False
+    ) -> None:
+        self.realm_client = client
+        self.depiction = depiction
+        self.realm = depiction.realm
+        self.headless = headless
+        self.distance_threshold = depiction.distance_threshold
+        self.reachability_index_path = depiction.reachability_index_path
+        self.reward_kernel = SparseRewardKernel(self.distance_threshold)
+        self._canonical_state = None
+        self.base_offset = base_offset
+        self._observation_buffers = None
+        self._buffer_index = 0
+        self._robot_observation_dim = 0
+
+    def _set_camera(self, default=True):
+        if default:
+            camera = self.depiction.camera
+            p.resetDebugVisualizerCamera(
+                cameraDistance=camera.distance,
+                cameraYaw=camera.yaw,
+                cameraPitch=camera.pitch,
+                cameraTargetPosition=camera.target_position,
+            )
+        else:
+            raise NotImplementedError("Method is not yet implemented")
+
+    def set_env(self, load_plane=True, use_reachability_index=False) -> None:
+        """load realm bodies, the plane can be skipped when it is shared between realms,
+        goals stay uniform over their box unless the reachability index is used"""
+        entity_kwargs = {"base_offset": self.base_offset, "headless": self.headless}
+        depiction = self.depiction
+        self.robot = Robot(self.realm_client, depiction.robot, **entity_kwargs)
+        self.goal = Goal(self.realm_client, depiction.goal, **entity_kwargs)
+        self.plane = (
+            Plane(self.realm_client, depiction.plane, **entity_kwargs)
+            if load_plane
+            else None
+        )
+        self.table = Table(self.realm_client, depiction.table, **entity_kwargs)
+        if use_reachability_index:
+            self._attach_reachability_index()
+        self._set_camera()
+
+    def _attach_reachability_index(self):
+        """goals stay uniform over their box until the index has been built"""
+        index = load_reachability_index(self.reachability_index_path)
+        if index is not None:
+            self.goal.attach_reachability_index(
+                index, robot_position=np.array(self.robot.init_position)
+            )
+
+    def capture_canonical_state(self) -> None:
+        """reset the realm once and keep the resulting bullet state in memory"""
+        self.reset_env()
+        self._canonical_state = self.realm_client.saveState()
+
+    def reset_env(self, restore_snapshot=False, desired_goal=None):
+        """desired_goal comes from a GoalSampler, None samples it on the goal"""
+        if restore_snapshot and self._canonical_state is not None:
+            # joint and goal poses come back in one call, friction is persistent
+            self.realm_client.restoreState(stateId=self._canonical_state)
+            self.robot.invalidate_state_snapshot()
+            self.goal.reset_model(
+                sample=False, pose_restored=True, desired_goal=desired_goal
+            )
+        else:
+            self.robot.reset_model()
+            self.goal.reset_model(sample=False, desired_goal=desired_goal)
+
+    def is_settled(self, velocity_tolerance, position_tolerance) -> bool:
+        """arm at its motor target, goal at rest and nothing touching the goal"""
+        robot_goal_contacts = self.realm_client.getContactPoints(
+            bodyA=self.robot.model, bodyB=self.goal.model
+        )
+        if robot_goal_contacts:
+            return False
+        goal_velocity = self.realm_client.getBaseVelocity(self.goal.model)[0]
+        if np.max(np.abs(goal_velocity)) > velocity_tolerance:
+            return False
+        return self.robot.is_settled(velocity_tolerance, position_tolerance)
+
+    def invalidate_state_snapshot(self):
+        """called after the simulation has been stepped"""
+        self.robot.invalidate_state_snapshot()
+
+    def _allocate_observation_buffers(self) -> None:
+        template = self.generate_observation_matrix()
+        self._robot_observation_dim = (
+            template["observation"].size - template["achieved_goal"].size
+        )
+        self._observation_buffers = [
+            {key: np.empty_like(value) for key, value in template.items()}
+            for _ in range(2)
+        ]
+
+    def generate_observation_matrix(self, in_place=False) -> Dict[str, np.ndarray]:
+        """in_place fills float32 buffers owned by the realm and returns views of
+        them, two sets alternate so the previous observation stays valid"""
+        if in_place:
+            return self._fill_observation_buffers()
+        robot_observation: np.ndarray = self.robot.get_observation()
+        achieved_goal: np.ndarray = self.goal.get_observation()
+        desired_goal = self.goal.get_desired_goal()
+        observation = np.concatenate(
+            [robot_observation, achieved_goal], dtype=np.float32
+        )
+
+        observation_matrix = {
+            "observation": observation,
+            "achieved_goal": achieved_goal,
+            "desired_goal": desired_goal,
+        }
+        return observation_matrix
+
+    def _fill_observation_buffers(self) -> Dict[str, np.ndarray]:
+        if self._observation_buffers is None:
+            self._allocate_observation_buffers()
+        self._buffer_index ^= 1
+        buffers = self._observation_buffers[self._buffer_index]
+        state = buffers["observation"]
+        self.robot.get_observation(out=state[: self._robot_observation_dim])
+        self.goal.get_observation(out=buffers["achieved_goal"])
+        state[self._robot_observation_dim :] = buffers["achieved_goal"]
+        buffers["desired_goal"][:] = self.goal.get_desired_goal()
+        return dict(buffers)
+
+    def calculate_reward(self, achieved_goal, desired_goal, info):
+        return self.reward_kernel.compute_reward(achieved_goal, desired_goal, info)
+
+    def is_success(self, achieved_goal, desired_goal):
+        return self.reward_kernel.is_success(achieved_goal, desired_goal)
+
+    def recalculate_done(self, current_step, info):
+        success = info["is_success"]
+        if success:
+            return True
+        else:
+            return False
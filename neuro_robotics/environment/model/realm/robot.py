@@ -0,0 +1,168 @@
+import numpy as np
+import pybullet as p
+
+from neuro_robotics.environment.abstract import RobotEntity
+from neuro_robotics.environment.assets import resolve_description_file
+from neuro_robotics.environment.kinematics import DampedLeastSquaresSolver
+from neuro_robotics.environment.kinematics import KinematicChain
+from neuro_robotics.utils.common import constants
+
+
+class Robot(RobotEntity):
+    def __init__(self, client, metadata, base_offset=None, headless=False):
+        """metadata is the depiction of this body in the realm manifest"""
+        self.headless = headless
+        self._implant_metadata(metadata)
+        self.robot_client = client
+        self.base_offset = (
+            np.zeros(3) if base_offset is None else np.array(base_offset, dtype=float)
+        )
+        self._position = np.zeros(3)
+        self.model = self._load_model(self.robot_client)
+        super().__init__(
+            self.robot_client,
+            self.model,
+            snapshot_joints=sorted(
+                set(self.control_joints_id) | set(self.effector_joint_id)
+            ),
+            snapshot_links=[self.effector_link_id],
+        )
+        self.control_target = None
+        self._control_target = np.zeros(len(self.control_joints_id), dtype=np.float32)
+        # fingers width and action, numpy scalar constructors allocate a 0-d array
+        self._fingers_terms = np.zeros(2, dtype=np.float32)
+        self._fingers_limit = np.float32(self.effector_displacement_limit)
+        # numpy < 2 sends float32 and python float operands through the ufunc machinery
+        self._half = np.float32(0.5)
+        self._implant_inverse_kinematics()
+
+    def _implant_metadata(self, robot_metadata):
+        self.init_position = robot_metadata.init_position
+        self.description_file = robot_metadata.description_file_location
+        self.control_joints_id = robot_metadata.control_joints_id
+        self.control_joints_neutral_position = (
+            robot_metadata.control_joints_neutral_position
+        )
+        self.effector_joint_id = robot_metadata.effector_joint_id
+        self.effector_link_id = robot_metadata.effector_link_id
+        self.effector_displacement_limit = robot_metadata.effector_displacement_limit
+        self.effector_lateral_friction = robot_metadata.effector_lateral_friction
+        self.effector_spinning_friction = robot_metadata.effector_spinning_friction
+        self.inverse_kinematics_displacement_limit = (
+            robot_metadata.inverse_kinematics_displacement_limit
+        )
+        self.inverse_kinematics_backend = constants.InverseKinematicsBackend(
+            robot_metadata.inverse_kinematics_backend
+        )
+        self.inverse_kinematics_damping = robot_metadata.inverse_kinematics_damping
+        self.inverse_kinematics_max_iterations = (
+            robot_metadata.inverse_kinematics_max_iterations
+        )
+        self.inverse_kinematics_tolerance = robot_metadata.inverse_kinematics_tolerance
+
+    def _implant_inverse_kinematics(self):
+        """the bullet backend keeps the solver of RobotEntity"""
+        if self.inverse_kinematics_backend != constants.InverseKinematicsBackend.DLS:
+            return
+        chain = KinematicChain.from_urdf(self.description_file, self.effector_link_id)
+        solver = DampedLeastSquaresSolver(
+            chain,
+            damping=self.inverse_kinematics_damping,
+            max_iterations=self.inverse_kinematics_max_iterations,
+            tolerance=self.inverse_kinematics_tolerance,
+        )
+        self._configure_inverse_kinematics(
+            solver, base_position=np.add(self.init_position, self.base_offset)
+        )
+
+    def _load_model(self, client):
+        model = client.loadURDF(
+            fileName=resolve_description_file(self.description_file, self.headless),
+            basePosition=np.add(self.init_position, self.base_offset),
+            useFixedBase=True,
+            flags=p.URDF_ENABLE_CACHED_GRAPHICS_SHAPES,
+        )
+        return model
+
+    def reset_model(self):
+        self._set_joint_angles(
+            joints=self.control_joints_id, angles=self.control_joints_neutral_position
+        )
+        self._set_ee_friction(
+            self.effector_joint_id,
+            self.effector_lateral_friction,
+            self.effector_spinning_friction,
+        )
+
+    def inverse_kinematics_request(self, action):
+        """chain root frame target and warm start, solved in bulk by a batched env"""
+        target_ee_position = self._effector_target_position(
+            action, self.inverse_kinematics_displacement_limit, self.effector_link_id
+        )
+        return (
+            target_ee_position - self.inverse_kinematics_base,
+            self.inverse_kinematics_warm_start(),
+        )
+
+    def act(self, action, arm_angles=None):
+        """arm_angles skips the inverse kinematics when they were solved in bulk,
+        the motor targets are written into a buffer owned by the robot"""
+        finger_joint, other_finger_joint = self.effector_joint_id
+        self._fingers_terms[0] = self._get_joint_angle(
+            finger_joint
+        ) + self._get_joint_angle(other_finger_joint)
+        self._fingers_terms[1] = action[-1]
+        fingers_width, fingers_action = self._fingers_terms
+        target_fingers_width = fingers_width + fingers_action * self._fingers_limit
+
+        if arm_angles is None:
+            arm_angles = self._effector_displacement_to_target_arm_angles(
+                action,
+                self.inverse_kinematics_displacement_limit,
+                self.effector_link_id,
+            )
+
+        n_arm_joints = len(arm_angles)
+        self._control_target[:n_arm_joints] = arm_angles
+        self._control_target[n_arm_joints:].fill(target_fingers_width * self._half)
+        self.control_target = self._control_target
+        self.robot_client.setJointMotorControlArray(
+            self.model,
+            jointIndices=self.control_joints_id,
+            controlMode=p.POSITION_CONTROL,
+            targetPositions=self._control_target,
+        )
+
+    def is_settled(self, velocity_tolerance, position_tolerance) -> bool:
+        """arm joints at their last target and every control joint at rest,
+        fingers may stall on a joint limit so only their velocity is checked"""
+        if self.control_target is None:
+            return False
+        snapshot = self._read_state_snapshot()
+        for joint, target in zip(self.control_joints_id, self.control_target):
+            if abs(snapshot.joint_velocities[joint]) > velocity_tolerance:
+                return False
+            if joint in self.effector_joint_id:
+                continue
+            if abs(snapshot.joint_positions[joint] - target) > position_tolerance:
+                return False
+        return True
+
+    def get_observation(self, out=None):
+        """out receives the observation in place instead of a new array"""
+        if out is not None:
+            self._get_ee_position(self.effector_link_id, out=self._position)
+            np.subtract(self._position, self.base_offset, out=self._position)
+            out[:3] = self._position
+            self._get_ee_velocity(self.effector_link_id, out=out[3:6])
+            out[6] = self._get_joint_angle(
+                self.effector_joint_id[0]
+            ) + self._get_joint_angle(self.effector_joint_id[1])
+            return out
+        ee_position = self._get_ee_position(self.effector_link_id) - self.base_offset
+        ee_velocity = self._get_ee_velocity(self.effector_link_id)
+        fingers_width = self._get_fingers_width(self.effector_joint_id)
+        observation = np.concatenate(
+            (ee_position, ee_velocity, [fingers_width]), dtype=np.float32
+        )
+        return observation
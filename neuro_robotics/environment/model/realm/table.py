@@ -0,0 +1,29 @@
+import numpy as np
+import pybullet as p
+
+from neuro_robotics.environment.abstract import EnvEntity
+from neuro_robotics.environment.assets import resolve_description_file
+
+
+class Table(EnvEntity):
+    def __init__(self, client, metadata, base_offset=None, headless=False):
+        """metadata is the depiction of this body in the realm manifest"""
+        self.headless = headless
+        self._implant_metadata(metadata)
+        self.base_offset = (
+            np.zeros(3) if base_offset is None else np.array(base_offset, dtype=float)
+        )
+        self.table_client = client
+        self.model = self._load_model(self.table_client)
+
+    def _implant_metadata(self, table_metadata):
+        self.init_position = table_metadata.init_position
+        self.description_file = table_metadata.description_file_location
+
+    def _load_model(self, client):
+        model = client.loadURDF(
+            fileName=resolve_description_file(self.description_file, self.headless),
+            basePosition=np.add(self.init_position, self.base_offset),
+            flags=p.URDF_ENABLE_CACHED_GRAPHICS_SHAPES,
+        )
+        return model
@@ -5,30 +5,79 @@ from typing import Iterator
 import gym
 import numpy as np
 import pybullet as p
-from pybullet_utils import bullet_client as bc
 
-from .model import PandaEnv
+from .model import create_realm
+from .rendering import OffscreenRenderer
+from .rendering import PixelObservationSettings
+from .rendering import PixelObserver
+from .rendering import RenderSettings
+from .sampling import GoalCurriculum
+from .sampling import GoalSampler
+from .sampling import GoalSamplingSettings
+from .simulation import CachedBulletClient
+from .simulation import SimulationSettings
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common import seeding
+from neuro_robotics.utils.common.profiling import StepProfiler
 
 
 class NeuroRoboticsEnv(gym.Env):
 
     metadata = {"render.modes": ["human", "rgb_array"]}
 
-    def __init__(self):
+    def __init__(
+        self,
+        reset_mode=constants.ResetMode.FULL.value,
+        realm=constants.Realm.PANDA.value,
+        simulation=None,
+        headless=False,
+        rendering=None,
+        observation=None,
+        goal_sampling=None,
+        seed=None,
+        profile=False,
+        copy_observations=True,
+    ):
+        """headless loads collision-only descriptions, rendering shows bare collision shapes,
+        profile records per-phase step latencies, see get_profile, copy_observations
+        False returns realm buffer views valid until the next step instead of owned
+        arrays, for callers that copy every observation before stepping again"""
+        self.reset_mode = constants.ResetMode(reset_mode)
+        self.simulation = SimulationSettings.from_dict(simulation)
+        self.render_settings = RenderSettings.from_dict(rendering)
+        self.observation_settings = PixelObservationSettings.from_dict(observation)
+        self.goal_sampling = GoalSamplingSettings.from_dict(goal_sampling)
+        self._renderer = None
+        self.profiler = StepProfiler(enabled=profile)
+        self.copy_observations = copy_observations
         self.connection_type = p.DIRECT
-        self.physics_client = bc.BulletClient(connection_mode=self.connection_type)
+        self.physics_client = CachedBulletClient(connection_mode=self.connection_type)
 
         self._initialize_simulation()
-        self.realm = PandaEnv(self.physics_client)
-        self.realm.set_env()
+        self.realm = create_realm(realm, self.physics_client, headless=headless)
+        self.realm.set_env(
+            use_reachability_index=self.goal_sampling.use_reachability_index
+        )
+        self.pixel_observer = None
+        if self.observation_settings.use_pixels:
+            self.pixel_observer = PixelObserver(
+                self.physics_client, self.observation_settings
+            )
 
-        # TODO: Remove that shit
-        self.seed()
-        self.realm.goal.set_random_seed(self.np_random)
+        self.curriculum = None
+        if self.goal_sampling.curriculum.use:
+            self.curriculum = GoalCurriculum(self.goal_sampling.curriculum)
+        self.seed(seed)
+        self.episode_seed = None
+        self.episode_bucket = None
+        self._episode_success = False
+        if self.reset_mode == constants.ResetMode.SNAPSHOT:
+            self.realm.capture_canonical_state()
 
         obs = self.reset()
         action_shape = (4,)
         self.action_space = gym.spaces.Box(-1.0, 1.0, shape=action_shape)
+        self._action = np.zeros(action_shape, dtype=self.action_space.dtype)
         observation_dict = self._create_observation_dict(obs)
         self.observation_space = gym.spaces.Dict(observation_dict)
 
@@ -38,16 +87,62 @@ class NeuroRoboticsEnv(gym.Env):
         return self.timestep * self.n_substeps
 
     def _create_observation_dict(self, obs):
-        obs_shape = obs["observation"].shape
         desired_goal_shape = obs["desired_goal"].shape
         achieved_goal_shape = obs["achieved_goal"].shape
         observation_dict = dict(
-            observation=gym.spaces.Box(-10.0, 10.0, shape=obs_shape),
             desired_goal=gym.spaces.Box(-10.0, 10.0, shape=desired_goal_shape),
             achieved_goal=gym.spaces.Box(-10.0, 10.0, shape=achieved_goal_shape),
         )
+        for key, value in obs.items():
+            if key in observation_dict:
+                continue
+            if value.dtype == np.uint8:
+                observation_dict[key] = self.pixel_observer.observation_space
+            else:
+                observation_dict[key] = gym.spaces.Box(-10.0, 10.0, shape=value.shape)
         return observation_dict
 
+    def _attach_pixels(self, observation, reset=False):
+        """Add the stacked camera frames of the current scene.
+        In pixels mode they replace the state vector under ``observation``, in
+        both mode they are added under ``pixels``. The frames are a view of the
+        observer ring buffer and stay valid until the next step.
+        """
+        if self.pixel_observer is None:
+            return observation
+        pixels = self.pixel_observer.reset() if reset else self.pixel_observer.observe()
+        if self.observation_settings.mode == constants.ObservationMode.PIXELS.value:
+            observation["observation"] = pixels
+        else:
+            observation["pixels"] = pixels
+        return observation
+
+    def _deliver(self, observation):
+        """the realm and pixel buffers are reused, copied only when asked to"""
+        if not self.copy_observations:
+            return observation
+        return {key: value.copy() for key, value in observation.items()}
+
+    def memory_per_transition(self):
+        """Bytes of every observation key a replay buffer keeps per transition.
+        Observation and next observation are both stored, goals as float32 and
+        pixels as uint8, e.g. 84x84 rgb stacked 3 times is about 127 kB.
+        """
+        observation = self.realm.generate_observation_matrix()
+        memory = {
+            key: 2 * value.size * np.dtype(np.float32).itemsize
+            for key, value in observation.items()
+        }
+        if self.pixel_observer is not None:
+            pixels_key = (
+                "observation"
+                if self.observation_settings.mode
+                == constants.ObservationMode.PIXELS.value
+                else "pixels"
+            )
+            memory[pixels_key] = self.pixel_observer.memory_per_transition()
+        return memory
+
     def _initialize_simulation(self):
         self.physics_client.resetSimulation()
 
@@ -55,56 +150,119 @@ class NeuroRoboticsEnv(gym.Env):
         self.physics_client.configureDebugVisualizer(p.COV_ENABLE_MOUSE_PICKING, 0)
 
         self.steps = 0
-        self.n_substeps = 20
-        self.timestep = 1.0 / 500
-        self.physics_client.setTimeStep(self.timestep)
+        self.n_substeps = self.simulation.n_substeps
+        self.timestep = self.simulation.timestep
+        self.simulation.apply(self.physics_client)
         self.physics_client.setGravity(0, 0, -9.81)
 
-    def _discard_target_imposition(self, observation):
-        desired_goal = observation["desired_goal"]
-        achieved_goal = observation["achieved_goal"]
-        is_success = self.realm.is_success(achieved_goal, desired_goal)
-        imposing_targets: bool = np.allclose(
-            achieved_goal, desired_goal, rtol=1e-1, atol=5e-2
-        )
-        initial_step: bool = True if not self.steps else False
-        return initial_step and (imposing_targets or is_success)
-
     def step(self, action):
+        profiler = self.profiler
+        step_start = tick = profiler.now()
         self.steps += 1
-        action = action.copy()
-        action = np.clip(action, self.action_space.low, self.action_space.high)
+        action = np.clip(
+            action, self.action_space.low, self.action_space.high, out=self._action
+        )
+        tick = profiler.lap(constants.ProfilePhase.ACTION_CLIP, tick)
         self.realm.robot.act(action)
+        tick = profiler.lap(constants.ProfilePhase.ACT, tick)
 
-        for _ in range(self.n_substeps):
-            self.physics_client.stepSimulation()
+        substeps = self._step_physics()
+        self.realm.invalidate_state_snapshot()
+        tick = profiler.lap(constants.ProfilePhase.PHYSICS, tick)
 
-        observation = self.realm.generate_observation_matrix()
+        observation = self.realm.generate_observation_matrix(in_place=True)
         achieved_goal = observation["achieved_goal"]
         desired_goal = observation["desired_goal"]
 
-        info = {"is_success": self.realm.is_success(achieved_goal, desired_goal)}
+        observation = self._deliver(self._attach_pixels(observation))
+        tick = profiler.lap(constants.ProfilePhase.OBSERVATION, tick)
+        info = {
+            "is_success": self.realm.is_success(achieved_goal, desired_goal),
+            "episode_seed": self.episode_seed,
+        }
+        if self.curriculum is not None:
+            info["curriculum_level"] = self.curriculum.level
+            self._episode_success = info["is_success"]
+        if self.simulation.adaptive_substeps.use:
+            info["substeps"] = substeps
         reward = self.realm.calculate_reward(achieved_goal, desired_goal, info)
         done = self.realm.recalculate_done(self.steps, info)
+        profiler.lap(constants.ProfilePhase.REWARD, tick)
+        profiler.lap(constants.ProfilePhase.STEP, step_start)
         return observation, reward, done, info
 
+    def _step_physics(self) -> int:
+        """Run the substep loop, returns the number of substeps simulated.
+        In adaptive mode the loop exits early once the realm has settled.
+        """
+        adaptive = self.simulation.adaptive_substeps
+        for substep in range(1, self.n_substeps + 1):
+            self.physics_client.stepSimulation()
+            if (
+                adaptive.use
+                and substep >= adaptive.min_substeps
+                and substep % adaptive.check_interval == 0
+            ):
+                self.realm.invalidate_state_snapshot()
+                if self.realm.is_settled(
+                    adaptive.velocity_tolerance, adaptive.position_tolerance
+                ):
+                    return substep
+        return self.n_substeps
+
     def seed(self, seed=None):
-        self.np_random, seed = gym.utils.seeding.np_random(seed)
+        """Seed the env generator, every episode seed is drawn from it."""
+        self.np_random, seed = seeding.make_generator(seed)
+        self.goal_sampler = GoalSampler(
+            self.realm.goal,
+            self.realm.distance_threshold,
+            self.np_random,
+            self.goal_sampling,
+            curriculum=self.curriculum,
+        )
         return [seed]
 
-    def reset(self):
+    def reset(self, seed=None, curriculum_level=None):
+        """Start an episode whose goal and target sampling is fixed by its seed.
+        Without ``seed`` the episode seed is drawn from the env generator, passing
+        a logged ``info["episode_seed"]`` replays that episode deterministically,
+        under a curriculum together with its logged ``info["curriculum_level"]``.
+        """
+        reset_start = self.profiler.now()
+        self._record_episode_outcome()
         self.steps = 0
+        conditions = self.goal_sampler.next(seed, curriculum_level)
+        self.episode_seed = conditions.episode_seed
+        self.episode_bucket = conditions.bucket
+        self.realm.goal.set_generator(seeding.make_generator(self.episode_seed)[0])
         try:
             with self.no_rendering():
-                self.realm.reset_env()
+                self.realm.reset_env(
+                    restore_snapshot=self.reset_mode == constants.ResetMode.SNAPSHOT,
+                    desired_goal=conditions.desired_goal,
+                )
         except Exception:
             raise SystemError("Could not initialize simulator environment")
-        observation = self.realm.generate_observation_matrix()
-        while self._discard_target_imposition(observation):
-            desired_goal: np.ndarray = self.realm.goal.sample_goal()
-            observation["desired_goal"] = desired_goal
+        observation = self._attach_pixels(
+            self.realm.generate_observation_matrix(in_place=True), reset=True
+        )
+        observation = self._deliver(observation)
+        self.profiler.lap(constants.ProfilePhase.RESET, reset_start)
         return observation
 
+    def _record_episode_outcome(self):
+        """the last success of an episode that has been stepped feeds the curriculum"""
+        if self.curriculum is None or not self.steps:
+            return
+        self.curriculum.record(self.episode_bucket, self._episode_success)
+        self._episode_success = False
+
+    def curriculum_statistics(self):
+        """Level and rolling success rate of every unlocked goal band."""
+        if self.curriculum is None:
+            return {}
+        return self.curriculum.statistics()
+
     def close(self):
         self.physics_client.disconnect()
 
@@ -119,41 +277,38 @@ class NeuroRoboticsEnv(gym.Env):
             self.physics_client.COV_ENABLE_RENDERING, 1
         )
 
+    def get_profile(self):
+        """Latency statistics of every profiled phase, in microseconds."""
+        return self.profiler.summary()
+
+    def profile_snapshot(self):
+        """Raw phase histograms, merged across workers by the profiling callback."""
+        return self.profiler.snapshot()
+
+    def reset_profile(self):
+        self.profiler.clear()
+
+    def cache_statistics(self):
+        """Hit/miss counters of the bullet state cache."""
+        return self.physics_client.cache_statistics()
+
     @property
     def compute_reward(self):
-        return self.realm.calculate_reward
-
-    # TODO: reimplement
-    def render(self, mode="human"):
-        self.physics_client.configureDebugVisualizer(
-            self.physics_client.COV_ENABLE_SINGLE_STEP_RENDERING
-        )
-        time.sleep(self.dt)  # wait to seems like real speed
-
-        view_matrix = p.computeViewMatrixFromYawPitchRoll(
-            cameraTargetPosition=[0.5, 0.4, -0.8],
-            distance=3,
-            yaw=0,
-            pitch=-50,
-            roll=1,
-            upAxisIndex=2,
-        )
-        proj_matrix = p.computeProjectionMatrixFOV(
-            fov=60, aspect=float(960) / 720, nearVal=0.1, farVal=100.0
-        )
-        (_, _, px, _, _) = p.getCameraImage(
-            width=960,
-            height=720,
-            viewMatrix=view_matrix,
-            projectionMatrix=proj_matrix,
-            renderer=p.ER_BULLET_HARDWARE_OPENGL,
-        )
+        return self.realm.reward_kernel.compute_reward
 
-        rgb_array = np.array(px, dtype=np.uint8)
-        rgb_array = np.reshape(rgb_array, (720, 960, 4))
+    @property
+    def renderer(self) -> OffscreenRenderer:
+        """created on first use, envs that never render keep no frame buffers"""
+        if self._renderer is None:
+            self._renderer = OffscreenRenderer(
+                self.physics_client, self.render_settings
+            )
+        return self._renderer
 
-        rgb_array = rgb_array[:, :, :3]
-        return rgb_array
+    def render(self, mode="human"):
+        if mode == "human":
+            time.sleep(self.dt)  # wait to seems like real speed
+        return self.renderer.render()
 
     def __repr__(self):
         return "NeuroRobotics environment has been instantiated"
@@ -0,0 +1,6 @@
+from .offscreen_renderer import OffscreenRenderer
+from .pixel_observer import FrameRingBuffer
+from .pixel_observer import PixelObserver
+from .render_settings import CameraSettings
+from .render_settings import PixelObservationSettings
+from .render_settings import RenderSettings
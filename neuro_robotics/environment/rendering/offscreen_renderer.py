@@ -0,0 +1,56 @@
+import numpy as np
+import pybullet as p
+
+from .render_settings import RenderSettings
+from neuro_robotics.utils.common import constants
+
+BULLET_RENDERERS = {
+    constants.RendererBackend.TINY.value: p.ER_TINY_RENDERER,
+    constants.RendererBackend.OPENGL.value: p.ER_BULLET_HARDWARE_OPENGL,
+}
+
+
+class OffscreenRenderer:
+    """Render rgb frames of a bullet client without a display.
+
+    Camera matrices are computed once, the segmentation mask is never produced
+    and frames are written into a small pool of preallocated buffers. A returned
+    frame stays valid for the next ``pool_size - 1`` renders, copy it to keep it.
+    """
+
+    def __init__(self, client, settings: RenderSettings = RenderSettings()):
+        self.client = client
+        self.settings = settings
+        self.width, self.height = settings.width, settings.height
+        self.renderer = BULLET_RENDERERS[settings.renderer]
+        self.view_matrix, self.projection_matrix = settings.camera.matrices(
+            client, self.width / self.height
+        )
+        self._frame_pool = np.zeros(
+            (max(settings.pool_size, 1), self.height, self.width, 3), dtype=np.uint8
+        )
+        self._pool_idx = 0
+        self.frames_rendered = 0
+
+    def render(self) -> np.ndarray:
+        """Render the current scene.
+        Returns:
+            np.ndarray: Pooled rgb frame, as (height, width, 3) uint8.
+        """
+        _, _, pixels, _, _ = self.client.getCameraImage(
+            width=self.width,
+            height=self.height,
+            viewMatrix=self.view_matrix,
+            projectionMatrix=self.projection_matrix,
+            renderer=self.renderer,
+            flags=p.ER_NO_SEGMENTATION_MASK,
+        )
+        frame = self._frame_pool[self._pool_idx]
+        self._pool_idx = (self._pool_idx + 1) % len(self._frame_pool)
+        # bullet hands back rgba, a numpy array when built with numpy support
+        rgba = np.reshape(
+            np.asarray(pixels, dtype=np.uint8), (self.height, self.width, 4)
+        )
+        np.copyto(frame, rgba[:, :, :3])
+        self.frames_rendered += 1
+        return frame
@@ -0,0 +1,134 @@
+from typing import Tuple
+
+import gym
+import numpy as np
+import pybullet as p
+
+from .offscreen_renderer import BULLET_RENDERERS
+from .render_settings import PixelObservationSettings
+from neuro_robotics.utils.common import constants
+
+
+class FrameRingBuffer:
+    """Stack of the last ``frame_stack`` uint8 frames, returned without copying.
+
+    Every frame is written twice, at ``cursor`` and ``cursor + frame_stack``, so
+    the ordered stack is always the contiguous slice ``[cursor + 1, cursor +
+    frame_stack]`` and reshapes to a ``(frame_stack * C, H, W)`` view. The view
+    is only valid until the next push, consumers (vec envs, replay buffers) copy
+    it when storing. Two rings alternate between episodes so the terminal
+    observation of an episode survives the reset that follows it.
+    """
+
+    def __init__(self, frame_stack: int, frame_shape: Tuple[int, int, int]):
+        self.frame_stack = frame_stack
+        self.frame_shape = frame_shape
+        self._rings = np.zeros((2, 2 * frame_stack) + frame_shape, dtype=np.uint8)
+        self._ring_idx = 0
+        self._cursor = 0
+
+    @property
+    def observation_shape(self) -> Tuple[int, int, int]:
+        channels, height, width = self.frame_shape
+        return (self.frame_stack * channels, height, width)
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.observation_shape))
+
+    def slot(self) -> np.ndarray:
+        """frame the next push writes, render straight into it"""
+        return self._rings[self._ring_idx, self._cursor]
+
+    def push(self) -> np.ndarray:
+        """commit the frame written into ``slot`` and return the stack view"""
+        ring = self._rings[self._ring_idx]
+        ring[self._cursor + self.frame_stack] = ring[self._cursor]
+        start = self._cursor + 1
+        self._cursor = (self._cursor + 1) % self.frame_stack
+        return ring[start : start + self.frame_stack].reshape(self.observation_shape)
+
+    def start_episode(self):
+        """switch rings, the previous stack view stays untouched"""
+        self._ring_idx = 1 - self._ring_idx
+        self._cursor = 0
+
+    def fill(self) -> np.ndarray:
+        """repeat the frame written into ``slot`` over the whole stack"""
+        ring = self._rings[self._ring_idx]
+        ring[self._cursor + 1 :] = ring[self._cursor]
+        return self.push()
+
+
+class PixelObserver:
+    """Render small channel-first uint8 camera observations of a bullet client.
+
+    Rgb is taken straight from the color buffer, depth is linearised between the
+    camera near and far planes and quantised to 255 levels. Memory per stored
+    observation is ``frame_stack * channels * height * width`` bytes, replay
+    buffers keep the next observation as well, see ``memory_per_transition``.
+    """
+
+    def __init__(self, client, settings: PixelObservationSettings):
+        self.client = client
+        self.settings = settings
+        self.width, self.height = settings.width, settings.height
+        self.renderer = BULLET_RENDERERS[settings.renderer]
+        self.use_rgb = settings.channels != constants.PixelChannels.DEPTH.value
+        self.use_depth = settings.channels != constants.PixelChannels.RGB.value
+        self.view_matrix, self.projection_matrix = settings.camera.matrices(
+            client, self.width / self.height
+        )
+        self.frames = FrameRingBuffer(
+            settings.frame_stack, (settings.n_channels, self.height, self.width)
+        )
+
+    @property
+    def observation_space(self) -> gym.spaces.Box:
+        return gym.spaces.Box(
+            0, 255, shape=self.frames.observation_shape, dtype=np.uint8
+        )
+
+    def memory_per_transition(self) -> int:
+        """bytes of pixel data a replay buffer keeps per transition (obs and next obs)"""
+        return 2 * self.frames.nbytes
+
+    def _render_into_slot(self):
+        _, _, rgba, depth, _ = self.client.getCameraImage(
+            width=self.width,
+            height=self.height,
+            viewMatrix=self.view_matrix,
+            projectionMatrix=self.projection_matrix,
+            renderer=self.renderer,
+            flags=p.ER_NO_SEGMENTATION_MASK,
+        )
+        slot = self.frames.slot()
+        channel = 0
+        if self.use_rgb:
+            rgba = np.reshape(
+                np.asarray(rgba, dtype=np.uint8), (self.height, self.width, 4)
+            )
+            np.copyto(slot[:3], rgba[:, :, :3].transpose(2, 0, 1))
+            channel = 3
+        if self.use_depth:
+            camera = self.settings.camera
+            depth = np.reshape(
+                np.asarray(depth, dtype=np.float32), (self.height, self.width)
+            )
+            linear_depth = (
+                camera.far
+                * camera.near
+                / (camera.far - (camera.far - camera.near) * depth)
+            )
+            np.multiply(linear_depth, 255.0 / camera.far, out=linear_depth)
+            np.clip(linear_depth, 0, 255, out=linear_depth)
+            slot[channel] = linear_depth
+
+    def reset(self) -> np.ndarray:
+        self.frames.start_episode()
+        self._render_into_slot()
+        return self.frames.fill()
+
+    def observe(self) -> np.ndarray:
+        self._render_into_slot()
+        return self.frames.push()
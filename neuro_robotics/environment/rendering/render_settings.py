@@ -0,0 +1,125 @@
+from typing import Optional
+from typing import Tuple
+
+from attrs import define
+from attrs import field
+
+from neuro_robotics.utils.common import constants
+
+
+@define(frozen=True)
+class CameraSettings:
+    """orbit camera looking at the realm, angles in degrees"""
+
+    target_position: Tuple[float, float, float] = field(
+        default=(0.5, 0.4, -0.8), converter=tuple
+    )
+    distance: float = 3.0
+    yaw: float = 0.0
+    pitch: float = -50.0
+    roll: float = 1.0
+    fov: float = 60.0
+    near: float = 0.1
+    far: float = 100.0
+
+    def matrices(self, client, aspect: float) -> Tuple[list, list]:
+        """Compute the view and projection matrices of this camera.
+        Args:
+            client: Bullet client computing the matrices.
+            aspect (float): Width over height of the rendered image.
+        Returns:
+            Tuple[list, list]: View matrix and projection matrix.
+        """
+        view_matrix = client.computeViewMatrixFromYawPitchRoll(
+            cameraTargetPosition=self.target_position,
+            distance=self.distance,
+            yaw=self.yaw,
+            pitch=self.pitch,
+            roll=self.roll,
+            upAxisIndex=2,
+        )
+        projection_matrix = client.computeProjectionMatrixFOV(
+            fov=self.fov, aspect=aspect, nearVal=self.near, farVal=self.far
+        )
+        return view_matrix, projection_matrix
+
+
+def _to_camera_settings(settings) -> CameraSettings:
+    if isinstance(settings, CameraSettings):
+        return settings
+    return CameraSettings(**settings)
+
+
+@define(frozen=True)
+class RenderSettings:
+    """offscreen rendering parameters of a NeuroRobotics env"""
+
+    width: int = 960
+    height: int = 720
+    # tiny | opengl, tiny is the cpu rasterizer and needs no display or gpu
+    renderer: str = field(
+        default=constants.RendererBackend.TINY.value,
+        converter=lambda value: constants.RendererBackend(value).value,
+    )
+    pool_size: int = 2
+    camera: CameraSettings = field(
+        factory=CameraSettings, converter=_to_camera_settings
+    )
+
+    @classmethod
+    def from_dict(cls, settings: Optional[dict]) -> "RenderSettings":
+        return cls(**(settings or {}))
+
+
+# close-up of the workspace, a short far plane keeps depth resolution usable
+PIXEL_OBSERVATION_CAMERA = dict(
+    target_position=(0.35, 0.0, 0.1), distance=1.4, yaw=0.0, pitch=-30.0, far=3.0
+)
+
+
+def _to_observation_camera(settings) -> CameraSettings:
+    if isinstance(settings, CameraSettings):
+        return settings
+    return CameraSettings(**{**PIXEL_OBSERVATION_CAMERA, **(settings or {})})
+
+
+@define(frozen=True)
+class PixelObservationSettings:
+    """camera observation of a NeuroRobotics env, frames are stacked channel-first"""
+
+    # state | pixels | both
+    mode: str = field(
+        default=constants.ObservationMode.STATE.value,
+        converter=lambda value: constants.ObservationMode(value).value,
+    )
+    width: int = 84
+    height: int = 84
+    # rgb | depth | rgbd
+    channels: str = field(
+        default=constants.PixelChannels.RGB.value,
+        converter=lambda value: constants.PixelChannels(value).value,
+    )
+    frame_stack: int = 3
+    renderer: str = field(
+        default=constants.RendererBackend.TINY.value,
+        converter=lambda value: constants.RendererBackend(value).value,
+    )
+    camera: CameraSettings = field(
+        factory=lambda: _to_observation_camera(None), converter=_to_observation_camera
+    )
+
+    @property
+    def use_pixels(self) -> bool:
+        return self.mode != constants.ObservationMode.STATE.value
+
+    @property
+    def n_channels(self) -> int:
+        return {
+            constants.PixelChannels.RGB.value: 3,
+            constants.PixelChannels.DEPTH.value: 1,
+            constants.PixelChannels.RGBD.value: 4,
+        }[self.channels]
+
+    @classmethod
+    def from_dict(cls, settings: Optional[dict]) -> "PixelObservationSettings":
+        return cls(**(settings or {}))
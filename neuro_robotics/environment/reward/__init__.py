@@ -0,0 +1 @@
+from .sparse_reward_kernel import SparseRewardKernel
@@ -0,0 +1,106 @@
+from typing import Optional
+from typing import Union
+
+import numpy as np
+
+# single goal results indexed by the comparison, built once as numpy scalar
+# constructors allocate
+_REWARDS = (-np.float32(False), -np.float32(True))
+_SUCCESSES = (np.float32(False), np.float32(True))
+
+
+class SparseRewardKernel:
+    """Sparse goal reward, ``-1`` outside ``distance_threshold`` and ``0`` inside.
+
+    Batches are compared as squared distances against ``distance_threshold ** 2``
+    inside float32 scratch buffers which grow to the largest batch seen and are
+    then reused, so HER relabeling does not allocate once warmed up.
+    """
+
+    def __init__(self, distance_threshold: float) -> None:
+        self.distance_threshold = distance_threshold
+        self.squared_threshold = np.float32(distance_threshold**2)
+        self._capacity = 0
+        self._goal_dim = 0
+
+    def _reserve(self, batch_size: int, goal_dim: int) -> None:
+        """Grow scratch buffers to hold at least ``batch_size`` goals."""
+        if batch_size <= self._capacity and goal_dim == self._goal_dim:
+            return
+        self._capacity = max(batch_size, 2 * self._capacity)
+        self._goal_dim = goal_dim
+        self._difference = np.empty((self._capacity, goal_dim), dtype=np.float32)
+        self._squared_distance = np.empty(self._capacity, dtype=np.float32)
+        self._mask = np.empty(self._capacity, dtype=bool)
+        self._output = np.empty(self._capacity, dtype=np.float32)
+
+    def squared_distance(
+        self, achieved_goal: np.ndarray, desired_goal: np.ndarray
+    ) -> np.ndarray:
+        """Compute squared distances of a goal batch into the scratch buffer.
+        Args:
+            achieved_goal (np.ndarray): Achieved goals, as (..., goal_dim).
+            desired_goal (np.ndarray): Desired goals, as (..., goal_dim).
+        Returns:
+            np.ndarray: Flat view of the squared distances, overwritten by the next call.
+        """
+        goal_dim = achieved_goal.shape[-1]
+        batch_size = achieved_goal.size // goal_dim
+        self._reserve(batch_size, goal_dim)
+        difference = self._difference[:batch_size]
+        squared_distance = self._squared_distance[:batch_size]
+        np.subtract(
+            achieved_goal.reshape(batch_size, goal_dim),
+            desired_goal.reshape(batch_size, goal_dim),
+            out=difference,
+        )
+        np.multiply(difference, difference, out=difference)
+        np.sum(difference, axis=1, out=squared_distance)
+        return squared_distance
+
+    def compute_reward(
+        self,
+        achieved_goal: np.ndarray,
+        desired_goal: np.ndarray,
+        info=None,
+        out: Optional[np.ndarray] = None,
+    ) -> Union[np.float32, np.ndarray]:
+        """Compute the sparse reward, vectorized over leading dimensions.
+        Args:
+            achieved_goal (np.ndarray): Achieved goals, as (..., goal_dim).
+            desired_goal (np.ndarray): Desired goals, as (..., goal_dim).
+            info: Unused, kept for the gym goal env signature.
+            out (np.ndarray): Optional float32 output of the batch shape.
+        Returns:
+            Union[np.float32, np.ndarray]: A scalar for a single goal, otherwise the
+            rewards as a view of ``out`` or of the kernel buffer (valid until the next call).
+        """
+        squared_distance = self.squared_distance(achieved_goal, desired_goal)
+        if achieved_goal.ndim == 1:
+            return _REWARDS[bool(squared_distance[0] > self.squared_threshold)]
+        mask = self._mask[: squared_distance.size]
+        np.greater(squared_distance, self.squared_threshold, out=mask)
+        return self._mask_to_output(mask, achieved_goal.shape[:-1], out, negate=True)
+
+    def is_success(
+        self,
+        achieved_goal: np.ndarray,
+        desired_goal: np.ndarray,
+        out: Optional[np.ndarray] = None,
+    ) -> Union[np.float32, np.ndarray]:
+        """Return 1.0 where the goal is reached, vectorized like ``compute_reward``."""
+        squared_distance = self.squared_distance(achieved_goal, desired_goal)
+        if achieved_goal.ndim == 1:
+            return _SUCCESSES[bool(squared_distance[0] < self.squared_threshold)]
+        mask = self._mask[: squared_distance.size]
+        np.less(squared_distance, self.squared_threshold, out=mask)
+        return self._mask_to_output(mask, achieved_goal.shape[:-1], out, negate=False)
+
+    def _mask_to_output(self, mask, batch_shape, out, negate: bool) -> np.ndarray:
+        if out is None:
+            out = self._output[: mask.size].reshape(batch_shape)
+        # write through out itself, reshaping a strided out would copy it
+        np.copyto(out, mask.reshape(batch_shape))
+        if negate:
+            np.negative(out, out=out)
+        return out
@@ -0,0 +1,3 @@
+from .rollout_logger import RolloutLogger
+from .rollout_reader import RolloutReader
+from .rollout_replay import replay_episode
@@ -0,0 +1,130 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+import gym
+import numpy as np
+
+from neuro_robotics.utils.common import constants
+
+MANIFEST_FILE = "manifest.json"
+
+
+def observation_columns(prefix: str, space: gym.spaces.Dict) -> Dict[str, tuple]:
+    return {
+        f"{prefix}.{key}": (subspace.shape, np.dtype(subspace.dtype))
+        for key, subspace in space.spaces.items()
+    }
+
+
+class RolloutLogger(gym.Wrapper):
+    """Stream the transitions of a goal env into compressed ``.npz`` shards.
+
+    Every column (``obs.<key>``, ``next_obs.<key>``, ``action``, ``reward``,
+    ``done``, ``truncated``, ``is_success``, ``episode``, ``episode_seed``,
+    ``curriculum_level``, ``step``) is filled into a preallocated block of ``shard_size`` rows,
+    written with ``numpy.savez_compressed`` once full and on ``close``. An
+    observation is copied into the block as soon as it is returned, pixel
+    observations are ring buffer views. Shards are named after the process so
+    vectorized workers can share ``directory``, the column layout is kept in
+    ``manifest.json`` next to them.
+    """
+
+    def __init__(
+        self,
+        env: gym.Env,
+        directory,
+        shard_size: int = constants.RolloutLogging.SHARD_SIZE.value,
+    ):
+        super().__init__(env)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.shard_size = shard_size
+        self.columns = {
+            **observation_columns("obs", env.observation_space),
+            **observation_columns("next_obs", env.observation_space),
+            "action": (env.action_space.shape, np.dtype(env.action_space.dtype)),
+            "reward": ((), np.dtype(np.float32)),
+            "done": ((), np.dtype(bool)),
+            "truncated": ((), np.dtype(bool)),
+            "is_success": ((), np.dtype(bool)),
+            "episode": ((), np.dtype(np.int64)),
+            "episode_seed": ((), np.dtype(np.int64)),
+            "curriculum_level": ((), np.dtype(np.int32)),
+            "step": ((), np.dtype(np.int32)),
+        }
+        self._block = {
+            name: np.zeros((shard_size,) + shape, dtype=dtype)
+            for name, (shape, dtype) in self.columns.items()
+        }
+        self._write_manifest()
+        self._n_rows = 0
+        self._n_shards = 0
+        self._episode = -1
+        self._step = 0
+
+    def _write_manifest(self):
+        manifest_path = self.directory / MANIFEST_FILE
+        if manifest_path.exists():
+            return
+        manifest = {
+            name: {"shape": list(shape), "dtype": dtype.str}
+            for name, (shape, dtype) in self.columns.items()
+        }
+        temporary_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(manifest, indent=2))
+        os.replace(temporary_path, manifest_path)
+
+    def _stage_observation(self, observation):
+        """the observation an upcoming step starts from"""
+        for key, value in observation.items():
+            self._block[f"obs.{key}"][self._n_rows] = value
+
+    def reset(self, **kwargs):
+        observation = self.env.reset(**kwargs)
+        self._stage_observation(observation)
+        self._episode += 1
+        self._step = 0
+        return observation
+
+    def step(self, action):
+        next_observation, reward, done, info = self.env.step(action)
+        row = self._n_rows
+        for key, value in next_observation.items():
+            self._block[f"next_obs.{key}"][row] = value
+        self._block["action"][row] = action
+        self._block["reward"][row] = reward
+        self._block["done"][row] = done
+        self._block["truncated"][row] = info.get("TimeLimit.truncated", False)
+        self._block["is_success"][row] = bool(info.get("is_success", False))
+        self._block["episode"][row] = self._episode
+        episode_seed = info.get("episode_seed")
+        self._block["episode_seed"][row] = -1 if episode_seed is None else episode_seed
+        self._block["curriculum_level"][row] = info.get("curriculum_level", -1)
+        self._block["step"][row] = self._step
+
+        self._n_rows += 1
+        self._step += 1
+        if self._n_rows == self.shard_size:
+            self.flush()
+        self._stage_observation(next_observation)
+        return next_observation, reward, done, info
+
+    def flush(self):
+        """write the rows gathered so far as a shard"""
+        if not self._n_rows:
+            return
+        shard_path = self.directory / (
+            f"rollouts-{os.getpid()}-{self._n_shards:05d}.npz"
+        )
+        np.savez_compressed(
+            shard_path,
+            **{name: column[: self._n_rows] for name, column in self._block.items()},
+        )
+        self._n_rows = 0
+        self._n_shards += 1
+
+    def close(self):
+        self.flush()
+        return super().close()
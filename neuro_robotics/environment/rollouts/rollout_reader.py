@@ -0,0 +1,110 @@
+import json
+from pathlib import Path
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+
+from .rollout_logger import MANIFEST_FILE
+
+
+class RolloutReader:
+    """Stream rollouts written by ``RolloutLogger`` shard by shard.
+
+    Only the requested columns of one shard are decompressed at a time, so a
+    dataset larger than memory can be iterated for offline training or
+    analysis. Episode ids are only unique within a shard file prefix (process).
+    """
+
+    def __init__(self, directory, columns: Optional[Sequence[str]] = None):
+        self.directory = Path(directory)
+        manifest_path = self.directory / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise SystemError(f"No rollout manifest found in {self.directory}")
+        self.manifest = json.loads(manifest_path.read_text())
+        self.columns = list(columns or self.manifest)
+        unknown = set(self.columns) - set(self.manifest)
+        if unknown:
+            raise SystemError(f"Unknown rollout columns: {sorted(unknown)}")
+
+    @property
+    def shard_paths(self) -> List[Path]:
+        return sorted(self.directory.glob("rollouts-*.npz"))
+
+    def __len__(self) -> int:
+        """number of stored transitions, reads only the step column"""
+        return sum(len(chunk["step"]) for chunk in self.chunks(columns=["step"]))
+
+    def chunks(
+        self, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """yield the columns of every shard"""
+        columns = columns or self.columns
+        for shard_path in self.shard_paths:
+            with np.load(shard_path) as shard:
+                yield {name: shard[name] for name in columns}
+
+    def batches(
+        self, batch_size: int, drop_last: bool = False
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """re-chunk the shards into batches of ``batch_size`` transitions"""
+        pending = None
+        for chunk in self.chunks():
+            if pending is not None:
+                chunk = {
+                    name: np.concatenate([pending[name], column])
+                    for name, column in chunk.items()
+                }
+            n_rows = len(next(iter(chunk.values())))
+            start = 0
+            while n_rows - start >= batch_size:
+                yield {
+                    name: column[start : start + batch_size]
+                    for name, column in chunk.items()
+                }
+                start += batch_size
+            pending = {name: column[start:] for name, column in chunk.items()}
+        if pending is not None and len(next(iter(pending.values()))) and not drop_last:
+            yield pending
+
+    def transitions(self) -> Iterator[Dict[str, np.ndarray]]:
+        """yield single transitions, observation keys nested as in the env"""
+        for chunk in self.chunks():
+            for row in range(len(next(iter(chunk.values())))):
+                transition = {}
+                for name, column in chunk.items():
+                    group, _, key = name.partition(".")
+                    if key:
+                        transition.setdefault(group, {})[key] = column[row]
+                    else:
+                        transition[name] = column[row]
+                yield transition
+
+    def find_episode(self, episode_seed: int) -> Dict[str, np.ndarray]:
+        """columns of the logged episode started with ``episode_seed``"""
+        parts = []
+        for chunk in self.chunks(columns=sorted(set(self.columns) | {"episode_seed"})):
+            rows = chunk["episode_seed"] == episode_seed
+            if np.any(rows):
+                parts.append({name: chunk[name][rows] for name in self.columns})
+        if not parts:
+            raise SystemError(
+                f"No episode with seed {episode_seed} in {self.directory}"
+            )
+        return {
+            name: np.concatenate([part[name] for part in parts])
+            for name in self.columns
+        }
+
+    def load(self) -> Dict[str, np.ndarray]:
+        """concatenate every shard in memory"""
+        parts = list(self.chunks())
+        if not parts:
+            raise SystemError(f"No rollout shards found in {self.directory}")
+        return {
+            name: np.concatenate([part[name] for part in parts])
+            for name in self.columns
+        }
@@ -0,0 +1,46 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import gym
+import numpy as np
+
+
+def replay_episode(
+    env: gym.Env,
+    episode_seed: int,
+    actions: np.ndarray,
+    curriculum_level: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Re-simulate a logged episode from its seed and actions.
+    Args:
+        env (gym.Env): NeuroRobotics env, reset with ``seed=episode_seed``.
+        episode_seed (int): The ``info["episode_seed"]`` of the episode.
+        actions (np.ndarray): Actions of the episode, as (n_steps, action_dim).
+        curriculum_level (int): The ``info["curriculum_level"]`` of the episode,
+            needed when it was logged under a goal curriculum.
+    Returns:
+        Dict[str, Any]: Observations, rewards, dones and infos of the replay.
+    """
+    reset_kwargs = dict(seed=episode_seed)
+    if curriculum_level is not None:
+        reset_kwargs["curriculum_level"] = curriculum_level
+    observations: List[Dict[str, np.ndarray]] = [
+        {key: value.copy() for key, value in env.reset(**reset_kwargs).items()}
+    ]
+    rewards, dones, infos = [], [], []
+    for action in actions:
+        observation, reward, done, info = env.step(action)
+        observations.append({key: value.copy() for key, value in observation.items()})
+        rewards.append(reward)
+        dones.append(done)
+        infos.append(info)
+        if done:
+            break
+    return dict(
+        observations=observations,
+        rewards=np.array(rewards, dtype=np.float32),
+        dones=np.array(dones, dtype=bool),
+        infos=infos,
+    )
@@ -0,0 +1,5 @@
+from .goal_curriculum import GoalCurriculum
+from .goal_sampler import EpisodeConditions
+from .goal_sampler import GoalSampler
+from .sampling_settings import CurriculumSettings
+from .sampling_settings import GoalSamplingSettings
@@ -0,0 +1,79 @@
+from typing import Dict
+
+import numpy as np
+
+from .sampling_settings import CurriculumSettings
+
+
+class GoalCurriculum:
+    """Widen the goal distribution as the policy masters the goals it gets.
+
+    Goal difficulty is the distance from the target normalized to [0, 1] over
+    the distances a separated goal can have, see ``GoalSampler.difficulty``, and
+    split into ``n_buckets`` equal bands. Only the first ``level`` bands are
+    sampled. Every band keeps the outcomes of its last ``window`` episodes in a
+    ring buffer with a running success count, so recording an episode and
+    reading a rate are O(1). Once the outermost unlocked band has seen
+    ``min_episodes`` episodes at a ``promote_threshold`` success rate, the next
+    band is unlocked. Bands are never locked again.
+    """
+
+    def __init__(self, settings: CurriculumSettings) -> None:
+        self.settings = settings
+        n_buckets = self.settings.n_buckets
+        if not 1 <= self.settings.initial_buckets <= n_buckets:
+            raise SystemError(
+                f"initial_buckets must lie in [1, {n_buckets}], "
+                f"got {self.settings.initial_buckets}"
+            )
+        self.level = self.settings.initial_buckets
+        self._outcomes = np.zeros((n_buckets, self.settings.window), dtype=bool)
+        self._cursor = [0] * n_buckets
+        self._count = [0] * n_buckets
+        self._successes = [0] * n_buckets
+
+    def bucket(self, difficulty: float) -> int:
+        return int(self.buckets(difficulty))
+
+    def buckets(self, difficulty: np.ndarray) -> np.ndarray:
+        """band of every difficulty, vectorized"""
+        n_buckets = self.settings.n_buckets
+        return np.minimum(
+            (np.asarray(difficulty) * n_buckets).astype(np.int64), n_buckets - 1
+        )
+
+    def record(self, bucket: int, success: bool) -> bool:
+        """store an episode outcome, returns True when a band has been unlocked"""
+        cursor = self._cursor[bucket]
+        if self._count[bucket] == self.settings.window:
+            self._successes[bucket] -= int(self._outcomes[bucket, cursor])
+        else:
+            self._count[bucket] += 1
+        self._outcomes[bucket, cursor] = success
+        self._successes[bucket] += int(success)
+        self._cursor[bucket] = (cursor + 1) % self.settings.window
+        return self._promote()
+
+    def _promote(self) -> bool:
+        frontier = self.level - 1
+        if (
+            self.level == self.settings.n_buckets
+            or self._count[frontier] < self.settings.min_episodes
+            or self.success_rate(frontier) < self.settings.promote_threshold
+        ):
+            return False
+        self.level += 1
+        return True
+
+    def success_rate(self, bucket: int) -> float:
+        """rolling success rate of a band, 0 before its first episode"""
+        if not self._count[bucket]:
+            return 0.0
+        return self._successes[bucket] / self._count[bucket]
+
+    def statistics(self) -> Dict[str, float]:
+        statistics = {"level": self.level}
+        for bucket in range(self.level):
+            statistics[f"success_rate_{bucket}"] = self.success_rate(bucket)
+            statistics[f"episodes_{bucket}"] = self._count[bucket]
+        return statistics
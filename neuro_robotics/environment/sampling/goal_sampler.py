@@ -0,0 +1,170 @@
+from collections import deque
+from typing import NamedTuple
+from typing import Optional
+
+import numpy as np
+
+from .sampling_settings import GoalSamplingSettings
+from neuro_robotics.utils.common import seeding
+
+# a goal within these np.allclose tolerances of the target counts as imposed on it
+SEPARATION_RTOL = 1e-1
+SEPARATION_ATOL = 5e-2
+# candidates drawn once to find the fallback goal and the separated distance range
+FALLBACK_CANDIDATES = 4096
+
+
+class EpisodeConditions(NamedTuple):
+    """initial conditions of one episode, reproduced from its seed and level"""
+
+    episode_seed: int
+    desired_goal: np.ndarray
+    # curriculum band of the goal, 0 without a curriculum
+    bucket: int = 0
+
+
+class GoalSampler:
+    """Draw desired goals separated from the reset target, without a rejection loop.
+
+    Every episode seed maps to its goal through a generator of its own: a batch
+    of ``n_candidates`` goals is drawn in one vectorized call and the first one
+    separated from the target is kept, the precomputed ``fallback_goal`` covers
+    a batch without any. Conditions are generated ``queue_size`` episodes ahead
+    from the env generator, so a reset only pops the queue, and an explicit
+    episode seed yields the same goal as when it was queued.
+
+    With a ``GoalCurriculum`` the distance bands span the separated goals, from
+    the separation radius around the target to the farthest goal, since closer
+    goals are never kept. The first separated candidate within the unlocked
+    bands is kept, and when there is none a goal is drawn from the unlocked part
+    of the calibration pool, so locked bands never get an episode. Queued
+    episodes are dropped whenever the curriculum level changes, and replaying an
+    episode seed needs the level it was logged with.
+    """
+
+    def __init__(
+        self, goal, distance_threshold: float, np_random, settings=None, curriculum=None
+    ) -> None:
+        self.goal = goal
+        self.settings = GoalSamplingSettings.from_dict(settings)
+        self.curriculum = curriculum
+        self.target_position = np.asarray(goal.init_position, dtype=np.float32)
+        self.squared_threshold = np.float32(distance_threshold**2)
+        self.max_distance = self._max_distance()
+        self.np_random = np_random
+        self._calibrate()
+        self._queue = deque()
+        self._queued_level = None
+        self.refill()
+
+    def _max_distance(self) -> float:
+        """distance from the target to the farthest corner of the goal box"""
+        corners = np.stack(
+            np.meshgrid(
+                *zip(self.goal.goal_range_low, self.goal.goal_range_high),
+                indexing="ij",
+            ),
+            axis=-1,
+        ).reshape(-1, 3)
+        corners[:, 2] += self.goal.object_size / 2
+        return float(np.max(np.linalg.norm(corners - self.target_position, axis=1)))
+
+    def difficulty(self, desired_goals: np.ndarray) -> np.ndarray:
+        """distance from the target rescaled from the separation radius to the
+        farthest goal, in [0, 1]"""
+        distance = np.linalg.norm(desired_goals - self.target_position, axis=-1)
+        return np.clip(
+            (distance - self.min_distance) / (self.max_distance - self.min_distance),
+            0.0,
+            1.0,
+        )
+
+    def _calibrate(self) -> None:
+        """Draw the separated goals of a pool fixed for the sampler lifetime.
+        The farthest one is the fallback goal, the nearest one sets the separation
+        radius ``min_distance``, and the pool sorted by difficulty stands in for
+        the candidates of an episode that has none within the unlocked bands.
+        """
+        np_random, _ = seeding.make_generator(0)
+        candidates = self.goal.sample_goals(np_random, FALLBACK_CANDIDATES)
+        candidates = candidates[self.separated(candidates)]
+        if not len(candidates):
+            raise SystemError(
+                f"No goal can be sampled apart from the target {self.target_position}"
+            )
+        distance = np.linalg.norm(candidates - self.target_position, axis=1)
+        order = np.argsort(distance, kind="stable")
+        self.fallback_goal = candidates[order[-1]]
+        self.min_distance = float(distance[order[0]])
+        self._pool_goals = candidates[order]
+        self._pool_difficulty = self.difficulty(self._pool_goals)
+
+    def separated(self, desired_goals: np.ndarray) -> np.ndarray:
+        """Check goals against the target, vectorized over leading dimensions.
+        Args:
+            desired_goals (np.ndarray): Goals in the realm frame, as (..., 3).
+        Returns:
+            np.ndarray: True where a goal is neither imposed on the target nor
+            already reached.
+        """
+        difference = np.abs(desired_goals - self.target_position)
+        imposed = np.all(
+            difference <= SEPARATION_ATOL + SEPARATION_RTOL * np.abs(desired_goals),
+            axis=-1,
+        )
+        reached = np.sum(difference**2, axis=-1) < self.squared_threshold
+        return ~(imposed | reached)
+
+    def conditions(
+        self, episode_seed: int, level: Optional[int] = None
+    ) -> EpisodeConditions:
+        """initial conditions of the episode started with ``episode_seed``,
+        ``level`` defaults to the current curriculum level"""
+        np_random, _ = seeding.make_generator(episode_seed)
+        candidates = self.goal.sample_goals(np_random, self.settings.n_candidates)
+        separated = self.separated(candidates)
+        if self.curriculum is not None:
+            level = self.curriculum.level if level is None else level
+            desired_goal = self._unlocked_goal(np_random, candidates, separated, level)
+            bucket = self.curriculum.bucket(self.difficulty(desired_goal))
+            return EpisodeConditions(int(episode_seed), desired_goal, bucket)
+        if not separated.any():
+            desired_goal = self.fallback_goal.copy()
+        else:
+            desired_goal = candidates[np.argmax(separated)]
+        return EpisodeConditions(int(episode_seed), desired_goal)
+
+    def _unlocked_goal(self, np_random, candidates, separated, level) -> np.ndarray:
+        """first separated candidate in the first ``level`` bands, else a pool goal"""
+        buckets = self.curriculum.buckets(self.difficulty(candidates))
+        unlocked = separated & (buckets < level)
+        if unlocked.any():
+            return candidates[np.argmax(unlocked)]
+        # the pool is sorted by difficulty, its unlocked goals are a prefix
+        pool_buckets = self.curriculum.buckets(self._pool_difficulty)
+        n_unlocked = int(np.searchsorted(pool_buckets, level))
+        return self._pool_goals[np_random.integers(n_unlocked)].copy()
+
+    def refill(self) -> None:
+        """queue the next ``queue_size`` episodes drawn from the env generator"""
+        episode_seeds = self.np_random.integers(
+            seeding.EPISODE_SEED_BOUND, size=self.settings.queue_size
+        )
+        if self.curriculum is not None:
+            self._queued_level = self.curriculum.level
+        self._queue.extend(self.conditions(seed) for seed in episode_seeds)
+
+    def next(
+        self, episode_seed: Optional[int] = None, level: Optional[int] = None
+    ) -> EpisodeConditions:
+        """pop the next queued episode, an explicit seed bypasses the queue"""
+        if episode_seed is not None:
+            return self.conditions(episode_seed, level)
+        if self.curriculum is not None and self._queued_level != self.curriculum.level:
+            self._queue.clear()
+        if not self._queue:
+            self.refill()
+        return self._queue.popleft()
+
+    def __len__(self) -> int:
+        return len(self._queue)
@@ -0,0 +1,41 @@
+from typing import Optional
+
+from attrs import define
+from attrs import field
+
+
+@define(frozen=True)
+class CurriculumSettings:
+    """goal distance bands unlocked as the success rate of the outermost one rises"""
+
+    use: bool = False
+    n_buckets: int = 8
+    initial_buckets: int = 1
+    window: int = 100
+    min_episodes: int = 50
+    promote_threshold: float = 0.6
+
+
+def _to_curriculum_settings(settings) -> CurriculumSettings:
+    if isinstance(settings, CurriculumSettings):
+        return settings
+    return CurriculumSettings(**settings)
+
+
+@define(frozen=True)
+class GoalSamplingSettings:
+    """episode initial conditions drawn ahead of the resets"""
+
+    queue_size: int = 1024
+    n_candidates: int = 32
+    # sample goals and targets from the reachable cells of the realm index
+    use_reachability_index: bool = False
+    curriculum: CurriculumSettings = field(
+        factory=CurriculumSettings, converter=_to_curriculum_settings
+    )
+
+    @classmethod
+    def from_dict(cls, settings: Optional[dict]) -> "GoalSamplingSettings":
+        if isinstance(settings, GoalSamplingSettings):
+            return settings
+        return cls(**(settings or {}))
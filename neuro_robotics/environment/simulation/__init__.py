@@ -0,0 +1,3 @@
+from .cached_bullet_client import CachedBulletClient
+from .simulation_settings import AdaptiveSubstepSettings
+from .simulation_settings import SimulationSettings
@@ -0,0 +1,101 @@
+from typing import Dict
+
+import numpy as np
+import pybullet
+from pybullet_utils import bullet_client as bc
+
+
+def _freeze(value):
+    """turn query arguments into a hashable cache key"""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _cached_query(name: str):
+    query = getattr(pybullet, name)
+
+    def cached(self, *args, **kwargs):
+        key = (name, _freeze(args), _freeze(sorted(kwargs.items())))
+        try:
+            result = self._state_cache[key]
+        except KeyError:
+            self.cache_misses += 1
+            result = query(*args, physicsClientId=self._client, **kwargs)
+            self._state_cache[key] = result
+        else:
+            self.cache_hits += 1
+        return result
+
+    cached.__name__ = name
+    cached.__doc__ = f"``{name}`` memoized until the simulation state changes."
+    return cached
+
+
+def _invalidating_call(name: str):
+    call = getattr(pybullet, name)
+
+    def invalidating(self, *args, **kwargs):
+        self._state_cache.clear()
+        return call(*args, physicsClientId=self._client, **kwargs)
+
+    invalidating.__name__ = name
+    invalidating.__doc__ = f"``{name}`` dropping every memoized state query."
+    return invalidating
+
+
+class CachedBulletClient(bc.BulletClient):
+    """BulletClient memoizing state queries between simulation updates.
+
+    Results of link, joint and base state queries are keyed by their arguments
+    (body, link, flags) and served from memory until the next call that moves
+    the simulation, loads or removes a body or changes its dynamics. Cached
+    results are shared, callers must not mutate them.
+    """
+
+    getLinkState = _cached_query("getLinkState")
+    getLinkStates = _cached_query("getLinkStates")
+    getJointState = _cached_query("getJointState")
+    getJointStates = _cached_query("getJointStates")
+    getBasePositionAndOrientation = _cached_query("getBasePositionAndOrientation")
+    getBaseVelocity = _cached_query("getBaseVelocity")
+
+    stepSimulation = _invalidating_call("stepSimulation")
+    resetSimulation = _invalidating_call("resetSimulation")
+    resetJointState = _invalidating_call("resetJointState")
+    resetJointStatesMultiDof = _invalidating_call("resetJointStatesMultiDof")
+    resetBasePositionAndOrientation = _invalidating_call(
+        "resetBasePositionAndOrientation"
+    )
+    resetBaseVelocity = _invalidating_call("resetBaseVelocity")
+    restoreState = _invalidating_call("restoreState")
+    removeBody = _invalidating_call("removeBody")
+    # a loaded body may reuse the id of a removed one
+    loadURDF = _invalidating_call("loadURDF")
+    loadSDF = _invalidating_call("loadSDF")
+    loadMJCF = _invalidating_call("loadMJCF")
+    createMultiBody = _invalidating_call("createMultiBody")
+    changeDynamics = _invalidating_call("changeDynamics")
+    resetJointStateMultiDof = _invalidating_call("resetJointStateMultiDof")
+
+    def __init__(self, *args, **kwargs):
+        self._state_cache = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        super().__init__(*args, **kwargs)
+
+    def invalidate_state_cache(self) -> None:
+        self._state_cache.clear()
+
+    def cache_statistics(self) -> Dict[str, float]:
+        """Return hit/miss counters for profiling."""
+        n_queries = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / n_queries if n_queries else 0.0,
+        }
+
+    def reset_cache_statistics(self) -> None:
+        self.cache_hits = 0
+        self.cache_misses = 0
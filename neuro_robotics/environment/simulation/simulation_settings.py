@@ -0,0 +1,43 @@
+from typing import Optional
+
+from attrs import define
+from attrs import field
+
+
+@define(frozen=True)
+class AdaptiveSubstepSettings:
+    """early exit of the substep loop once the arm has settled"""
+
+    use: bool = False
+    min_substeps: int = 4
+    check_interval: int = 2
+    velocity_tolerance: float = 1e-2
+    position_tolerance: float = 1e-3
+
+
+def _to_adaptive_settings(settings) -> AdaptiveSubstepSettings:
+    if isinstance(settings, AdaptiveSubstepSettings):
+        return settings
+    return AdaptiveSubstepSettings(**settings)
+
+
+@define(frozen=True)
+class SimulationSettings:
+    """physics stepping parameters of a NeuroRobotics env"""
+
+    timestep: float = 1.0 / 500
+    n_substeps: int = 20
+    solver_iterations: Optional[int] = None
+    adaptive_substeps: AdaptiveSubstepSettings = field(
+        factory=AdaptiveSubstepSettings, converter=_to_adaptive_settings
+    )
+
+    @classmethod
+    def from_dict(cls, settings: Optional[dict]) -> "SimulationSettings":
+        return cls(**(settings or {}))
+
+    def apply(self, client) -> None:
+        """Push timestep and solver parameters to the bullet client."""
+        client.setTimeStep(self.timestep)
+        if self.solver_iterations is not None:
+            client.setPhysicsEngineParameter(numSolverIterations=self.solver_iterations)
@@ -0,0 +1,4 @@
+from .async_vec_video_recorder import AsyncVecVideoRecorder
+from .batched_neuro_robotics import BatchedNeuroRoboticsEnv
+from .shared_memory_vec_env import SharedMemoryVecEnv
+from .vec_env_factory import make_vec_env
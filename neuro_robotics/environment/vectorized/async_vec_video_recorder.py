@@ -0,0 +1,204 @@
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Callable
+from typing import Optional
+
+import numpy as np
+from gym.wrappers.monitoring.video_recorder import ImageEncoder
+from stable_baselines3.common.vec_env.base_vec_env import VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import VecEnvWrapper
+
+from neuro_robotics.utils.common import constants
+
+
+class EncodeStatistics:
+    """running encode latency and frame counters of one recorder"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.frames_encoded = 0
+        self.frames_dropped = 0
+        self.videos_written = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record_encode(self, latency: float):
+        with self._lock:
+            self.frames_encoded += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def record_drop(self):
+        with self._lock:
+            self.frames_dropped += 1
+
+    def record_video(self):
+        with self._lock:
+            self.videos_written += 1
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / max(self.frames_encoded, 1)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "frames_encoded": self.frames_encoded,
+                "frames_dropped": self.frames_dropped,
+                "videos_written": self.videos_written,
+                "mean_encode_latency": self.mean_latency,
+                "max_encode_latency": self.max_latency,
+            }
+
+
+class AsyncVecVideoRecorder(VecEnvWrapper):
+    """Drop-in ``VecVideoRecorder`` that encodes on a background thread.
+
+    ``step`` only renders and copies the frame into a bounded queue, the ffmpeg
+    pipe is fed by a daemon encoder thread. When the encoder falls behind the
+    frame is dropped instead of blocking the training loop and the drop is
+    counted. Encode latency is logged whenever a video is closed.
+    """
+
+    _START, _FRAME, _STOP = range(3)
+
+    def __init__(
+        self,
+        venv: VecEnv,
+        video_folder: str,
+        record_video_trigger: Callable[[int], bool],
+        video_length: int = 200,
+        name_prefix: str = "rl-video",
+        queue_size: int = constants.VideoRecording.QUEUE_SIZE.value,
+        frames_per_sec: int = constants.VideoRecording.FRAMES_PER_SEC.value,
+    ):
+        VecEnvWrapper.__init__(self, venv)
+        self.record_video_trigger = record_video_trigger
+        self.video_folder = os.path.abspath(video_folder)
+        os.makedirs(self.video_folder, exist_ok=True)
+        self.name_prefix = name_prefix
+        self.video_length = video_length
+        self.frames_per_sec = frames_per_sec
+
+        self.step_id = 0
+        self.recording = False
+        self.recorded_frames = 0
+        self.statistics = EncodeStatistics()
+
+        # frames are bounded by the semaphore, start and stop are never dropped
+        self._queue = queue.Queue()
+        self._frame_slots = threading.BoundedSemaphore(queue_size)
+        self._encoder_thread = threading.Thread(
+            target=self._encode_loop, name="video-encoder", daemon=True
+        )
+        self._encoder_thread.start()
+
+    def _encode_loop(self):
+        encoder: Optional[ImageEncoder] = None
+        output_path = None
+        video_latency, video_frames = 0.0, 0
+        while True:
+            kind, payload = self._queue.get()
+            if kind == self._START:
+                output_path, encoder = payload, None
+                video_latency, video_frames = 0.0, 0
+            elif kind == self._FRAME and output_path is not None:
+                start = time.perf_counter()
+                try:
+                    if encoder is None:
+                        encoder = ImageEncoder(
+                            output_path,
+                            payload.shape,
+                            self.frames_per_sec,
+                            self.frames_per_sec,
+                        )
+                    encoder.capture_frame(payload)
+                except Exception as e:
+                    # a broken encoder must never take the training loop down
+                    logging.error(f"could not encode video {output_path}: {e}")
+                    encoder, output_path = None, None
+                    self._frame_slots.release()
+                    continue
+                latency = time.perf_counter() - start
+                self.statistics.record_encode(latency)
+                video_latency += latency
+                video_frames += 1
+            if kind == self._FRAME:
+                self._frame_slots.release()
+            elif kind == self._STOP:
+                if encoder is not None:
+                    encoder.close()
+                    self.statistics.record_video()
+                    logging.info(
+                        f"video {output_path} encoded {video_frames} frames, "
+                        f"mean encode latency "
+                        f"{1e3 * video_latency / max(video_frames, 1):.2f} ms, "
+                        f"{self.statistics.frames_dropped} frames dropped so far"
+                    )
+                encoder, output_path = None, None
+                if payload:
+                    return
+
+    def _capture_frame(self):
+        frame = self.venv.render(mode="rgb_array")
+        if frame is None:
+            return
+        # the renderer hands out pooled frames, they are recycled on the next call
+        if not self._frame_slots.acquire(blocking=False):
+            self.statistics.record_drop()
+            return
+        self._queue.put((self._FRAME, np.array(frame, copy=True)))
+
+    def reset(self):
+        observation = self.venv.reset()
+        self.start_video_recorder()
+        return observation
+
+    def start_video_recorder(self):
+        self.close_video_recorder()
+        video_name = (
+            f"{self.name_prefix}-step-{self.step_id}"
+            f"-to-step-{self.step_id + self.video_length}"
+        )
+        output_path = os.path.join(self.video_folder, f"{video_name}.mp4")
+        self._queue.put((self._START, output_path))
+        self._capture_frame()
+        self.recorded_frames = 1
+        self.recording = True
+
+    def _video_enabled(self) -> bool:
+        return self.record_video_trigger(self.step_id)
+
+    def step_wait(self):
+        observation, rewards, dones, infos = self.venv.step_wait()
+
+        self.step_id += 1
+        if self.recording:
+            self._capture_frame()
+            self.recorded_frames += 1
+            if self.recorded_frames > self.video_length:
+                logging.info(f"saving video to {self.video_folder}")
+                self.close_video_recorder()
+        elif self._video_enabled():
+            self.start_video_recorder()
+
+        return observation, rewards, dones, infos
+
+    def close_video_recorder(self, shutdown: bool = False):
+        if self.recording or shutdown:
+            self._queue.put((self._STOP, shutdown))
+        self.recording = False
+        self.recorded_frames = 1
+
+    def close(self):
+        VecEnvWrapper.close(self)
+        self.close_video_recorder(shutdown=True)
+        self._encoder_thread.join()
+        logging.info(f"video recorder statistics: {self.statistics.as_dict()}")
+
+    def __del__(self):
+        if self._encoder_thread.is_alive():
+            self.close_video_recorder(shutdown=True)
@@ -0,0 +1,277 @@
+import math
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import gym
+import numpy as np
+import pybullet as p
+from stable_baselines3.common.vec_env.base_vec_env import VecEnv
+
+from neuro_robotics.environment.abstract import RobotEntity
+from neuro_robotics.environment.model import create_realm
+from neuro_robotics.environment.model import RealmEnv
+from neuro_robotics.environment.sampling import GoalCurriculum
+from neuro_robotics.environment.sampling import GoalSampler
+from neuro_robotics.environment.sampling import GoalSamplingSettings
+from neuro_robotics.environment.simulation import CachedBulletClient
+from neuro_robotics.environment.simulation import SimulationSettings
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common import seeding
+
+
+class BatchedNeuroRoboticsEnv(VecEnv):
+    """Tile ``num_envs`` Panda realms inside a single bullet client.
+
+    Realms are placed on a square grid so the instances never interact, every
+    arm is advanced by one shared ``stepSimulation`` loop and observations are
+    returned as stacked ``(num_envs, dim)`` arrays. Adaptive substeps are not
+    supported, the slowest arm would decide for all of them.
+    """
+
+    metadata = {"render.modes": []}
+
+    # gym goal env naming -> realm naming
+    realm_method_aliases = {"compute_reward": "calculate_reward"}
+
+    def __init__(
+        self,
+        num_envs: int,
+        max_episode_steps: int = constants.VectorizedEnvironment.MAX_EPISODE_STEPS.value,
+        spacing: float = constants.VectorizedEnvironment.REALM_SPACING.value,
+        realm: str = constants.Realm.PANDA.value,
+        simulation=None,
+        headless: bool = False,
+        goal_sampling=None,
+        seed: Optional[int] = None,
+    ):
+        self.headless = headless
+        self.simulation = SimulationSettings.from_dict(simulation)
+        if self.simulation.adaptive_substeps.use:
+            raise SystemError("The batched env does not support adaptive substeps")
+        self.goal_sampling = GoalSamplingSettings.from_dict(goal_sampling)
+        self.connection_type = p.DIRECT
+        self.physics_client = CachedBulletClient(connection_mode=self.connection_type)
+
+        self._initialize_simulation()
+        self.realms = self._instantiate_realms(num_envs, spacing, realm)
+        self.max_episode_steps = max_episode_steps
+        self.episode_steps = np.zeros(num_envs, dtype=np.int64)
+        # a python int increment would be boxed into a fresh 0-d array every step
+        self._episode_step = np.ones((), dtype=np.int64)
+        self.episode_seeds = np.zeros(num_envs, dtype=np.int64)
+        self.episode_buckets = np.zeros(num_envs, dtype=np.int64)
+        # one curriculum for every realm, they share a process
+        self.curriculum = None
+        if self.goal_sampling.curriculum.use:
+            self.curriculum = GoalCurriculum(self.goal_sampling.curriculum)
+
+        self.seed(seed)
+
+        obs = self._reset_realm(0)
+        action_shape = (4,)
+        action_space = gym.spaces.Box(-1.0, 1.0, shape=action_shape)
+        observation_space = gym.spaces.Dict(self._create_observation_dict(obs))
+        super().__init__(num_envs, observation_space, action_space)
+
+        self._observation_buffer = {
+            key: np.zeros((num_envs,) + value.shape, dtype=np.float32)
+            for key, value in obs.items()
+        }
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._dones = np.zeros(num_envs, dtype=bool)
+        self._actions = np.zeros((num_envs,) + action_shape, dtype=action_space.dtype)
+
+    def _initialize_simulation(self):
+        self.physics_client.resetSimulation()
+
+        self.n_substeps = self.simulation.n_substeps
+        self.timestep = self.simulation.timestep
+        self.simulation.apply(self.physics_client)
+        self.physics_client.setGravity(0, 0, -9.81)
+
+    def _instantiate_realms(
+        self, num_envs: int, spacing: float, realm: str
+    ) -> List[RealmEnv]:
+        """lay realms out on a square grid, the plane is loaded once and shared"""
+        n_columns = math.ceil(math.sqrt(num_envs))
+        realms = []
+        for idx in range(num_envs):
+            row, column = divmod(idx, n_columns)
+            base_offset = np.array([row * spacing, column * spacing, 0.0])
+            realm_env = create_realm(
+                realm,
+                self.physics_client,
+                base_offset=base_offset,
+                headless=self.headless,
+            )
+            realm_env.set_env(
+                load_plane=idx == 0,
+                use_reachability_index=self.goal_sampling.use_reachability_index,
+            )
+            realms.append(realm_env)
+        return realms
+
+    def _create_observation_dict(self, obs):
+        observation_dict = {
+            key: gym.spaces.Box(-10.0, 10.0, shape=value.shape)
+            for key, value in obs.items()
+        }
+        return observation_dict
+
+    def _reset_realm(
+        self, idx: int, seed: Optional[int] = None, curriculum_level=None
+    ) -> Dict[str, np.ndarray]:
+        realm = self.realms[idx]
+        self.episode_steps[idx] = 0
+        conditions = self._goal_samplers[idx].next(seed, curriculum_level)
+        self.episode_seeds[idx] = conditions.episode_seed
+        self.episode_buckets[idx] = conditions.bucket
+        realm.goal.set_generator(seeding.make_generator(conditions.episode_seed)[0])
+        realm.reset_env(desired_goal=conditions.desired_goal)
+        return realm.generate_observation_matrix(in_place=True)
+
+    def _write_observation(self, idx: int, observation: Dict[str, np.ndarray]):
+        for key, buffer in self._observation_buffer.items():
+            buffer[idx] = observation[key]
+
+    def _stacked_observation(self) -> Dict[str, np.ndarray]:
+        return {key: buffer.copy() for key, buffer in self._observation_buffer.items()}
+
+    def reset(self):
+        for idx in range(self.num_envs):
+            self._write_observation(idx, self._reset_realm(idx))
+        return self._stacked_observation()
+
+    def step_async(self, actions: np.ndarray) -> None:
+        np.clip(
+            actions, self.action_space.low, self.action_space.high, out=self._actions
+        )
+
+    def _act(self) -> None:
+        """with a chain solver the inverse kinematics of all arms is one batched solve"""
+        solver = self.realms[0].robot.inverse_kinematics_solver
+        if solver is None:
+            for realm, action in zip(self.realms, self._actions):
+                realm.robot.act(action)
+            return
+
+        requests = [
+            realm.robot.inverse_kinematics_request(action)
+            for realm, action in zip(self.realms, self._actions)
+        ]
+        target_position, warm_start = (np.stack(request) for request in zip(*requests))
+        solution = solver.solve(
+            target_position, RobotEntity.effector_orientation, warm_start
+        )
+        for idx, (realm, action) in enumerate(zip(self.realms, self._actions)):
+            arm_angles = realm.robot.accept_inverse_kinematics(solution, idx)
+            realm.robot.act(action, arm_angles=arm_angles)
+
+    def step_wait(self):
+        self._act()
+
+        for _ in range(self.n_substeps):
+            self.physics_client.stepSimulation()
+        for realm in self.realms:
+            realm.invalidate_state_snapshot()
+
+        self.episode_steps += self._episode_step
+        infos = []
+        for idx, realm in enumerate(self.realms):
+            observation = realm.generate_observation_matrix(in_place=True)
+            achieved_goal = observation["achieved_goal"]
+            desired_goal = observation["desired_goal"]
+
+            info = {
+                "is_success": realm.is_success(achieved_goal, desired_goal),
+                "episode_seed": int(self.episode_seeds[idx]),
+            }
+            if self.curriculum is not None:
+                info["curriculum_level"] = self.curriculum.level
+            reward = realm.calculate_reward(achieved_goal, desired_goal, info)
+            done = realm.recalculate_done(self.episode_steps[idx], info)
+            if self.episode_steps[idx] >= self.max_episode_steps:
+                info["TimeLimit.truncated"] = not done
+                done = True
+            if done:
+                if self.curriculum is not None:
+                    self.curriculum.record(
+                        self.episode_buckets[idx], info["is_success"]
+                    )
+                info["terminal_observation"] = {
+                    key: value.copy() for key, value in observation.items()
+                }
+                observation = self._reset_realm(idx)
+
+            self._write_observation(idx, observation)
+            self._rewards[idx] = reward
+            self._dones[idx] = done
+            infos.append(info)
+
+        return (
+            self._stacked_observation(),
+            self._rewards.copy(),
+            self._dones.copy(),
+            infos,
+        )
+
+    def seed(self, seed: Optional[int] = None) -> List[Optional[int]]:
+        """every realm draws its episode seeds from a generator spawned off ``seed``"""
+        seeds = []
+        self._goal_samplers = []
+        for realm, realm_seed in zip(
+            self.realms, seeding.spawn_seeds(seed, len(self.realms))
+        ):
+            np_random, realm_seed = seeding.make_generator(realm_seed)
+            self._goal_samplers.append(
+                GoalSampler(
+                    realm.goal,
+                    realm.distance_threshold,
+                    np_random,
+                    self.goal_sampling,
+                    curriculum=self.curriculum,
+                )
+            )
+            seeds.append(realm_seed)
+        return seeds
+
+    def reset_realm(
+        self, idx: int, seed: Optional[int] = None, curriculum_level=None
+    ) -> Dict[str, np.ndarray]:
+        """restart a single realm, a logged episode seed and curriculum level
+        replay its episode"""
+        observation = self._reset_realm(idx, seed, curriculum_level)
+        self._write_observation(idx, observation)
+        return {key: value.copy() for key, value in observation.items()}
+
+    def close(self) -> None:
+        self.physics_client.disconnect()
+
+    def get_attr(self, attr_name: str, indices=None) -> List[Any]:
+        target_realms = self._get_target_realms(indices)
+        attr_name = self.realm_method_aliases.get(attr_name, attr_name)
+        return [getattr(realm, attr_name) for realm in target_realms]
+
+    def set_attr(self, attr_name: str, value: Any, indices=None) -> None:
+        for realm in self._get_target_realms(indices):
+            setattr(realm, attr_name, value)
+
+    def env_method(self, method_name: str, *method_args, indices=None, **method_kwargs):
+        method_name = self.realm_method_aliases.get(method_name, method_name)
+        return [
+            getattr(realm, method_name)(*method_args, **method_kwargs)
+            for realm in self._get_target_realms(indices)
+        ]
+
+    def env_is_wrapped(self, wrapper_class, indices=None) -> List[bool]:
+        return [False for _ in self._get_target_realms(indices)]
+
+    def _get_target_realms(self, indices) -> Sequence[RealmEnv]:
+        indices = self._get_indices(indices)
+        return [self.realms[idx] for idx in indices]
+
+    def __repr__(self):
+        return f"BatchedNeuroRobotics environment with {self.num_envs} realms"
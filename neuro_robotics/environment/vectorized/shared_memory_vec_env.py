@@ -0,0 +1,218 @@
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import gym
+import numpy as np
+from stable_baselines3.common.env_util import is_wrapped
+from stable_baselines3.common.vec_env.base_vec_env import CloudpickleWrapper
+from stable_baselines3.common.vec_env.base_vec_env import VecEnv
+
+from neuro_robotics.utils.common import seeding
+
+
+def _attach_buffers(layout: Dict[str, tuple]):
+    """map the parent shared memory blocks into numpy arrays"""
+    handles, buffers = [], {}
+    for key, (name, shape, dtype) in layout.items():
+        # workers share the parent resource tracker, the parent unlinks on close
+        handle = shared_memory.SharedMemory(name=name)
+        handles.append(handle)
+        buffers[key] = np.ndarray(shape, dtype=dtype, buffer=handle.buf)
+    return handles, buffers
+
+
+def _write_observation(buffers, env_idx, observation):
+    for key, buffer in buffers.items():
+        buffer[env_idx] = observation[key]
+
+
+def _worker(remote, parent_remote, env_fn_wrapper: CloudpickleWrapper) -> None:
+    parent_remote.close()
+    env = env_fn_wrapper.var()
+    env_idx, handles, buffers = None, [], {}
+    while True:
+        try:
+            cmd, data = remote.recv()
+            if cmd == "step":
+                observation, reward, done, info = env.step(data)
+                if done:
+                    info["terminal_observation"] = observation
+                    observation = env.reset()
+                _write_observation(buffers, env_idx, observation)
+                remote.send((reward, done, info))
+            elif cmd == "reset":
+                _write_observation(buffers, env_idx, env.reset())
+                remote.send(None)
+            elif cmd == "attach":
+                env_idx, layout = data
+                handles, buffers = _attach_buffers(layout)
+                remote.send(None)
+            elif cmd == "get_spaces":
+                remote.send((env.observation_space, env.action_space))
+            elif cmd == "seed":
+                remote.send(env.seed(data))
+            elif cmd == "env_method":
+                method = getattr(env, data[0])
+                remote.send(method(*data[1], **data[2]))
+            elif cmd == "get_attr":
+                remote.send(getattr(env, data))
+            elif cmd == "set_attr":
+                remote.send(setattr(env, data[0], data[1]))
+            elif cmd == "is_wrapped":
+                remote.send(is_wrapped(env, data))
+            elif cmd == "close":
+                env.close()
+                buffers.clear()
+                for handle in handles:
+                    handle.close()
+                remote.close()
+                break
+            else:
+                raise NotImplementedError(f"`{cmd}` is not implemented in the worker")
+        except EOFError:
+            break
+
+
+class SharedMemoryVecEnv(VecEnv):
+    """Process-pool vector env writing dict observations into shared memory.
+
+    Each worker owns one row of preallocated ``multiprocessing.shared_memory``
+    arrays (one per observation key) and fills it in place, so only the reward,
+    done flag and info dict travel through the pipe.
+    """
+
+    def __init__(
+        self,
+        env_fns: List[Callable[[], gym.Env]],
+        start_method: Optional[str] = None,
+    ):
+        self.waiting = False
+        self.closed = False
+        n_envs = len(env_fns)
+
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        ctx = mp.get_context(start_method)
+
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(n_envs)])
+        self.processes = []
+        for work_remote, remote, env_fn in zip(
+            self.work_remotes, self.remotes, env_fns
+        ):
+            args = (work_remote, remote, CloudpickleWrapper(env_fn))
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        self.remotes[0].send(("get_spaces", None))
+        observation_space, action_space = self.remotes[0].recv()
+        super().__init__(n_envs, observation_space, action_space)
+
+        self._shared_blocks, self._observation_buffer = self._allocate_buffers(
+            observation_space
+        )
+        layout = {
+            key: (block.name, buffer.shape, buffer.dtype)
+            for (key, buffer), block in zip(
+                self._observation_buffer.items(), self._shared_blocks
+            )
+        }
+        for env_idx, remote in enumerate(self.remotes):
+            remote.send(("attach", (env_idx, layout)))
+        for remote in self.remotes:
+            remote.recv()
+
+    def _allocate_buffers(self, observation_space: gym.spaces.Dict):
+        blocks, buffers = [], {}
+        for key, subspace in observation_space.spaces.items():
+            shape = (self.num_envs,) + subspace.shape
+            dtype = np.dtype(subspace.dtype)
+            size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+            block = shared_memory.SharedMemory(create=True, size=size)
+            blocks.append(block)
+            buffers[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        return blocks, buffers
+
+    def _stacked_observation(self) -> Dict[str, np.ndarray]:
+        return {key: buffer.copy() for key, buffer in self._observation_buffer.items()}
+
+    def step_async(self, actions: np.ndarray) -> None:
+        for remote, action in zip(self.remotes, actions):
+            remote.send(("step", action))
+        self.waiting = True
+
+    def step_wait(self):
+        results = [remote.recv() for remote in self.remotes]
+        self.waiting = False
+        rewards, dones, infos = zip(*results)
+        return (
+            self._stacked_observation(),
+            np.stack(rewards),
+            np.stack(dones),
+            infos,
+        )
+
+    def reset(self):
+        for remote in self.remotes:
+            remote.send(("reset", None))
+        for remote in self.remotes:
+            remote.recv()
+        return self._stacked_observation()
+
+    def seed(self, seed: Optional[int] = None) -> List[Optional[int]]:
+        worker_seeds = seeding.spawn_seeds(seed, self.num_envs)
+        for remote, worker_seed in zip(self.remotes, worker_seeds):
+            remote.send(("seed", worker_seed))
+        return [remote.recv() for remote in self.remotes]
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        if self.waiting:
+            for remote in self.remotes:
+                remote.recv()
+        for remote in self.remotes:
+            remote.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self._observation_buffer.clear()
+        for block in self._shared_blocks:
+            block.close()
+            block.unlink()
+        self.closed = True
+
+    def get_attr(self, attr_name: str, indices=None) -> List[Any]:
+        target_remotes = self._get_target_remotes(indices)
+        for remote in target_remotes:
+            remote.send(("get_attr", attr_name))
+        return [remote.recv() for remote in target_remotes]
+
+    def set_attr(self, attr_name: str, value: Any, indices=None) -> None:
+        target_remotes = self._get_target_remotes(indices)
+        for remote in target_remotes:
+            remote.send(("set_attr", (attr_name, value)))
+        for remote in target_remotes:
+            remote.recv()
+
+    def env_method(self, method_name: str, *method_args, indices=None, **method_kwargs):
+        target_remotes = self._get_target_remotes(indices)
+        for remote in target_remotes:
+            remote.send(("env_method", (method_name, method_args, method_kwargs)))
+        return [remote.recv() for remote in target_remotes]
+
+    def env_is_wrapped(self, wrapper_class, indices=None) -> List[bool]:
+        target_remotes = self._get_target_remotes(indices)
+        for remote in target_remotes:
+            remote.send(("is_wrapped", wrapper_class))
+        return [remote.recv() for remote in target_remotes]
+
+    def _get_target_remotes(self, indices) -> List[Any]:
+        indices = self._get_indices(indices)
+        return [self.remotes[idx] for idx in indices]
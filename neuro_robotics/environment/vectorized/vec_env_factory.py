@@ -0,0 +1,105 @@
+import gym
+from stable_baselines3.common.monitor import Monitor
+from stable_baselines3.common.vec_env import DummyVecEnv
+from stable_baselines3.common.vec_env import SubprocVecEnv
+from stable_baselines3.common.vec_env import VecMonitor
+
+from .batched_neuro_robotics import BatchedNeuroRoboticsEnv
+from .shared_memory_vec_env import SharedMemoryVecEnv
+from neuro_robotics.environment.rollouts import RolloutLogger
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common import seeding
+
+PARALLEL_BACKENDS = ("dummy", "subprocess", "shared_memory", "batched")
+
+
+class MonitoredEnvFactory:
+    """picklable env constructor handed to the worker processes"""
+
+    def __init__(
+        self, env_identifier: str, env_kwargs=None, rollout_kwargs=None, seed=None
+    ):
+        self.env_identifier = env_identifier
+        self.env_kwargs = env_kwargs or {}
+        self.rollout_kwargs = rollout_kwargs
+        self.seed = seed
+
+    def __call__(self) -> gym.Env:
+        env = gym.make(self.env_identifier, **self.env_kwargs)
+        if self.seed is not None:
+            env.seed(self.seed)
+        if self.rollout_kwargs is not None:
+            env = RolloutLogger(env, **self.rollout_kwargs)
+        return Monitor(env)
+
+
+def make_vec_env(
+    env_identifier: str,
+    num_envs: int,
+    backend: str,
+    start_method=None,
+    env_kwargs=None,
+    rollout_kwargs=None,
+    seed=None,
+):
+    """Build a vector env of ``num_envs`` monitored NeuroRobotics envs.
+    Args:
+        env_identifier (str): Registered gym id.
+        num_envs (int): Number of parallel environments.
+        backend (str): One of ``PARALLEL_BACKENDS``.
+        start_method (str): Multiprocessing start method for process backends.
+        env_kwargs (dict): Keyword arguments of every ``gym.make`` call.
+        rollout_kwargs (dict): ``RolloutLogger`` arguments, None logs nothing.
+        seed (int): Root seed, every worker gets a ``SeedSequence.spawn`` child.
+    Returns:
+        VecEnv: The vectorized environment.
+    """
+    if backend in ("subprocess", "shared_memory"):
+        # workers serialize or copy every observation before stepping again
+        env_kwargs = {**(env_kwargs or {}), "copy_observations": False}
+    env_fns = [
+        MonitoredEnvFactory(env_identifier, env_kwargs, rollout_kwargs, worker_seed)
+        for worker_seed in seeding.spawn_seeds(seed, num_envs)
+    ]
+    if backend == "dummy":
+        return DummyVecEnv(env_fns)
+    elif backend == "subprocess":
+        return SubprocVecEnv(env_fns, start_method=start_method)
+    elif backend == "shared_memory":
+        return SharedMemoryVecEnv(env_fns, start_method=start_method)
+    elif backend == "batched":
+        # the batched env shares one client, only physics and asset settings apply
+        env_kwargs = env_kwargs or {}
+        observation_mode = (env_kwargs.get("observation") or {}).get(
+            "mode", constants.ObservationMode.STATE.value
+        )
+        reset_mode = constants.ResetMode(
+            env_kwargs.get("reset_mode", constants.ResetMode.FULL.value)
+        )
+        if rollout_kwargs is not None:
+            raise SystemError("The batched backend does not support rollout logging")
+        if env_kwargs.get("profile"):
+            raise SystemError("The batched backend does not support step profiling")
+        if observation_mode != constants.ObservationMode.STATE.value:
+            raise SystemError(
+                f"The batched backend only supports state observations, "
+                f"got observation mode: {observation_mode}"
+            )
+        if reset_mode != constants.ResetMode.FULL:
+            # a bullet state snapshot covers the whole client, restoring it resets every realm
+            raise SystemError(
+                f"The batched backend only supports full resets, "
+                f"got reset mode: {reset_mode.value}"
+            )
+        batched_env = BatchedNeuroRoboticsEnv(
+            num_envs,
+            realm=env_kwargs.get("realm", constants.Realm.PANDA.value),
+            simulation=env_kwargs.get("simulation"),
+            headless=env_kwargs.get("headless", False),
+            goal_sampling=env_kwargs.get("goal_sampling"),
+            seed=seed,
+        )
+        return VecMonitor(batched_env)
+    raise SystemError(
+        f"Unknown parallel backend: {backend}, expected one of {PARALLEL_BACKENDS}"
+    )
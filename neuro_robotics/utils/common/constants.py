@@ -11,6 +11,8 @@ SETTINGS_DIR = Path(f"{RLROOT}/neuro_robotics/settings")
 ENVIRONMENT_DIR = CORE_DIR / "environment"
 DATA_SAVE_DIRECTORY_PATH = DATA_DIR / "inference"
 PRETRAINED_MODEL_PATH = DATA_DIR / "pretrained" / "best_model"
+ASSET_CACHE_DIR = DATA_DIR / "cache" / "assets"
+CONFIGURATION_CACHE_DIR = DATA_DIR / "cache" / "configuration"
 
 
 class InjectMetadataDescription(Enum):
@@ -22,14 +24,19 @@ class InjectMetadataDescription(Enum):
     DDPG_AGENT_METADATA = "ddpg_agent"
     DDPG_NETWORK_METADATA = "ddpg_network"
 
-    PANDA_ROBOT_METADATA = "panda_robot"
-    PANDA_GOAL_METADATA = "panda_goal"
-    PANDA_PLANE_METADATA = "panda_plane"
-    PANDA_TRAY_METADATA = "panda_tray"
-    PANDA_TABLE_METADATA = "panda_table"
 
+class _RealmManifestKey(Enum):
+    DISTANCE_THRESHOLD_ATTR = "distance_threshold"
+    REACHABILITY_INDEX_ATTR = "reachability_index"
+    ALIAS_OF_ATTR = "alias_of"
+
+    ROBOT_ATTR = "robot"
+    GOAL_ATTR = "goal"
+    PLANE_ATTR = "plane"
+    TABLE_ATTR = "table"
+    TRAY_ATTR = "tray"
+    CAMERA_ATTR = "camera"
 
-class _FrankaEmikaPandaConfigurationKey(Enum):
     DESC_FILE_LOC_ATTR = "description_file_location"
 
     INIT_POSITION_ATTR = "init_position"
@@ -50,21 +57,106 @@ class _FrankaEmikaPandaConfigurationKey(Enum):
 
     INVERSE_KINEMATICS_ATTR = "inverse_kinematics"
     _DISPLACEMENT_LIMIT = "displacement_limit"
+    _BACKEND = "backend"
+    _DAMPING = "damping"
+    _MAX_ITERATIONS = "max_iterations"
+    _TOLERANCE = "tolerance"
+
+    OBJECT_SIZE_ATTR = "object_size"
+    FLOOR_PROBABILITY_ATTR = "floor_probability"
+    RANGE_ATTR = "range"
+    _LOW = "low"
+    _HIGH = "high"
+
+    _TARGET_POSITION = "target_position"
+    _DISTANCE = "distance"
+    _YAW = "yaw"
+    _PITCH = "pitch"
+
+
+class RealmManifest(Enum):
+    CFG_KEY = _RealmManifestKey
+
+    MANIFEST_DIR = ENVIRONMENT_DIR / "model" / "configuration" / "manifests"
+    MANIFEST_SUFFIX = ".yml"
+    ENV_IDENTIFIER = "NeuroRobotics-{realm}-v1"
+
+
+class Realm(Enum):
+    """default realm id, every manifest under RealmManifest.MANIFEST_DIR is a realm"""
+
+    PANDA = "panda"
+
+
+class VectorizedEnvironment(Enum):
+    REALM_SPACING = 2.0
+    MAX_EPISODE_STEPS = 50
+
+
+class VideoRecording(Enum):
+    QUEUE_SIZE = 64
+    FRAMES_PER_SEC = 30
+
+
+class InverseKinematicsBackend(Enum):
+    BULLET = "bullet"
+    DLS = "dls"
+
+
+class RendererBackend(Enum):
+    TINY = "tiny"
+    OPENGL = "opengl"
+
+
+class ObservationMode(Enum):
+    STATE = "state"
+    PIXELS = "pixels"
+    BOTH = "both"
+
+
+class RolloutLogging(Enum):
+    SHARD_SIZE = 10000
+
+
+class ReplayBufferBackend(Enum):
+    HER = "her"
+    EPISODE = "episode"
+
+
+class ReplayStorageDtype(Enum):
+    FLOAT32 = "float32"
+    FLOAT16 = "float16"
+
+
+class PixelChannels(Enum):
+    RGB = "rgb"
+    DEPTH = "depth"
+    RGBD = "rgbd"
+
+
+class ResetMode(Enum):
+    FULL = "full"
+    SNAPSHOT = "snapshot"
+
+
+class ProfilePhase(Enum):
+    """step phases timed by the StepProfiler, values index its histograms"""
+
+    ACTION_CLIP = 0
+    ACT = 1
+    PHYSICS = 2
+    OBSERVATION = 3
+    REWARD = 4
+    RESET = 5
+    STEP = 6
 
 
-class FrankaEmikaPanda(Enum):
-    CFG_KEY = _FrankaEmikaPandaConfigurationKey
+class Profiling(Enum):
+    # 4 buckets per power of two nanoseconds, the last one holds everything
+    # above ~18 minutes
+    N_BUCKETS = 160
+    LOG_INTERVAL = 1000
 
-    METADATA_DIR = (
-        ENVIRONMENT_DIR / "model" / "configuration" / "franka_emika_panda" / "metadata"
-    )
-    ROBOT_YAML_CONFIG_PATH = METADATA_DIR / "robot.yml"
-    GOAL_YAML_CONFIG_PATH = METADATA_DIR / "goal.yml"
-    PLANE_YAML_CONFIG_PATH = METADATA_DIR / "plane.yml"
-    TRAY_YAML_CONFIG_PATH = METADATA_DIR / "traybox.yml"
-    TABLE_YAML_CONFIG_PATH = METADATA_DIR / "table.yml"
 
-    DEFAULT_CAMERA_POSITION = (0.5, 0.4, -0.8)
-    DEFAULT_CAMERA_PITCH = -50
-    DEFAULT_CAMERA_YAW = 0
-    DEFAULT_CAMERA_DISTANCE = 2
+class Curriculum(Enum):
+    LOG_INTERVAL = 1000
@@ -2,11 +2,12 @@ import json
 from datetime import datetime
 from functools import wraps
 from os.path import expandvars
+from pathlib import Path
 from typing import Union
 
-import matplotlib.pyplot as plt
 import numpy as np
-import yaml
+
+from .constants import RealmManifest
 
 
 def get_current_timestamp(use_hour=True):
@@ -16,7 +17,9 @@ def get_current_timestamp(use_hour=True):
         return datetime.now().strftime("%Y%m%d")
 
 
-def load_yaml(yaml_path):
+def expand_environment_variables(content):
+    """resolve $VARS in every string of a parsed yaml tree"""
+
     def process_dict(dict_to_process):
         for key, item in dict_to_process.items():
             if isinstance(item, dict):
@@ -40,10 +43,27 @@ def load_yaml(yaml_path):
                 new_list.append(item)
         return new_list
 
+    return process_dict(content)
+
+
+def parse_yaml(yaml_path):
+    import yaml
+
     with open(yaml_path) as yaml_file:
-        yaml_content = yaml.safe_load(yaml_file)
+        return yaml.safe_load(yaml_file)
 
-    return process_dict(yaml_content)
+
+def load_yaml(yaml_path):
+    return expand_environment_variables(parse_yaml(yaml_path))
+
+
+def available_realms(manifest_dir=None):
+    """realm ids, one per manifest, listing them parses and imports nothing"""
+    manifest_dir = Path(manifest_dir or RealmManifest.MANIFEST_DIR.value)
+    return sorted(
+        path.stem
+        for path in manifest_dir.glob(f"*{RealmManifest.MANIFEST_SUFFIX.value}")
+    )
 
 
 def load_json(path):
@@ -53,6 +73,8 @@ def load_json(path):
 
 
 def save_yaml(content, path):
+    import yaml
+
     with open(path, "w") as file:
         yaml.dump(content, file, sort_keys=False)
 
@@ -76,6 +98,9 @@ def timing(f):
 
 
 def plot_learning_curve(x, scores, figure_file):
+    # pyplot drags in a gui backend, only pay for it when plotting
+    import matplotlib.pyplot as plt
+
     running_avg = np.zeros(len(scores))
     for i in range(len(running_avg)):
         running_avg[i] = np.mean(scores[max(0, i - 100) : (i + 1)])
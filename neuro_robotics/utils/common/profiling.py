@@ -0,0 +1,127 @@
+from time import perf_counter_ns
+from typing import Dict
+from typing import Iterable
+
+import numpy as np
+
+from neuro_robotics.utils.common import constants
+
+PERCENTILES = (50, 90, 99)
+
+
+def bucket_index(elapsed_ns: int) -> int:
+    """log2 bucket of a duration refined by the two bits after its leading one"""
+    n_bits = elapsed_ns.bit_length()
+    if n_bits <= 3:
+        return elapsed_ns
+    return 4 * (n_bits - 2) + ((elapsed_ns >> (n_bits - 3)) & 3)
+
+
+def bucket_upper_ns(index: int) -> int:
+    """exclusive upper edge of a bucket, in nanoseconds"""
+    if index < 8:
+        return index + 1
+    n_bits, sub_bucket = divmod(index, 4)
+    return (5 + sub_bucket) << (n_bits - 1)
+
+
+class StepProfiler:
+    """Per-phase latency histograms of an env, cheap enough to stay on in training.
+
+    A phase is timed by ``lap(phase, start)`` with ``perf_counter_ns`` stamps and
+    counted in a fixed array of buckets, four per power of two nanoseconds, so a
+    percentile read back from it is off by less than 25%. Counters are plain
+    python ints while recording, numpy only shows up in ``snapshot``. A disabled
+    profiler returns from ``lap`` right away. Histograms of several envs are
+    combined with ``merge`` before ``summarize``.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        n_buckets: int = constants.Profiling.N_BUCKETS.value,
+    ) -> None:
+        self.enabled = enabled
+        self.n_buckets = n_buckets
+        self.clear()
+
+    @staticmethod
+    def now() -> int:
+        return perf_counter_ns()
+
+    def lap(self, phase: constants.ProfilePhase, start: int) -> int:
+        """Record the time elapsed since ``start`` under ``phase``.
+        Args:
+            phase (constants.ProfilePhase): The phase that just ended.
+            start (int): ``perf_counter_ns`` stamp of the phase start.
+        Returns:
+            int: The current stamp, the start of the next phase.
+        """
+        if not self.enabled:
+            return 0
+        stop = perf_counter_ns()
+        elapsed = stop - start
+        idx = phase.value
+        self._counts[idx][min(bucket_index(elapsed), self.n_buckets - 1)] += 1
+        self._total_ns[idx] += elapsed
+        if elapsed > self._max_ns[idx]:
+            self._max_ns[idx] = elapsed
+        return stop
+
+    def clear(self) -> None:
+        n_phases = len(constants.ProfilePhase)
+        self._counts = [[0] * self.n_buckets for _ in range(n_phases)]
+        self._total_ns = [0] * n_phases
+        self._max_ns = [0] * n_phases
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """the raw histograms as arrays, picklable across vectorized workers"""
+        return dict(
+            counts=np.array(self._counts, dtype=np.int64),
+            total_ns=np.array(self._total_ns, dtype=np.int64),
+            max_ns=np.array(self._max_ns, dtype=np.int64),
+        )
+
+    @staticmethod
+    def merge(snapshots: Iterable[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        snapshots = list(snapshots)
+        return dict(
+            counts=np.sum([snapshot["counts"] for snapshot in snapshots], axis=0),
+            total_ns=np.sum([snapshot["total_ns"] for snapshot in snapshots], axis=0),
+            max_ns=np.max([snapshot["max_ns"] for snapshot in snapshots], axis=0),
+        )
+
+    @staticmethod
+    def summarize(snapshot: Dict[str, np.ndarray]) -> Dict[str, Dict[str, float]]:
+        """Reduce histograms to microsecond statistics per phase.
+        Percentiles are the upper edge of the bucket they fall in, capped at the
+        largest recorded latency.
+        Args:
+            snapshot (Dict[str, np.ndarray]): Output of ``snapshot`` or ``merge``.
+        Returns:
+            Dict[str, Dict[str, float]]: count, mean, percentiles and max of every
+            phase that was recorded, keyed by the lowercase phase name.
+        """
+        summary = {}
+        for phase in constants.ProfilePhase:
+            counts = snapshot["counts"][phase.value]
+            count = int(counts.sum())
+            if not count:
+                continue
+            max_ns = int(snapshot["max_ns"][phase.value])
+            statistics = {
+                "count": count,
+                "mean_us": float(snapshot["total_ns"][phase.value]) / count / 1e3,
+            }
+            cumulative = np.cumsum(counts)
+            for percentile in PERCENTILES:
+                bucket = int(np.searchsorted(cumulative, count * percentile / 100))
+                statistics[f"p{percentile}_us"] = (
+                    min(bucket_upper_ns(bucket), max_ns) / 1e3
+                )
+            statistics["max_us"] = max_ns / 1e3
+            summary[phase.name.lower()] = statistics
+        return summary
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return self.summarize(self.snapshot())
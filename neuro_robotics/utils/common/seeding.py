@@ -0,0 +1,31 @@
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+# episode seeds are drawn below this bound so they round-trip through json and csv
+EPISODE_SEED_BOUND = 2**32
+
+
+def make_generator(seed: Optional[int] = None) -> Tuple[np.random.Generator, int]:
+    """Create a PCG64 generator from ``seed``, fresh os entropy when None.
+    Returns:
+        Tuple[np.random.Generator, int]: The generator and the seed to reproduce it.
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    return np.random.Generator(np.random.PCG64(seed_sequence)), seed_sequence.entropy
+
+
+def spawn_seeds(seed: Optional[int], n_seeds: int) -> List[Optional[int]]:
+    """Derive independent worker seeds with ``SeedSequence.spawn``.
+    Args:
+        seed (Optional[int]): Root seed, None keeps every worker unseeded.
+        n_seeds (int): Number of workers.
+    Returns:
+        List[Optional[int]]: One seed per worker.
+    """
+    if seed is None:
+        return [None] * n_seeds
+    children = np.random.SeedSequence(seed).spawn(n_seeds)
+    return [int(child.generate_state(2, np.uint64)[0]) for child in children]
@@ -4,7 +4,7 @@ from setuptools import setup
 setup(
     name="neuro_robotics",
     version="1.0.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=("tests", "tests.*")),
     install_requires=[
         "gym",
         "pybullet",
@@ -14,6 +14,7 @@ setup(
         "tensorboard",
         "wandb",
         "black",
+        "pytest",
         "attrs",
         "click",
     ],
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.environment.simulation import AdaptiveSubstepSettings
+from neuro_robotics.environment.simulation import SimulationSettings
+
+N_STEPS = 30
+ADAPTIVE = dict(use=True, min_substeps=4, check_interval=2)
+
+
+def _make_env(**simulation):
+    env = NeuroRoboticsEnv(headless=True, seed=0, simulation=simulation)
+    env.reset()
+    return env
+
+
+def _count_physics_steps(monkeypatch, env):
+    counts = {"stepSimulation": 0}
+    step_simulation = env.physics_client.stepSimulation
+
+    def counted():
+        counts["stepSimulation"] += 1
+        return step_simulation()
+
+    monkeypatch.setattr(env.physics_client, "stepSimulation", counted)
+    return counts
+
+
+def test_settings_are_built_from_nested_dicts():
+    settings = SimulationSettings.from_dict(
+        dict(timestep=0.004, adaptive_substeps=ADAPTIVE)
+    )
+    assert settings.adaptive_substeps == AdaptiveSubstepSettings(**ADAPTIVE)
+    env = _make_env(timestep=0.004, n_substeps=10)
+    try:
+        parameters = env.physics_client.getPhysicsEngineParameters()
+        assert parameters["fixedTimeStep"] == pytest.approx(0.004)
+        assert env.dt == pytest.approx(0.04)
+    finally:
+        env.close()
+
+
+def test_fixed_substeps_run_the_whole_loop(monkeypatch):
+    env = _make_env()
+    try:
+        counts = _count_physics_steps(monkeypatch, env)
+        for _ in range(N_STEPS):
+            _, _, _, info = env.step(np.zeros(4, dtype=np.float32))
+            assert "substeps" not in info
+        assert counts["stepSimulation"] == N_STEPS * env.n_substeps
+    finally:
+        env.close()
+
+
+def test_loop_exits_early_once_the_arm_holds_still(monkeypatch):
+    env = _make_env(adaptive_substeps=ADAPTIVE)
+    try:
+        counts = _count_physics_steps(monkeypatch, env)
+        substeps = []
+        for _ in range(N_STEPS):
+            _, _, _, info = env.step(np.zeros(4, dtype=np.float32))
+            substeps.append(info["substeps"])
+            if info["substeps"] < env.n_substeps:
+                # an early exit is only taken on a settled realm
+                assert env.realm.is_settled(
+                    env.simulation.adaptive_substeps.velocity_tolerance,
+                    env.simulation.adaptive_substeps.position_tolerance,
+                )
+        assert counts["stepSimulation"] == sum(substeps)
+        assert substeps[-1] == ADAPTIVE["min_substeps"]
+        for n_substeps in substeps:
+            assert n_substeps >= ADAPTIVE["min_substeps"]
+            assert (
+                n_substeps % ADAPTIVE["check_interval"] == 0
+                or n_substeps == env.n_substeps
+            )
+    finally:
+        env.close()
+
+
+def test_moving_arm_runs_the_whole_loop():
+    env = _make_env(adaptive_substeps=ADAPTIVE)
+    try:
+        for action in np.random.default_rng(0).uniform(-1, 1, (N_STEPS, 4)):
+            _, _, _, info = env.step(action.astype(np.float32))
+            assert info["substeps"] == env.n_substeps
+    finally:
+        env.close()
@@ -0,0 +1,118 @@
+import numpy as np
+import pybullet as p
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.environment.assets.asset_cache import AssetCache
+from neuro_robotics.utils.common import constants
+
+DESCRIPTION_DIR = (
+    constants.ENVIRONMENT_DIR / "model" / "franka_emika_panda" / "description"
+)
+# five convex parts, merging them into one hull fills the gaps between them
+DECOMPOSED_MESH = (DESCRIPTION_DIR / "meshes" / "goal" / "000.obj").resolve()
+REALM_DESCRIPTIONS = ["robot.urdf", "goal.urdf", "table.urdf", "plane.urdf"]
+N_RAYS = 25
+
+BODY_URDF = """<robot name="body">
+  <link name="base">
+    <inertial>
+      <mass value="1"/>
+      <inertia ixx="1" iyy="1" izz="1" ixy="0" ixz="0" iyz="0"/>
+    </inertial>
+    <visual><geometry><mesh filename="{mesh}"/></geometry></visual>
+    <collision><geometry><mesh filename="{mesh}"/></geometry></collision>
+  </link>
+</robot>
+"""
+
+
+@pytest.fixture
+def client():
+    client = p.connect(p.DIRECT)
+    yield client
+    p.disconnect(client)
+
+
+def ray_hits(client, description_file):
+    """hit fractions of a vertical ray grid over the collision shapes of a body"""
+    body = p.loadURDF(str(description_file), physicsClientId=client)
+    low, high = map(np.array, p.getAABB(body, physicsClientId=client))
+    grid = np.stack(
+        np.meshgrid(
+            np.linspace(low[0], high[0], N_RAYS), np.linspace(low[1], high[1], N_RAYS)
+        ),
+        axis=-1,
+    ).reshape(-1, 2)
+    starts = np.c_[grid, np.full(len(grid), high[2] + 1.0)]
+    ends = np.c_[grid, np.full(len(grid), low[2] - 1.0)]
+    hits = p.rayTestBatch(starts.tolist(), ends.tolist(), physicsClientId=client)
+    p.removeBody(body, physicsClientId=client)
+    return np.array([hit[2] for hit in hits])
+
+
+def collision_shapes(client, description_file):
+    """geometry, scale and local frame of every collision shape, mesh files aside"""
+    body = p.loadURDF(str(description_file), physicsClientId=client)
+    shapes = [
+        (shape[1], shape[2], np.round(shape[3], 6).tolist(), shape[5], shape[6])
+        for link in range(-1, p.getNumJoints(body, physicsClientId=client))
+        for shape in p.getCollisionShapeData(body, link, physicsClientId=client)
+    ]
+    p.removeBody(body, physicsClientId=client)
+    return shapes
+
+
+def test_compacted_mesh_keeps_every_convex_part(client, tmp_path):
+    description_file = tmp_path / "body.urdf"
+    description_file.write_text(BODY_URDF.format(mesh=DECOMPOSED_MESH))
+    headless_file = AssetCache(tmp_path / "cache").resolve(str(description_file), True)
+    assert "<visual>" not in open(headless_file).read()
+    visual_hits = ray_hits(client, description_file)
+    assert (visual_hits < 1.0).any() and (visual_hits == 1.0).any()
+    np.testing.assert_array_equal(ray_hits(client, headless_file), visual_hits)
+
+
+@pytest.mark.parametrize("description", REALM_DESCRIPTIONS)
+def test_headless_descriptions_keep_the_collision_shapes(client, tmp_path, description):
+    description_file = DESCRIPTION_DIR / description
+    headless_file = AssetCache(tmp_path).resolve(str(description_file), True)
+    assert collision_shapes(client, headless_file) == collision_shapes(
+        client, description_file
+    )
+
+
+def test_edited_mesh_gets_a_new_cache_entry(tmp_path):
+    mesh_file = tmp_path / "part.obj"
+    mesh_file.write_text(DECOMPOSED_MESH.read_text())
+    description_file = tmp_path / "body.urdf"
+    description_file.write_text(BODY_URDF.format(mesh=mesh_file))
+    cache_dir = tmp_path / "cache"
+    first = AssetCache(cache_dir).resolve(str(description_file), True)
+    mesh_file.write_text(mesh_file.read_text() + "v 0 0 0\n")
+    second = AssetCache(cache_dir).resolve(str(description_file), True)
+    assert first != second
+
+
+def test_headless_env_replays_the_visual_env():
+    envs = [
+        NeuroRoboticsEnv(headless=headless, seed=0, copy_observations=True)
+        for headless in (False, True)
+    ]
+    actions = (
+        np.random.default_rng(0).uniform(-1.0, 1.0, size=(50, 4)).astype(np.float32)
+    )
+    try:
+        visual_env, headless_env = envs
+        np.testing.assert_array_equal(
+            visual_env.reset(seed=3)["observation"],
+            headless_env.reset(seed=3)["observation"],
+        )
+        for action in actions:
+            np.testing.assert_array_equal(
+                visual_env.step(action)[0]["observation"],
+                headless_env.step(action)[0]["observation"],
+            )
+    finally:
+        for env in envs:
+            env.close()
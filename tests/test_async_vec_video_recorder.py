@@ -0,0 +1,120 @@
+import threading
+
+import gym
+import numpy as np
+import pytest
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from neuro_robotics.environment.vectorized import async_vec_video_recorder
+from neuro_robotics.environment.vectorized import AsyncVecVideoRecorder
+
+FRAME_SHAPE = (4, 6, 3)
+VIDEO_LENGTH = 5
+
+
+class CountingEnv(gym.Env):
+    """renders its step counter into one reused frame, like the pooled renderer"""
+
+    observation_space = gym.spaces.Box(0, 1, shape=(1,), dtype=np.float32)
+    action_space = gym.spaces.Box(-1, 1, shape=(1,), dtype=np.float32)
+    metadata = {"render.modes": ["rgb_array"]}
+
+    def __init__(self):
+        self.t = 0
+        self._frame = np.zeros(FRAME_SHAPE, dtype=np.uint8)
+
+    def reset(self):
+        self.t = 0
+        return np.zeros(1, dtype=np.float32)
+
+    def step(self, action):
+        self.t += 1
+        return np.zeros(1, dtype=np.float32), 0.0, False, {}
+
+    def render(self, mode="rgb_array"):
+        self._frame.fill(self.t)
+        return self._frame
+
+
+class FakeEncoder:
+    """records captured frames per output path instead of piping them to ffmpeg"""
+
+    videos = {}
+    release = None
+
+    def __init__(self, output_path, frame_shape, frames_per_sec, output_frames_per_sec):
+        self.frames = FakeEncoder.videos.setdefault(output_path, [])
+        self.closed = False
+
+    def capture_frame(self, frame):
+        if FakeEncoder.release is not None:
+            FakeEncoder.release.wait()
+        self.frames.append(frame)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def encoder(monkeypatch):
+    FakeEncoder.videos = {}
+    FakeEncoder.release = None
+    monkeypatch.setattr(async_vec_video_recorder, "ImageEncoder", FakeEncoder)
+    return FakeEncoder
+
+
+def _recorder(tmp_path, **kwargs):
+    return AsyncVecVideoRecorder(
+        DummyVecEnv([CountingEnv]),
+        str(tmp_path),
+        record_video_trigger=lambda step: step == 0,
+        video_length=VIDEO_LENGTH,
+        **kwargs,
+    )
+
+
+def _step(recorder, n_steps):
+    for _ in range(n_steps):
+        recorder.step(np.zeros((1, 1), dtype=np.float32))
+
+
+def test_frames_are_copied_before_the_env_reuses_them(tmp_path, encoder):
+    recorder = _recorder(tmp_path)
+    recorder.reset()
+    _step(recorder, VIDEO_LENGTH + 3)
+    recorder.close()
+    (frames,) = encoder.videos.values()
+    assert [int(frame[0, 0, 0]) for frame in frames] == list(range(VIDEO_LENGTH + 1))
+    assert recorder.statistics.as_dict()["frames_encoded"] == VIDEO_LENGTH + 1
+    assert recorder.statistics.videos_written == 1
+
+
+def test_slow_encoder_drops_frames_instead_of_blocking(tmp_path, encoder):
+    encoder.release = threading.Event()
+    queue_size = 2
+    recorder = _recorder(tmp_path, queue_size=queue_size)
+    recorder.reset()
+    # a frame holds its slot until encoded, the blocked encoder frees none
+    _step(recorder, VIDEO_LENGTH)
+    assert recorder.statistics.frames_dropped == VIDEO_LENGTH + 1 - queue_size
+    encoder.release.set()
+    recorder.close()
+    statistics = recorder.statistics.as_dict()
+    assert statistics["frames_encoded"] + statistics["frames_dropped"] == (
+        VIDEO_LENGTH + 1
+    )
+    assert not recorder._encoder_thread.is_alive()
+
+
+def test_encoder_failure_does_not_reach_the_training_loop(tmp_path, monkeypatch):
+    def broken_encoder(*args, **kwargs):
+        raise OSError("ffmpeg not found")
+
+    monkeypatch.setattr(async_vec_video_recorder, "ImageEncoder", broken_encoder)
+    recorder = _recorder(tmp_path)
+    recorder.reset()
+    _step(recorder, 2 * VIDEO_LENGTH)
+    recorder.close()
+    assert recorder.statistics.frames_encoded == 0
+    assert recorder.statistics.videos_written == 0
+    assert not recorder._encoder_thread.is_alive()
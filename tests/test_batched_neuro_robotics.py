@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.environment.vectorized import BatchedNeuroRoboticsEnv
+from neuro_robotics.environment.vectorized import make_vec_env
+from neuro_robotics.utils.common import constants
+
+NUM_ENVS = 3
+N_STEPS = 40
+# realm offsets are added and removed again, the rounding stays far below this
+ATOL = 1e-6
+
+
+@pytest.fixture
+def env():
+    env = BatchedNeuroRoboticsEnv(NUM_ENVS, headless=True, seed=0)
+    yield env
+    env.close()
+
+
+def random_actions(n_steps, seed=0):
+    return (
+        np.random.default_rng(seed)
+        .uniform(-1.0, 1.0, size=(n_steps, NUM_ENVS, 4))
+        .astype(np.float32)
+    )
+
+
+def test_observations_are_stacked_in_the_realm_frame(env):
+    observation = env.reset()
+    for key, space in env.observation_space.spaces.items():
+        assert observation[key].shape == (NUM_ENVS,) + space.shape
+        assert observation[key].dtype == np.float32
+    # every arm starts in the same pose relative to its own realm
+    for realm_observation in observation["observation"][1:]:
+        np.testing.assert_allclose(
+            realm_observation, observation["observation"][0], atol=ATOL
+        )
+    assert len({tuple(realm.base_offset) for realm in env.realms}) == NUM_ENVS
+
+
+def test_realms_match_a_single_env_replaying_their_episode(env):
+    observation = env.reset()
+    episode_seeds = env.episode_seeds.copy()
+    actions = random_actions(N_STEPS)
+    trajectory = []
+    for action in actions:
+        trajectory.append(env.step(action)[0]["observation"].copy())
+
+    single_env = NeuroRoboticsEnv(headless=True)
+    try:
+        for idx in range(NUM_ENVS):
+            single_observation = single_env.reset(seed=int(episode_seeds[idx]))
+            np.testing.assert_array_equal(
+                single_observation["desired_goal"], observation["desired_goal"][idx]
+            )
+            for action, batched_observation in zip(actions, trajectory):
+                single_observation = single_env.step(action[idx])[0]
+                np.testing.assert_allclose(
+                    single_observation["observation"],
+                    batched_observation[idx],
+                    atol=ATOL,
+                )
+    finally:
+        single_env.close()
+
+
+def test_time_limit_resets_the_realm():
+    env = BatchedNeuroRoboticsEnv(NUM_ENVS, max_episode_steps=5, headless=True, seed=0)
+    try:
+        env.reset()
+        first_seeds = env.episode_seeds.copy()
+        for action in random_actions(5):
+            observation, _, dones, infos = env.step(action)
+        assert dones.all()
+        for idx, info in enumerate(infos):
+            assert info["TimeLimit.truncated"] != bool(info["is_success"])
+            assert info["episode_seed"] == first_seeds[idx]
+            terminal_observation = info["terminal_observation"]
+            assert not np.array_equal(
+                terminal_observation["desired_goal"], observation["desired_goal"][idx]
+            )
+        assert not np.array_equal(env.episode_seeds, first_seeds)
+        np.testing.assert_array_equal(env.episode_steps, 0)
+    finally:
+        env.close()
+
+
+def test_reset_realm_replays_a_logged_episode(env):
+    observation = env.reset()
+    episode_seed = int(env.episode_seeds[1])
+    for action in random_actions(10):
+        env.step(action)
+    replayed = env.reset_realm(1, seed=episode_seed)
+    for key, value in replayed.items():
+        np.testing.assert_allclose(value, observation[key][1], atol=ATOL)
+
+
+@pytest.mark.parametrize(
+    "env_kwargs",
+    [
+        dict(reset_mode=constants.ResetMode.SNAPSHOT.value),
+        dict(profile=True),
+        dict(simulation={"adaptive_substeps": {"use": True}}),
+        dict(observation={"mode": constants.ObservationMode.PIXELS.value}),
+    ],
+)
+def test_factory_rejects_unsupported_settings(env_kwargs):
+    with pytest.raises(SystemError):
+        make_vec_env("NeuroRobotics-v1", NUM_ENVS, "batched", env_kwargs=env_kwargs)
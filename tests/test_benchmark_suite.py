@@ -0,0 +1,65 @@
+import pytest
+
+from neuro_robotics.benchmarks import suite
+
+SETTINGS = dict(
+    num_envs=2,
+    n_steps=10,
+    n_resets=2,
+    n_frames=2,
+    render_resolution=[32, 24],
+    reward_batch_size=64,
+    reward_repeat=2,
+    seed=0,
+)
+
+
+def _report(**metrics):
+    return dict(results=[dict(realm="panda", configuration="single", metrics=metrics)])
+
+
+def test_single_env_case_measures_every_metric():
+    metrics = suite.single_env_case("panda", SETTINGS)
+    assert set(metrics) == set(suite.METRICS) - {"peak_rss_mb"}
+    assert all(value > 0 for value in metrics.values())
+
+
+def test_report_marks_alias_realms(monkeypatch):
+    monkeypatch.setattr(
+        suite, "run_isolated", lambda case, *args: {"steps_per_sec": 1.0}
+    )
+    report = suite.run_suite(["panda", "cr_168"], ["dummy"], SETTINGS)
+    aliases = {
+        (result["realm"], result["configuration"]): result["alias_of"]
+        for result in report["results"]
+    }
+    assert aliases == {
+        ("panda", "single"): None,
+        ("panda", "vec/dummy"): None,
+        ("cr_168", "single"): "panda",
+        ("cr_168", "vec/dummy"): "panda",
+    }
+
+
+@pytest.mark.parametrize(
+    "metric, value, regressed",
+    [
+        ("steps_per_sec", 95.0, False),
+        ("steps_per_sec", 85.0, True),
+        ("steps_per_sec", 200.0, False),
+        ("construction_ms", 105.0, False),
+        ("construction_ms", 115.0, True),
+        ("construction_ms", 50.0, False),
+    ],
+)
+def test_compare_flags_regressions_by_metric_direction(metric, value, regressed):
+    regressions = suite.compare(
+        _report(**{metric: value}), _report(**{metric: 100.0}), tolerance=0.1
+    )
+    assert bool(regressions) == regressed
+
+
+def test_compare_skips_cases_missing_from_the_baseline():
+    report = _report(steps_per_sec=1.0)
+    baseline = dict(results=[])
+    assert suite.compare(report, baseline, tolerance=0.1) == []
@@ -0,0 +1,70 @@
+import pybullet as p
+import pybullet_data
+import pytest
+
+from neuro_robotics.environment.simulation import CachedBulletClient
+
+CUBE = "cube_small.urdf"
+
+
+@pytest.fixture
+def client():
+    client = CachedBulletClient(connection_mode=p.DIRECT)
+    client.setAdditionalSearchPath(pybullet_data.getDataPath())
+    yield client
+    client.disconnect()
+
+
+def _uncached_position(client, body):
+    position, _ = p.getBasePositionAndOrientation(body, physicsClientId=client._client)
+    return position
+
+
+def test_queries_are_served_from_memory_until_a_step(client):
+    body = client.loadURDF(CUBE, basePosition=(0.0, 0.0, 1.0))
+    first = client.getBasePositionAndOrientation(body)
+    assert client.getBasePositionAndOrientation(body) is first
+    assert client.cache_statistics()["hits"] == 1
+    client.stepSimulation()
+    assert client.getBasePositionAndOrientation(body) is not first
+    assert client.cache_statistics()["misses"] == 2
+
+
+def test_loaded_body_reusing_a_removed_id_is_not_stale(client):
+    body = client.loadURDF(CUBE, basePosition=(0.0, 0.0, 1.0))
+    client.getBasePositionAndOrientation(body)
+    p.removeBody(body, physicsClientId=client._client)
+    # the uncached removal keeps the old pose in memory, the load drops it
+    reloaded = client.loadURDF(CUBE, basePosition=(1.0, 2.0, 3.0))
+    assert reloaded == body
+    position, _ = client.getBasePositionAndOrientation(reloaded)
+    assert position == _uncached_position(client, reloaded)
+    assert position == pytest.approx((1.0, 2.0, 3.0))
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda client, body: client.loadURDF(CUBE),
+        lambda client, body: client.changeDynamics(body, -1, mass=2.0),
+        lambda client, body: client.resetBasePositionAndOrientation(
+            body, (1.0, 0.0, 1.0), (0.0, 0.0, 0.0, 1.0)
+        ),
+        lambda client, body: client.resetBaseVelocity(body, (1.0, 0.0, 0.0)),
+        lambda client, body: client.restoreState(client.saveState()),
+        lambda client, body: client.resetSimulation(),
+    ],
+    ids=[
+        "loadURDF",
+        "changeDynamics",
+        "resetBasePositionAndOrientation",
+        "resetBaseVelocity",
+        "restoreState",
+        "resetSimulation",
+    ],
+)
+def test_state_changing_calls_drop_the_cache(client, call):
+    body = client.loadURDF(CUBE, basePosition=(0.0, 0.0, 1.0))
+    client.getBasePositionAndOrientation(body)
+    call(client, body)
+    assert client._state_cache == {}
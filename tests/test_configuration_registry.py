@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from neuro_robotics.environment.model.configuration.configuration_registry import (
+    ConfigurationRegistry,
+)
+from neuro_robotics.utils.common import methods
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """count the yaml files parsed, a bundle hit parses nothing"""
+    parsed = []
+    parse_yaml = methods.parse_yaml
+
+    def counted(yaml_path):
+        parsed.append(yaml_path)
+        return parse_yaml(yaml_path)
+
+    monkeypatch.setattr(methods, "parse_yaml", counted)
+    return parsed
+
+
+@pytest.fixture
+def yaml_path(tmp_path):
+    path = tmp_path / "realm.yml"
+    path.write_text("threshold: 0.05\nname: panda\n")
+    return path
+
+
+def _load_in_new_process(tmp_path, yaml_path):
+    """a fresh registry only shares the bundles on disk, like a spawned worker"""
+    return ConfigurationRegistry(tmp_path / "cache").load(yaml_path)
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_bundle_is_reused_across_processes(tmp_path, yaml_path, parses):
+    assert _load_in_new_process(tmp_path, yaml_path) == {
+        "threshold": 0.05,
+        "name": "panda",
+    }
+    assert len(parses) == 1
+    assert _load_in_new_process(tmp_path, yaml_path)["name"] == "panda"
+    assert len(parses) == 1
+
+
+def test_parsed_tree_is_kept_per_process(tmp_path, yaml_path, parses):
+    registry = ConfigurationRegistry(tmp_path / "cache")
+    registry.load(yaml_path)["name"] = "mutated"
+    assert registry.load(yaml_path)["name"] == "panda"
+    assert len(parses) == 1
+
+
+def test_size_change_reparses(tmp_path, yaml_path, parses):
+    _load_in_new_process(tmp_path, yaml_path)
+    yaml_path.write_text("threshold: 0.1\nname: cr_168\n")
+    assert _load_in_new_process(tmp_path, yaml_path)["name"] == "cr_168"
+    assert len(parses) == 2
+
+
+def test_same_size_edit_reparses_on_mtime_change(tmp_path, yaml_path, parses):
+    _load_in_new_process(tmp_path, yaml_path)
+    yaml_path.write_text("threshold: 0.07\nname: panda\n")
+    _bump_mtime(yaml_path)
+    assert _load_in_new_process(tmp_path, yaml_path)["threshold"] == 0.07
+    assert len(parses) == 2
+
+
+def test_touched_file_with_same_content_is_not_reparsed(tmp_path, yaml_path, parses):
+    _load_in_new_process(tmp_path, yaml_path)
+    _bump_mtime(yaml_path)
+    assert _load_in_new_process(tmp_path, yaml_path)["name"] == "panda"
+    assert _load_in_new_process(tmp_path, yaml_path)["name"] == "panda"
+    assert len(parses) == 1
+
+
+def test_environment_variables_are_expanded_after_loading(
+    tmp_path, monkeypatch, parses
+):
+    yaml_path = tmp_path / "paths.yml"
+    yaml_path.write_text("root: $REALM_ROOT/meshes\n")
+    monkeypatch.setenv("REALM_ROOT", "/first")
+    assert _load_in_new_process(tmp_path, yaml_path)["root"] == "/first/meshes"
+    monkeypatch.setenv("REALM_ROOT", "/second")
+    assert _load_in_new_process(tmp_path, yaml_path)["root"] == "/second/meshes"
+    assert len(parses) == 1
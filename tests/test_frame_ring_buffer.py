@@ -0,0 +1,62 @@
+from collections import deque
+
+import numpy as np
+
+from neuro_robotics.environment.rendering.pixel_observer import FrameRingBuffer
+
+FRAME_STACK = 3
+FRAME_SHAPE = (2, 4, 5)
+
+
+def write_frame(buffer: FrameRingBuffer, value: int) -> np.ndarray:
+    frame = np.full(FRAME_SHAPE, value, dtype=np.uint8)
+    buffer.slot()[...] = frame
+    return frame
+
+
+def test_push_returns_the_frames_oldest_first():
+    buffer = FrameRingBuffer(FRAME_STACK, FRAME_SHAPE)
+    assert buffer.observation_shape == (FRAME_STACK * 2, 4, 5)
+    frames = deque(maxlen=FRAME_STACK)
+    frames.extend([write_frame(buffer, 1)] * FRAME_STACK)
+    np.testing.assert_array_equal(buffer.fill(), np.concatenate(frames))
+    for value in range(2, 12):
+        frames.append(write_frame(buffer, value))
+        stack = buffer.push()
+        assert stack.shape == buffer.observation_shape
+        assert stack.nbytes == buffer.nbytes
+        np.testing.assert_array_equal(stack, np.concatenate(frames))
+
+
+def test_stack_is_a_view_of_the_ring():
+    buffer = FrameRingBuffer(FRAME_STACK, FRAME_SHAPE)
+    write_frame(buffer, 7)
+    stack = buffer.fill()
+    assert np.shares_memory(stack, buffer._rings)
+    assert stack.flags["C_CONTIGUOUS"]
+
+
+def test_fill_repeats_the_first_frame_of_an_episode():
+    buffer = FrameRingBuffer(FRAME_STACK, FRAME_SHAPE)
+    for value in range(1, 5):
+        write_frame(buffer, value)
+        buffer.push()
+    buffer.start_episode()
+    write_frame(buffer, 42)
+    np.testing.assert_array_equal(buffer.fill(), 42)
+
+
+def test_terminal_stack_survives_the_next_reset():
+    buffer = FrameRingBuffer(FRAME_STACK, FRAME_SHAPE)
+    write_frame(buffer, 1)
+    buffer.fill()
+    for value in (2, 3):
+        write_frame(buffer, value)
+        terminal = buffer.push()
+    expected = terminal.copy()
+    buffer.start_episode()
+    write_frame(buffer, 9)
+    buffer.fill()
+    write_frame(buffer, 10)
+    buffer.push()
+    np.testing.assert_array_equal(terminal, expected)
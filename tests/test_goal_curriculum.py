@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.environment.sampling import CurriculumSettings
+from neuro_robotics.environment.sampling.goal_curriculum import GoalCurriculum
+
+N_EPISODES = 300
+
+
+def make_curriculum(**kwargs) -> GoalCurriculum:
+    settings = dict(
+        use=True, n_buckets=4, window=10, min_episodes=5, promote_threshold=0.6
+    )
+    settings.update(kwargs)
+    return GoalCurriculum(CurriculumSettings(**settings))
+
+
+@pytest.mark.parametrize("initial_buckets", [0, 5])
+def test_initial_buckets_out_of_range_raise(initial_buckets):
+    with pytest.raises(SystemError):
+        make_curriculum(initial_buckets=initial_buckets)
+
+
+def test_difficulty_maps_to_equal_bands():
+    curriculum = make_curriculum()
+    assert [curriculum.bucket(d) for d in (0.0, 0.24, 0.25, 0.7, 0.99, 1.0)] == [
+        0,
+        0,
+        1,
+        2,
+        3,
+        3,
+    ]
+
+
+def test_no_promotion_before_min_episodes():
+    curriculum = make_curriculum()
+    assert curriculum.success_rate(0) == 0.0
+    assert not any(curriculum.record(0, True) for _ in range(4))
+    assert curriculum.level == 1
+    assert curriculum.record(0, True)
+    assert curriculum.level == 2
+
+
+def test_promotion_needs_the_threshold_on_the_frontier():
+    curriculum = make_curriculum(initial_buckets=2)
+    for success in (True, False, True, False, False):
+        assert not curriculum.record(1, success)
+    assert curriculum.success_rate(1) == pytest.approx(0.4)
+    # easier bands do not unlock anything
+    assert not any(curriculum.record(0, True) for _ in range(10))
+    # 3 / 6 and 4 / 7 stay below the threshold, 5 / 8 reaches it
+    assert not curriculum.record(1, True)
+    assert not curriculum.record(1, True)
+    assert curriculum.record(1, True)
+    assert curriculum.level == 3
+
+
+def test_window_forgets_old_outcomes():
+    curriculum = make_curriculum(promote_threshold=1.1)
+    for _ in range(10):
+        curriculum.record(0, False)
+    for _ in range(7):
+        curriculum.record(0, True)
+    assert curriculum.success_rate(0) == pytest.approx(0.7)
+    assert curriculum.statistics()["episodes_0"] == 10
+    for _ in range(3):
+        curriculum.record(0, True)
+    assert curriculum.success_rate(0) == 1.0
+
+
+def test_level_stops_at_the_last_band():
+    curriculum = make_curriculum(min_episodes=1, promote_threshold=0.0)
+    for bucket in range(10):
+        curriculum.record(min(bucket, 3), False)
+    assert curriculum.level == 4
+    statistics = curriculum.statistics()
+    assert statistics["level"] == 4
+    assert set(statistics) == {"level"} | {
+        f"{name}_{bucket}"
+        for name in ("success_rate", "episodes")
+        for bucket in range(4)
+    }
+
+
+@pytest.fixture
+def curriculum_env():
+    env = NeuroRoboticsEnv(
+        headless=True,
+        seed=0,
+        # every outcome counts, promotion only waits for the frontier episodes
+        goal_sampling=dict(
+            curriculum=dict(use=True, window=20, min_episodes=20, promote_threshold=0.0)
+        ),
+    )
+    yield env
+    env.close()
+
+
+def test_sampler_only_issues_unlocked_bands(curriculum_env):
+    sampler = curriculum_env.goal_sampler
+    n_buckets = curriculum_env.curriculum.settings.n_buckets
+    for level in range(1, n_buckets + 1):
+        conditions = [sampler.conditions(seed, level) for seed in range(N_EPISODES)]
+        goals = np.stack([condition.desired_goal for condition in conditions])
+        buckets = np.array([condition.bucket for condition in conditions])
+        assert np.all(sampler.separated(goals))
+        assert np.all(buckets < level)
+        if level == 1:
+            # the nearest band starts at the separation radius, it can be sampled
+            assert np.all(buckets == 0)
+
+
+def test_env_resets_promote_the_curriculum(curriculum_env):
+    curriculum = curriculum_env.curriculum
+    action = np.zeros(4, dtype=np.float32)
+    for _ in range(10 * curriculum.settings.min_episodes):
+        curriculum_env.reset()
+        assert curriculum_env.episode_bucket < curriculum.level
+        curriculum_env.step(action)
+        if curriculum.level == 3:
+            break
+    assert curriculum.level == 3
+    statistics = curriculum.statistics()
+    assert statistics["episodes_0"] >= curriculum.settings.min_episodes
+    assert statistics["episodes_1"] >= curriculum.settings.min_episodes
@@ -0,0 +1,205 @@
+import numpy as np
+import pytest
+from gym import spaces
+
+from neuro_robotics.algorithm.buffers import GoalEpisodeReplayBuffer
+from neuro_robotics.environment.reward import SparseRewardKernel
+
+NUM_ENVS = 2
+# env lanes end their episodes at different steps
+EPISODE_LENGTHS = (5, 7)
+N_ADDS = 90
+BATCH_SIZE = 512
+
+
+def tag(env_idx, episode, step):
+    """observations encode where they come from, unique within a run"""
+    return 10000 * env_idx + 100 * episode + step
+
+
+def decode(tags):
+    tags = np.rint(tags).astype(np.int64)
+    return tags // 10000, tags % 10000 // 100, tags % 100
+
+
+def observation(env_tags, episode_ids):
+    achieved_goal = np.zeros((len(env_tags), 3), dtype=np.float32)
+    achieved_goal[:, 0] = env_tags
+    desired_goal = np.zeros((len(env_tags), 3), dtype=np.float32)
+    desired_goal[:, 0] = -1.0 - np.asarray(episode_ids)
+    return {
+        # generate_observation_matrix appends the achieved goal to the state
+        "observation": np.concatenate(
+            [np.ones((len(env_tags), 1), dtype=np.float32), achieved_goal], axis=1
+        ),
+        "achieved_goal": achieved_goal,
+        "desired_goal": desired_goal,
+    }
+
+
+def fill(buffer, n_adds=N_ADDS, truncated=True):
+    steps = [0] * NUM_ENVS
+    episodes = [0] * NUM_ENVS
+    for _ in range(n_adds):
+        tags = [tag(idx, episodes[idx], steps[idx]) for idx in range(NUM_ENVS)]
+        next_tags = [tag(idx, episodes[idx], steps[idx] + 1) for idx in range(NUM_ENVS)]
+        episode_ids = [100 * idx + episodes[idx] for idx in range(NUM_ENVS)]
+        dones = np.array(
+            [steps[idx] + 1 == EPISODE_LENGTHS[idx] for idx in range(NUM_ENVS)]
+        )
+        infos = [{"TimeLimit.truncated": truncated and bool(done)} for done in dones]
+        buffer.add(
+            observation(tags, episode_ids),
+            observation(next_tags, episode_ids),
+            np.asarray(tags, dtype=np.float32)[:, None].repeat(4, axis=1),
+            np.zeros(NUM_ENVS, dtype=np.float32),
+            dones,
+            infos,
+        )
+        for idx in range(NUM_ENVS):
+            steps[idx] += 1
+            if dones[idx]:
+                steps[idx] = 0
+                episodes[idx] += 1
+
+
+@pytest.fixture(params=[None, -3], ids=["stored_goal", "sliced_goal"])
+def buffer(request):
+    observation_space = spaces.Dict(
+        {
+            "observation": spaces.Box(-np.inf, np.inf, (4,), dtype=np.float32),
+            "achieved_goal": spaces.Box(-np.inf, np.inf, (3,), dtype=np.float32),
+            "desired_goal": spaces.Box(-np.inf, np.inf, (3,), dtype=np.float32),
+        }
+    )
+    action_space = spaces.Box(-1.0, 1.0, (4,), dtype=np.float32)
+    kernel = SparseRewardKernel(0.05)
+    buffer = GoalEpisodeReplayBuffer(
+        # fewer rows than steps, the lanes wrap around
+        2 * 40,
+        observation_space,
+        action_space,
+        device="cpu",
+        n_envs=NUM_ENVS,
+        compute_reward=kernel.compute_reward,
+        n_sampled_goal=4,
+        achieved_goal_offset=request.param,
+    )
+    np.random.seed(0)
+    fill(buffer)
+    return buffer
+
+
+def sample(buffer):
+    samples = buffer.sample(BATCH_SIZE)
+    observations = {key: value.numpy() for key, value in samples.observations.items()}
+    next_observations = {
+        key: value.numpy() for key, value in samples.next_observations.items()
+    }
+    return samples, observations, next_observations
+
+
+def test_stores_one_row_per_step_and_terminal(buffer):
+    assert buffer.n_rows == 40
+    assert buffer.size() > 0
+    assert buffer.full
+
+
+def test_next_observation_is_the_next_row_of_the_episode(buffer):
+    _, observations, next_observations = sample(buffer)
+    env_idx, episode, step = decode(observations["achieved_goal"][:, 0])
+    next_env_idx, next_episode, next_step = decode(
+        next_observations["achieved_goal"][:, 0]
+    )
+    np.testing.assert_array_equal(next_env_idx, env_idx)
+    np.testing.assert_array_equal(next_episode, episode)
+    np.testing.assert_array_equal(next_step, step + 1)
+    assert np.all(next_step <= np.take(EPISODE_LENGTHS, env_idx))
+    # the terminal observation is a next observation only
+    assert np.all(step < np.take(EPISODE_LENGTHS, env_idx))
+    np.testing.assert_array_equal(
+        observations["observation"][:, -3:], observations["achieved_goal"]
+    )
+
+
+def test_relabels_with_future_goals_of_the_same_episode(buffer):
+    _, observations, next_observations = sample(buffer)
+    env_idx, episode, step = decode(observations["achieved_goal"][:, 0])
+    desired_goal = observations["desired_goal"][:, 0]
+    np.testing.assert_array_equal(next_observations["desired_goal"][:, 0], desired_goal)
+
+    relabeled = desired_goal >= 0
+    original_episode_ids = -1 - np.rint(desired_goal[~relabeled]).astype(np.int64)
+    np.testing.assert_array_equal(
+        original_episode_ids, 100 * env_idx[~relabeled] + episode[~relabeled]
+    )
+
+    goal_env_idx, goal_episode, goal_step = decode(desired_goal[relabeled])
+    np.testing.assert_array_equal(goal_env_idx, env_idx[relabeled])
+    np.testing.assert_array_equal(goal_episode, episode[relabeled])
+    assert np.all(goal_step > step[relabeled])
+    assert np.all(goal_step <= np.take(EPISODE_LENGTHS, goal_env_idx))
+    # her_ratio = 1 - 1 / (n_sampled_goal + 1)
+    assert 0.7 < relabeled.mean() < 0.9
+
+
+def test_rewards_are_recomputed_for_the_relabeled_goal(buffer):
+    samples, observations, next_observations = sample(buffer)
+    expected = SparseRewardKernel(0.05).compute_reward(
+        next_observations["achieved_goal"], observations["desired_goal"], None
+    )
+    np.testing.assert_array_equal(samples.rewards.numpy()[:, 0], expected)
+    assert np.any(expected == 0.0)
+
+
+def test_actions_belong_to_the_sampled_row(buffer):
+    samples, observations, _ = sample(buffer)
+    np.testing.assert_array_equal(
+        samples.actions.numpy()[:, 0], observations["achieved_goal"][:, 0]
+    )
+
+
+def test_time_limits_are_not_terminal(buffer):
+    samples, _, _ = sample(buffer)
+    assert not samples.dones.numpy().any()
+
+
+def test_terminations_are_terminal(buffer):
+    buffer.reset()
+    fill(buffer, truncated=False)
+    samples, observations, _ = sample(buffer)
+    env_idx, _, step = decode(observations["achieved_goal"][:, 0])
+    np.testing.assert_array_equal(
+        samples.dones.numpy()[:, 0], step + 1 == np.take(EPISODE_LENGTHS, env_idx)
+    )
+
+
+def test_rejects_a_goal_that_is_not_a_slice_of_the_observation(buffer):
+    if not buffer.deduplicate_achieved_goal:
+        pytest.skip("the achieved goal is stored")
+    buffer.reset()
+    buffer._goal_slice_checked = False
+    obs = observation([1.0, 2.0], [0, 1])
+    obs["observation"][:, -3:] += 1.0
+    with pytest.raises(SystemError):
+        buffer.add(
+            obs,
+            obs,
+            np.zeros((NUM_ENVS, 4), dtype=np.float32),
+            np.zeros(NUM_ENVS, dtype=np.float32),
+            np.zeros(NUM_ENVS, dtype=bool),
+            [{}, {}],
+        )
+
+
+def test_flat_indices_address_the_env_lanes(buffer):
+    batch_inds = np.flatnonzero(buffer.is_transition)
+    samples = buffer._get_samples(batch_inds)
+    env_idx, rows = np.divmod(batch_inds, buffer.n_rows)
+    achieved_goal = samples.observations["achieved_goal"].numpy()
+    np.testing.assert_array_equal(decode(achieved_goal[:, 0])[0], env_idx)
+    np.testing.assert_array_equal(
+        samples.actions.numpy(), buffer.actions[env_idx, rows]
+    )
+    with pytest.raises(SystemError):
+        buffer._get_samples(np.flatnonzero(~buffer.is_transition)[:1])
@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.environment.sampling import GoalSampler
+from neuro_robotics.utils.common import seeding
+
+QUEUE_SIZE = 8
+EPISODE_SEEDS = [0, 1, 7, 12345, 2**31 - 1]
+
+
+@pytest.fixture
+def env():
+    env = NeuroRoboticsEnv(
+        headless=True, seed=0, goal_sampling=dict(queue_size=QUEUE_SIZE)
+    )
+    yield env
+    env.close()
+
+
+def make_sampler(env, seed, **settings):
+    return GoalSampler(
+        env.realm.goal,
+        env.realm.distance_threshold,
+        seeding.make_generator(seed)[0],
+        settings=dict(queue_size=QUEUE_SIZE, **settings),
+    )
+
+
+@pytest.mark.parametrize("episode_seed", EPISODE_SEEDS)
+def test_episode_seed_fixes_the_goal(env, episode_seed):
+    goals = [
+        make_sampler(env, env_seed).conditions(episode_seed).desired_goal
+        for env_seed in (0, 1, 2)
+    ]
+    for goal in goals[1:]:
+        np.testing.assert_array_equal(goal, goals[0])
+
+
+def test_queued_episodes_match_their_explicit_seed(env):
+    sampler = make_sampler(env, 3)
+    for _ in range(2 * QUEUE_SIZE + 1):
+        queued = sampler.next()
+        explicit = sampler.next(episode_seed=queued.episode_seed)
+        assert explicit.episode_seed == queued.episode_seed
+        np.testing.assert_array_equal(explicit.desired_goal, queued.desired_goal)
+
+
+def test_env_seed_fixes_the_episode_sequence(env):
+    first, second = make_sampler(env, 5), make_sampler(env, 5)
+    seeds = [first.next().episode_seed for _ in range(2 * QUEUE_SIZE)]
+    assert seeds == [second.next().episode_seed for _ in range(2 * QUEUE_SIZE)]
+    assert len(set(seeds)) == len(seeds)
+    assert seeds != [make_sampler(env, 6).next().episode_seed for _ in seeds]
+
+
+def test_goals_are_separated_and_inside_the_goal_box(env):
+    sampler = make_sampler(env, 0)
+    goal = env.realm.goal
+    goals = np.array([sampler.next().desired_goal for _ in range(4 * QUEUE_SIZE)])
+    assert np.all(sampler.separated(goals))
+    assert np.all(goals[:, :2] >= np.asarray(goal.goal_range_low)[:2])
+    assert np.all(goals[:, :2] <= np.asarray(goal.goal_range_high)[:2])
+
+
+def test_episode_draws_its_candidates_in_one_call(env, monkeypatch):
+    sampler = make_sampler(env, 0)
+    calls = []
+    sample_goals = env.realm.goal.sample_goals
+
+    def counted(np_random, n_goals):
+        calls.append(n_goals)
+        return sample_goals(np_random, n_goals)
+
+    monkeypatch.setattr(env.realm.goal, "sample_goals", counted)
+    # the first queue was drawn on construction, popping past it refills once
+    for _ in range(QUEUE_SIZE + 1):
+        sampler.next()
+    assert calls == [sampler.settings.n_candidates] * QUEUE_SIZE
+
+
+def test_episode_without_separated_candidates_gets_the_fallback_goal(env):
+    sampler = make_sampler(env, 0, n_candidates=1)
+    for episode_seed in range(10_000):
+        np_random, _ = seeding.make_generator(episode_seed)
+        if not sampler.separated(env.realm.goal.sample_goals(np_random, 1)).any():
+            break
+    else:
+        pytest.fail("every single candidate was separated")
+    np.testing.assert_array_equal(
+        sampler.conditions(episode_seed).desired_goal, sampler.fallback_goal
+    )
+
+
+@pytest.mark.parametrize("episode_seed", EPISODE_SEEDS)
+def test_reset_with_a_seed_uses_its_goal(env, episode_seed):
+    observation = env.reset(seed=episode_seed)
+    assert env.episode_seed == episode_seed
+    np.testing.assert_array_equal(
+        observation["desired_goal"],
+        env.goal_sampler.conditions(episode_seed).desired_goal,
+    )
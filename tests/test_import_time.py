@@ -0,0 +1,11 @@
+from neuro_robotics.benchmarks.import_time import IMPORT_BUDGET_MS
+from neuro_robotics.benchmarks.import_time import profile_env_construction
+
+
+def test_env_construction_stays_light():
+    total_ms, leaked, outermost = profile_env_construction()
+    assert not leaked, f"env construction imported heavy modules: {leaked}"
+    slowest = sorted(outermost.items(), key=lambda x: -x[1])[:5]
+    assert (
+        total_ms < IMPORT_BUDGET_MS
+    ), f"import took {total_ms:.1f}ms, slowest packages (us): {slowest}"
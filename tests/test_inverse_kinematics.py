@@ -0,0 +1,125 @@
+import numpy as np
+import pybullet as p
+import pytest
+from pybullet_utils import bullet_client as bc
+
+from neuro_robotics.benchmarks.inverse_kinematics import position_residual
+from neuro_robotics.benchmarks.inverse_kinematics import sample_problems
+from neuro_robotics.benchmarks.inverse_kinematics import solve_with_bullet
+from neuro_robotics.environment.abstract import RobotEntity
+from neuro_robotics.environment.kinematics import DampedLeastSquaresSolver
+from neuro_robotics.environment.kinematics import KinematicChain
+from neuro_robotics.environment.model.configuration import realm_registry
+
+N_PROBLEMS = 64
+DISPLACEMENT = 0.05
+
+
+@pytest.fixture(scope="module")
+def metadata():
+    return realm_registry.depiction("panda").robot
+
+
+@pytest.fixture(scope="module")
+def chain(metadata):
+    return KinematicChain.from_urdf(
+        metadata.description_file_location, metadata.effector_link_id
+    )
+
+
+@pytest.fixture(scope="module")
+def solver(metadata, chain):
+    return DampedLeastSquaresSolver(
+        chain,
+        damping=metadata.inverse_kinematics_damping,
+        max_iterations=metadata.inverse_kinematics_max_iterations,
+        tolerance=metadata.inverse_kinematics_tolerance,
+    )
+
+
+@pytest.fixture(scope="module")
+def problems(metadata, chain):
+    neutral_position = np.array(
+        metadata.control_joints_neutral_position[: chain.n_joints]
+    )
+    return sample_problems(
+        chain,
+        neutral_position,
+        N_PROBLEMS,
+        DISPLACEMENT,
+        np.random.default_rng(0),
+    )
+
+
+@pytest.fixture
+def client(metadata):
+    client = bc.BulletClient(connection_mode=p.DIRECT)
+    model = client.loadURDF(metadata.description_file_location, useFixedBase=True)
+    yield client, model
+    client.disconnect()
+
+
+def _bullet_link_position(client, model, chain, link, joint_angles):
+    for joint, angle in zip(chain.joint_indices, joint_angles):
+        client.resetJointState(model, joint, angle)
+    return np.array(client.getLinkState(model, link, computeForwardKinematics=True)[4])
+
+
+def test_forward_kinematics_matches_bullet(client, metadata, chain, problems):
+    warm_start, _ = problems
+    tip_transform, _, _ = chain.forward_kinematics(warm_start)
+    for joint_angles, tip_position in zip(warm_start, tip_transform[:, :3, 3]):
+        np.testing.assert_allclose(
+            tip_position,
+            _bullet_link_position(
+                *client, chain, metadata.effector_link_id, joint_angles
+            ),
+            atol=1e-6,
+        )
+
+
+def test_dls_converges_where_bullet_is_approximate(metadata, chain, solver, problems):
+    warm_start, target_position = problems
+    solution = solver.solve(
+        target_position, RobotEntity.effector_orientation, warm_start
+    )
+    residual = position_residual(chain, solution.joint_angles, target_position)
+    bullet_angles, _ = solve_with_bullet(metadata, chain, warm_start, target_position)
+    bullet_residual = position_residual(chain, bullet_angles, target_position)
+
+    np.testing.assert_allclose(solution.position_residual, residual, atol=1e-12)
+    assert residual.max() <= solver.tolerance
+    assert solution.orientation_residual.max() <= solver.tolerance
+    assert solution.iterations < solver.max_iterations
+    # a single calculateInverseKinematics call stops short of the target
+    assert np.median(residual) < np.median(bullet_residual)
+    assert np.all(solution.joint_angles >= chain.lower_limits)
+    assert np.all(solution.joint_angles <= chain.upper_limits)
+
+
+def test_dls_solutions_reach_the_target_in_bullet(
+    client, metadata, chain, solver, problems
+):
+    warm_start, target_position = problems
+    solution = solver.solve(
+        target_position, RobotEntity.effector_orientation, warm_start
+    )
+    for joint_angles, target in zip(solution.joint_angles, target_position):
+        position = _bullet_link_position(
+            *client, chain, metadata.effector_link_id, joint_angles
+        )
+        assert np.linalg.norm(position - target) <= solver.tolerance
+
+
+def test_batched_solve_matches_single_solves(solver, problems):
+    warm_start, target_position = problems
+    batched = solver.solve(
+        target_position, RobotEntity.effector_orientation, warm_start
+    )
+    for idx in range(8):
+        single = solver.solve(
+            target_position[idx], RobotEntity.effector_orientation, warm_start[idx]
+        )
+        np.testing.assert_allclose(
+            single.joint_angles[0], batched.joint_angles[idx], atol=1e-9
+        )
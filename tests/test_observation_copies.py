@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+
+N_STEPS = 4
+
+
+def rollout(env):
+    actions = np.random.default_rng(0).uniform(-1.0, 1.0, size=(N_STEPS, 4))
+    observations = [env.reset()]
+    for action in actions.astype(np.float32):
+        observations.append(env.step(action)[0])
+    return observations
+
+
+def copy(observation):
+    return {key: value.copy() for key, value in observation.items()}
+
+
+def test_observations_are_owned_by_default():
+    env = NeuroRoboticsEnv(headless=True, seed=0)
+    try:
+        assert env.copy_observations
+        observations = rollout(env)
+        for observation, later in zip(observations, observations[1:]):
+            for key, value in observation.items():
+                assert not np.shares_memory(value, later[key])
+    finally:
+        env.close()
+
+
+@pytest.mark.parametrize("copy_observations", [True, False])
+def test_only_views_are_overwritten_by_later_steps(copy_observations):
+    env = NeuroRoboticsEnv(headless=True, seed=0, copy_observations=copy_observations)
+    try:
+        actions = np.random.default_rng(0).uniform(-1.0, 1.0, size=(N_STEPS, 4))
+        observations, snapshots = [env.reset()], []
+        snapshots.append(copy(observations[0]))
+        for action in actions.astype(np.float32):
+            observations.append(env.step(action)[0])
+            snapshots.append(copy(observations[-1]))
+        # the realm alternates two buffer sets, views survive exactly one step
+        for observation, snapshot in zip(observations[-2:], snapshots[-2:]):
+            for key, value in observation.items():
+                np.testing.assert_array_equal(value, snapshot[key])
+        overwritten = any(
+            not np.array_equal(value, snapshot[key])
+            for observation, snapshot in zip(observations[:-2], snapshots[:-2])
+            for key, value in observation.items()
+        )
+        assert overwritten != copy_observations
+    finally:
+        env.close()
@@ -0,0 +1,58 @@
+import numpy as np
+import pybullet as p
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+
+WIDTH, HEIGHT = 48, 36
+POOL_SIZE = 3
+
+
+@pytest.fixture
+def env():
+    env = NeuroRoboticsEnv(
+        seed=0,
+        rendering=dict(width=WIDTH, height=HEIGHT, pool_size=POOL_SIZE),
+    )
+    env.reset()
+    yield env
+    env.close()
+
+
+def _camera_image(env):
+    renderer = env.renderer
+    _, _, rgba, _, _ = env.physics_client.getCameraImage(
+        width=WIDTH,
+        height=HEIGHT,
+        viewMatrix=renderer.view_matrix,
+        projectionMatrix=renderer.projection_matrix,
+        renderer=p.ER_TINY_RENDERER,
+    )
+    return np.reshape(np.asarray(rgba, dtype=np.uint8), (HEIGHT, WIDTH, 4))[..., :3]
+
+
+def test_renderer_is_created_on_first_render(env):
+    assert env._renderer is None
+    frame = env.render(mode="rgb_array")
+    assert env._renderer is not None
+    assert frame.shape == (HEIGHT, WIDTH, 3)
+    assert frame.dtype == np.uint8
+
+
+def test_frame_matches_the_bullet_camera_image(env):
+    frame = env.render(mode="rgb_array")
+    np.testing.assert_array_equal(frame, _camera_image(env))
+    assert len(np.unique(frame.reshape(-1, 3), axis=0)) > 1
+
+
+def test_frames_stay_valid_for_the_pool_size(env):
+    frames, copies = [], []
+    for _ in range(POOL_SIZE):
+        env.step(env.action_space.sample())
+        frames.append(env.render(mode="rgb_array"))
+        copies.append(frames[-1].copy())
+    for frame, copy in zip(frames, copies):
+        np.testing.assert_array_equal(frame, copy)
+    # the next render reuses the buffer of the oldest frame
+    assert np.shares_memory(env.render(mode="rgb_array"), frames[0])
+    assert env.renderer.frames_rendered == POOL_SIZE + 1
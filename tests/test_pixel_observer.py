@@ -0,0 +1,75 @@
+import numpy as np
+import pybullet as p
+import pybullet_data
+import pytest
+from pybullet_utils.bullet_client import BulletClient
+
+from neuro_robotics.environment.rendering import OffscreenRenderer
+from neuro_robotics.environment.rendering import PixelObservationSettings
+from neuro_robotics.environment.rendering import PixelObserver
+from neuro_robotics.environment.rendering import RenderSettings
+
+WIDTH, HEIGHT = 32, 24
+
+
+@pytest.fixture
+def client():
+    client = BulletClient(connection_mode=p.DIRECT)
+    client.setAdditionalSearchPath(pybullet_data.getDataPath())
+    client.loadURDF("plane.urdf")
+    client.loadURDF("cube_small.urdf", basePosition=(0.35, 0.0, 0.1))
+    yield client
+    client.disconnect()
+
+
+def _raw_camera_image(client, camera):
+    view_matrix = client.computeViewMatrixFromYawPitchRoll(
+        cameraTargetPosition=camera.target_position,
+        distance=camera.distance,
+        yaw=camera.yaw,
+        pitch=camera.pitch,
+        roll=camera.roll,
+        upAxisIndex=2,
+    )
+    projection_matrix = client.computeProjectionMatrixFOV(
+        fov=camera.fov, aspect=WIDTH / HEIGHT, nearVal=camera.near, farVal=camera.far
+    )
+    _, _, rgba, depth, _ = client.getCameraImage(
+        width=WIDTH,
+        height=HEIGHT,
+        viewMatrix=view_matrix,
+        projectionMatrix=projection_matrix,
+        renderer=p.ER_TINY_RENDERER,
+    )
+    rgba = np.reshape(np.asarray(rgba, dtype=np.uint8), (HEIGHT, WIDTH, 4))
+    depth = np.reshape(np.asarray(depth, dtype=np.float32), (HEIGHT, WIDTH))
+    return (view_matrix, projection_matrix), rgba, depth
+
+
+def test_renderer_and_observer_share_the_camera_matrices(client):
+    observation = PixelObservationSettings(mode="pixels", width=WIDTH, height=HEIGHT)
+    render = RenderSettings(width=WIDTH, height=HEIGHT, camera=observation.camera)
+    matrices, _, _ = _raw_camera_image(client, observation.camera)
+    observer = PixelObserver(client, observation)
+    renderer = OffscreenRenderer(client, render)
+    assert (observer.view_matrix, observer.projection_matrix) == matrices
+    assert (renderer.view_matrix, renderer.projection_matrix) == matrices
+
+
+def test_rgbd_observation_matches_the_camera_image(client):
+    settings = PixelObservationSettings(
+        mode="pixels", width=WIDTH, height=HEIGHT, channels="rgbd", frame_stack=2
+    )
+    camera = settings.camera
+    _, rgba, depth = _raw_camera_image(client, camera)
+    observation = PixelObserver(client, settings).reset()
+    assert observation.shape == (2 * 4, HEIGHT, WIDTH)
+    assert observation.dtype == np.uint8
+    np.testing.assert_array_equal(observation[:3], rgba[:, :, :3].transpose(2, 0, 1))
+    linear_depth = (
+        camera.far * camera.near / (camera.far - (camera.far - camera.near) * depth)
+    )
+    expected_depth = np.clip(linear_depth * (255.0 / camera.far), 0, 255)
+    np.testing.assert_allclose(observation[3], expected_depth, atol=1)
+    # the reset stack repeats the first frame
+    np.testing.assert_array_equal(observation[4:], observation[:4])
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.utils.common import constants
+from neuro_robotics.utils.common.profiling import bucket_index
+from neuro_robotics.utils.common.profiling import bucket_upper_ns
+from neuro_robotics.utils.common.profiling import StepProfiler
+
+LATENCIES_NS = [0, 1, 7, 8, 9, 15, 16, 999, 1000, 1024, 123_456, 10**9, 10**12]
+
+
+@pytest.mark.parametrize("elapsed_ns", LATENCIES_NS)
+def test_bucket_brackets_the_latency_within_a_quarter(elapsed_ns):
+    index = bucket_index(elapsed_ns)
+    upper_ns = bucket_upper_ns(index)
+    lower_ns = bucket_upper_ns(index - 1) if index else 0
+    assert lower_ns <= elapsed_ns < upper_ns
+    assert upper_ns - lower_ns <= max(1, elapsed_ns / 4)
+
+
+def test_buckets_are_contiguous_and_increasing():
+    edges = [
+        bucket_upper_ns(index) for index in range(constants.Profiling.N_BUCKETS.value)
+    ]
+    assert edges == sorted(set(edges))
+    for index, edge in enumerate(edges[:-1]):
+        assert bucket_index(edge - 1) == index
+        assert bucket_index(edge) == index + 1
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = StepProfiler(enabled=False)
+    assert profiler.lap(constants.ProfilePhase.STEP, profiler.now()) == 0
+    assert profiler.summary() == {}
+
+
+def test_lap_counts_every_phase_once():
+    profiler = StepProfiler()
+    for _ in range(5):
+        start = profiler.now()
+        start = profiler.lap(constants.ProfilePhase.ACT, start)
+        profiler.lap(constants.ProfilePhase.PHYSICS, start)
+    summary = profiler.summary()
+    assert set(summary) == {"act", "physics"}
+    for statistics in summary.values():
+        assert statistics["count"] == 5
+        assert 0 <= statistics["p50_us"] <= statistics["p99_us"] <= statistics["max_us"]
+    profiler.clear()
+    assert profiler.summary() == {}
+
+
+def synthetic_snapshot(latencies_ns, phase=constants.ProfilePhase.STEP):
+    n_phases = len(constants.ProfilePhase)
+    counts = np.zeros((n_phases, constants.Profiling.N_BUCKETS.value), dtype=np.int64)
+    for latency in latencies_ns:
+        counts[phase.value, bucket_index(latency)] += 1
+    total_ns = np.zeros(n_phases, dtype=np.int64)
+    total_ns[phase.value] = sum(latencies_ns)
+    max_ns = np.zeros(n_phases, dtype=np.int64)
+    max_ns[phase.value] = max(latencies_ns)
+    return dict(counts=counts, total_ns=total_ns, max_ns=max_ns)
+
+
+def test_percentiles_come_from_the_histogram():
+    latencies_ns = [10_000] * 90 + [1_000_000] * 10
+    statistics = StepProfiler.summarize(synthetic_snapshot(latencies_ns))["step"]
+    assert statistics["count"] == 100
+    assert statistics["mean_us"] == pytest.approx(np.mean(latencies_ns) / 1e3)
+    assert 10.0 <= statistics["p50_us"] < 12.5
+    assert 10.0 <= statistics["p90_us"] < 12.5
+    # capped at the largest recorded latency
+    assert statistics["p99_us"] == statistics["max_us"] == 1000.0
+
+
+def test_merge_adds_counts_and_keeps_the_slowest():
+    merged = StepProfiler.merge(
+        [synthetic_snapshot([1_000] * 3), synthetic_snapshot([5_000, 80_000])]
+    )
+    statistics = StepProfiler.summarize(merged)["step"]
+    assert statistics["count"] == 5
+    assert statistics["max_us"] == 80.0
+    assert statistics["mean_us"] == pytest.approx(88.0 / 5)
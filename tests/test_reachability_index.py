@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.environment.kinematics import load_reachability_index
+from neuro_robotics.environment.kinematics import ReachabilityIndex
+
+N_GOALS = 2000
+
+
+@pytest.fixture
+def index():
+    occupancy = np.zeros((4, 4, 4), dtype=bool)
+    occupancy[1:3, 1:3, 0] = True
+    return ReachabilityIndex(np.array([-0.2, -0.2, 0.0]), 0.1, occupancy)
+
+
+def test_lookups_follow_the_occupancy(index):
+    positions = np.array([[-0.05, -0.05, 0.05], [0.15, 0.15, 0.05], [0.0, 0.0, 0.5]])
+    np.testing.assert_array_equal(index.contains(positions), [True, False, False])
+
+
+def test_region_samples_stay_in_reachable_cells_and_the_box(index):
+    low, high = np.array([-0.2, -0.2, 0.02]), np.array([0.2, 0.05, 0.08])
+    region = index.region(low, high)
+    samples = region.sample_batch(np.random.default_rng(0), N_GOALS)
+    assert np.all(index.contains(samples))
+    assert np.all((samples >= low) & (samples <= high))
+    with pytest.raises(SystemError):
+        index.region(np.full(3, 1.0), np.full(3, 2.0))
+
+
+def test_saved_index_round_trips(index, tmp_path):
+    path = tmp_path / "index.npz"
+    index.save(path)
+    loaded = ReachabilityIndex.load(path)
+    np.testing.assert_array_equal(loaded.occupancy, index.occupancy)
+    np.testing.assert_array_equal(loaded.origin, index.origin)
+    assert loaded.voxel_size == index.voxel_size
+
+
+@pytest.mark.parametrize("use_reachability_index", [False, True])
+def test_env_goals_follow_the_setting(use_reachability_index):
+    env = NeuroRoboticsEnv(
+        headless=True,
+        goal_sampling=dict(use_reachability_index=use_reachability_index),
+    )
+    try:
+        goal = env.realm.goal
+        assert (goal.reachable_goals is not None) == use_reachability_index
+        goals = goal.sample_goals(np.random.default_rng(0), N_GOALS)
+        assert np.all(goals >= goal.goal_range_low)
+        assert np.all(goals <= goal.goal_range_high + goal.object_size / 2)
+        if use_reachability_index:
+            index = load_reachability_index(env.realm.reachability_index_path)
+            lift = np.array([0.0, 0.0, goal.object_size / 2])
+            robot_position = np.array(env.realm.robot.init_position)
+            positions = goals - lift - robot_position
+            # float32 goals may round onto the upper face of their cell
+            reachable = index.contains(positions) | index.contains(positions - 1e-6)
+            assert np.all(reachable)
+    finally:
+        env.close()
@@ -0,0 +1,93 @@
+import subprocess
+import sys
+
+import attrs
+import gym
+import numpy as np
+import pytest
+
+import neuro_robotics  # noqa: F401 registers the env ids
+from neuro_robotics.environment.model.configuration import realm_registry
+from neuro_robotics.environment.model.configuration import RealmRegistry
+from neuro_robotics.utils.common import constants
+
+MANIFEST_DIR = constants.RealmManifest.MANIFEST_DIR.value
+
+
+def test_every_manifest_is_a_realm():
+    assert realm_registry.available() == ["cr_168", "panda"]
+    for realm in realm_registry.available():
+        assert realm_registry.manifest_path(realm).exists()
+
+
+def test_depictions_are_compiled_once_and_frozen():
+    registry = RealmRegistry()
+    depiction = registry.depiction("panda")
+    assert registry.depiction("panda") is depiction
+    assert depiction.realm == "panda"
+    assert depiction.alias_of is None
+    with pytest.raises(attrs.exceptions.FrozenInstanceError):
+        depiction.distance_threshold = 1.0
+    registry.clear()
+    assert registry.depiction("panda") is not depiction
+    assert registry.depiction("panda") == depiction
+
+
+def test_unknown_realm_is_refused():
+    with pytest.raises(SystemError, match="cr_168"):
+        RealmRegistry().depiction("ur5")
+
+
+def test_new_manifest_adds_a_realm(tmp_path):
+    manifest = (MANIFEST_DIR / "panda.yml").read_text()
+    (tmp_path / "wide_panda.yml").write_text(
+        manifest.replace("distance_threshold: .05", "distance_threshold: .1")
+    )
+    registry = RealmRegistry(tmp_path)
+    assert registry.available() == ["wide_panda"]
+    depiction = registry.depiction("wide_panda")
+    assert depiction.distance_threshold == pytest.approx(0.1)
+    assert depiction.robot == realm_registry.depiction("panda").robot
+
+
+@pytest.mark.parametrize("realm", ["panda", "cr_168"])
+def test_every_realm_has_an_env_id(realm):
+    env_id = constants.RealmManifest.ENV_IDENTIFIER.value.format(realm=realm)
+    env = gym.make(env_id, headless=True, seed=0)
+    try:
+        observation = env.reset()
+        assert env.unwrapped.realm.depiction.realm == realm
+        assert env.observation_space.contains(observation)
+        assert env.unwrapped.compute_reward(
+            observation["achieved_goal"], observation["achieved_goal"], None
+        ) == pytest.approx(0.0)
+    finally:
+        env.close()
+
+
+def test_default_env_id_makes_the_panda_realm():
+    env = gym.make("NeuroRobotics-v1", headless=True, seed=0)
+    try:
+        assert env.unwrapped.realm.depiction.realm == constants.Realm.PANDA.value
+    finally:
+        env.close()
+
+
+def test_importing_the_package_parses_no_manifest():
+    code = (
+        "import sys, neuro_robotics\n"
+        "print(sorted(m for m in sys.modules if m.startswith("
+        "('neuro_robotics.environment', 'yaml'))))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert output[-1] == "[]"
+
+
+def test_cr_168_still_runs_the_panda_arm():
+    panda, cr_168 = (realm_registry.depiction(realm) for realm in ("panda", "cr_168"))
+    assert cr_168.alias_of == "panda"
+    assert cr_168.robot == panda.robot
+    assert cr_168.reachability_index_path != panda.reachability_index_path
+    np.testing.assert_array_equal(cr_168.goal.range_low, panda.goal.range_low)
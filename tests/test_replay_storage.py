@@ -0,0 +1,113 @@
+import json
+
+import numpy as np
+import pytest
+from gym import spaces
+
+from neuro_robotics.algorithm.buffers import GoalEpisodeReplayBuffer
+from neuro_robotics.algorithm.buffers import ReplayStorage
+from neuro_robotics.environment.reward import SparseRewardKernel
+from tests.test_goal_episode_replay_buffer import decode
+from tests.test_goal_episode_replay_buffer import fill
+from tests.test_goal_episode_replay_buffer import NUM_ENVS
+from tests.test_goal_episode_replay_buffer import sample
+
+FLUSH_INTERVAL = 10
+FLUSHED_ADDS = 40
+# the run crashes this many steps after its last flush
+UNFLUSHED_ADDS = 7
+
+
+def make_buffer(storage_dir=None, **kwargs):
+    observation_space = spaces.Dict(
+        {
+            "observation": spaces.Box(-np.inf, np.inf, (4,), dtype=np.float32),
+            "achieved_goal": spaces.Box(-np.inf, np.inf, (3,), dtype=np.float32),
+            "desired_goal": spaces.Box(-np.inf, np.inf, (3,), dtype=np.float32),
+        }
+    )
+    return GoalEpisodeReplayBuffer(
+        # fewer rows than steps, the lanes wrap around
+        2 * 30,
+        observation_space,
+        spaces.Box(-1.0, 1.0, (4,), dtype=np.float32),
+        device="cpu",
+        n_envs=NUM_ENVS,
+        compute_reward=SparseRewardKernel(0.05).compute_reward,
+        n_sampled_goal=4,
+        storage_dir=storage_dir,
+        flush_interval=FLUSH_INTERVAL,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def crashed_dir(tmp_path):
+    """a run killed between two flushes, its memmaps hold unflushed rows"""
+    buffer = make_buffer(tmp_path)
+    fill(buffer, n_adds=FLUSHED_ADDS + UNFLUSHED_ADDS)
+    for array in buffer.storage.arrays.values():
+        array.flush()
+    del buffer
+    return tmp_path
+
+
+def test_resume_keeps_the_flushed_transitions(crashed_dir):
+    reference = make_buffer()
+    fill(reference, n_adds=FLUSHED_ADDS)
+    resumed = make_buffer(crashed_dir)
+
+    assert resumed.n_steps == FLUSHED_ADDS
+    np.testing.assert_array_equal(resumed.rows, reference.rows)
+    assert resumed.size() == np.count_nonzero(resumed.is_transition)
+    # every transition that survived is the one the flushed run had stored
+    assert not np.any(resumed.is_transition & ~reference.is_transition)
+    env_indices, rows = np.nonzero(resumed.is_transition)
+    next_rows = (rows + 1) % resumed.n_rows
+    for key, array in resumed.observations.items():
+        np.testing.assert_array_equal(
+            array[env_indices, rows], reference.observations[key][env_indices, rows]
+        )
+        np.testing.assert_array_equal(
+            array[env_indices, next_rows],
+            reference.observations[key][env_indices, next_rows],
+        )
+    # only rows next to the write cursor of each lane are given up
+    lost = reference.size() - resumed.size()
+    assert 0 <= lost <= NUM_ENVS * (2 * FLUSH_INTERVAL + 2)
+
+
+def test_resumed_buffer_samples_and_keeps_learning(crashed_dir):
+    resumed = make_buffer(crashed_dir)
+    np.random.seed(0)
+    fill(resumed, n_adds=25)
+    _, observations, next_observations = sample(resumed)
+    env_idx, episode, step = decode(observations["achieved_goal"][:, 0])
+    next_env_idx, next_episode, next_step = decode(
+        next_observations["achieved_goal"][:, 0]
+    )
+    np.testing.assert_array_equal(next_env_idx, env_idx)
+    np.testing.assert_array_equal(next_episode, episode)
+    np.testing.assert_array_equal(next_step, step + 1)
+    assert resumed.n_steps == FLUSHED_ADDS + 25
+
+
+def test_interrupted_episodes_are_closed_at_their_last_flushed_row(crashed_dir):
+    resumed = make_buffer(crashed_dir)
+    env_indices, rows = np.nonzero(resumed.is_transition)
+    # every stored transition can draw future goals from its own episode
+    assert np.all(resumed.episode_end[env_indices, rows] >= 0)
+    assert not resumed.in_episode.any()
+
+
+def test_resume_refuses_a_different_layout(crashed_dir):
+    with pytest.raises(SystemError):
+        make_buffer(crashed_dir, storage_dtype="float16")
+
+
+def test_resume_refuses_another_storage_version(crashed_dir):
+    state_path = crashed_dir / ReplayStorage.STATE_FILE
+    state = json.loads(state_path.read_text())
+    state_path.write_text(json.dumps({**state, "version": -1}))
+    with pytest.raises(SystemError):
+        make_buffer(crashed_dir)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.utils.common import constants
+
+N_EPISODES = 4
+N_STEPS = 30
+
+
+@pytest.fixture
+def envs():
+    envs = [
+        NeuroRoboticsEnv(reset_mode=reset_mode.value, seed=0, copy_observations=True)
+        for reset_mode in (constants.ResetMode.FULL, constants.ResetMode.SNAPSHOT)
+    ]
+    yield envs
+    for env in envs:
+        env.close()
+
+
+def assert_same_observation(full_observation, snapshot_observation):
+    assert full_observation.keys() == snapshot_observation.keys()
+    for key, value in full_observation.items():
+        np.testing.assert_array_equal(value, snapshot_observation[key])
+
+
+def test_default_reset_mode_is_full():
+    env = NeuroRoboticsEnv(headless=True)
+    try:
+        assert env.reset_mode == constants.ResetMode.FULL
+    finally:
+        env.close()
+
+
+def test_snapshot_resets_replay_full_reset_episodes(envs):
+    full_env, snapshot_env = envs
+    actions = (
+        np.random.default_rng(0)
+        .uniform(-1.0, 1.0, size=(N_EPISODES, N_STEPS, 4))
+        .astype(np.float32)
+    )
+    for episode, episode_actions in enumerate(actions):
+        # the restore has to undo the arm and goal motion of the previous episode
+        assert_same_observation(
+            full_env.reset(seed=episode), snapshot_env.reset(seed=episode)
+        )
+        for action in episode_actions:
+            full_step = full_env.step(action)
+            snapshot_step = snapshot_env.step(action)
+            assert_same_observation(full_step[0], snapshot_step[0])
+            assert full_step[1:3] == snapshot_step[1:3]
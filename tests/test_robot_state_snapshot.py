@@ -0,0 +1,80 @@
+from collections import Counter
+
+import numpy as np
+import pybullet as p
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+
+N_STEPS = 10
+
+
+@pytest.fixture
+def env():
+    env = NeuroRoboticsEnv(headless=True, seed=0)
+    env.reset()
+    yield env
+    env.close()
+
+
+def _count_robot_queries(monkeypatch, client, robot):
+    """count the state queries addressed to the robot body"""
+    counts = Counter()
+    for name in ("getJointState", "getJointStates", "getLinkState", "getLinkStates"):
+        query = getattr(client, name)
+
+        def counted(body, *args, _name=name, _query=query, **kwargs):
+            if body == robot.model:
+                counts[_name] += 1
+            return _query(body, *args, **kwargs)
+
+        monkeypatch.setattr(client, name, counted)
+    return counts
+
+
+def test_snapshot_matches_individual_queries(env):
+    robot = env.realm.robot
+    client_id = env.physics_client._client
+    for action in np.random.default_rng(0).uniform(-1, 1, (N_STEPS, 4)):
+        env.step(action)
+        snapshot = robot._read_state_snapshot()
+        for joint in robot._snapshot_joints:
+            position, velocity, _, _ = p.getJointState(
+                robot.model, joint, physicsClientId=client_id
+            )
+            assert snapshot.joint_positions[joint] == position
+            assert snapshot.joint_velocities[joint] == velocity
+        for link in robot._snapshot_links:
+            state = p.getLinkState(
+                robot.model, link, computeLinkVelocity=True, physicsClientId=client_id
+            )
+            assert snapshot.link_positions[link] == state[0]
+            assert snapshot.link_velocities[link] == state[6]
+
+
+def test_step_reads_the_robot_state_in_bulk(env, monkeypatch):
+    robot = env.realm.robot
+    env.step(env.action_space.sample())
+    counts = _count_robot_queries(monkeypatch, env.physics_client, robot)
+    for action in np.random.default_rng(0).uniform(-1, 1, (N_STEPS, 4)):
+        env.step(action)
+    assert counts["getJointState"] == 0
+    assert counts["getLinkState"] == 0
+    # act reuses the snapshot the previous observation read
+    assert counts["getJointStates"] == N_STEPS
+    assert counts["getLinkStates"] == N_STEPS
+
+
+def test_observation_follows_the_simulation(env):
+    robot = env.realm.robot
+    client_id = env.physics_client._client
+    for action in np.random.default_rng(1).uniform(-1, 1, (N_STEPS, 4)):
+        observation, _, _, _ = env.step(action)
+        position = p.getLinkState(
+            robot.model, robot.effector_link_id, physicsClientId=client_id
+        )[0]
+        np.testing.assert_allclose(
+            observation["observation"][:3],
+            np.array(position) - robot.base_offset,
+            rtol=1e-6,
+        )
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.environment.rollouts import replay_episode
+from neuro_robotics.environment.rollouts import RolloutLogger
+from neuro_robotics.environment.rollouts import RolloutReader
+
+N_EPISODES = 3
+EPISODE_STEPS = 12
+# shards of 16 rows, the last one is written partially on close
+SHARD_SIZE = 16
+
+
+@pytest.fixture
+def logged(tmp_path):
+    """log a few episodes and keep what the wrapper returned as reference"""
+    env = RolloutLogger(
+        NeuroRoboticsEnv(headless=True, seed=0), tmp_path, shard_size=SHARD_SIZE
+    )
+    rng = np.random.default_rng(0)
+    reference = {name: [] for name in env.columns}
+    for episode in range(N_EPISODES):
+        observation = env.reset()
+        for step in range(EPISODE_STEPS):
+            action = rng.uniform(-1, 1, 4).astype(np.float32)
+            next_observation, reward, done, info = env.step(action)
+            for key in observation:
+                reference[f"obs.{key}"].append(observation[key].copy())
+                reference[f"next_obs.{key}"].append(next_observation[key].copy())
+            reference["action"].append(action)
+            reference["reward"].append(reward)
+            reference["done"].append(done)
+            reference["truncated"].append(info.get("TimeLimit.truncated", False))
+            reference["is_success"].append(bool(info["is_success"]))
+            reference["episode"].append(episode)
+            reference["episode_seed"].append(info["episode_seed"])
+            reference["curriculum_level"].append(-1)
+            reference["step"].append(step)
+            observation = next_observation
+    env.close()
+    return tmp_path, {name: np.array(column) for name, column in reference.items()}
+
+
+def test_load_round_trips_every_column(logged):
+    directory, reference = logged
+    reader = RolloutReader(directory)
+    assert len(reader.shard_paths) == -(-N_EPISODES * EPISODE_STEPS // SHARD_SIZE)
+    assert len(reader) == N_EPISODES * EPISODE_STEPS
+    columns = reader.load()
+    assert columns.keys() == reference.keys()
+    for name, column in columns.items():
+        assert column.dtype.str == reader.manifest[name]["dtype"]
+        assert list(column.shape[1:]) == reader.manifest[name]["shape"]
+        np.testing.assert_array_equal(column, reference[name], err_msg=name)
+
+
+def test_batches_and_transitions_cover_the_same_rows(logged):
+    directory, reference = logged
+    reader = RolloutReader(directory, columns=["action", "obs.observation"])
+    batches = list(reader.batches(batch_size=10))
+    assert [len(batch["action"]) for batch in batches] == [10, 10, 10, 6]
+    np.testing.assert_array_equal(
+        np.concatenate([batch["action"] for batch in batches]), reference["action"]
+    )
+    assert len(list(reader.batches(batch_size=10, drop_last=True))) == 3
+
+    transitions = list(reader.transitions())
+    assert len(transitions) == N_EPISODES * EPISODE_STEPS
+    np.testing.assert_array_equal(
+        transitions[5]["obs"]["observation"], reference["obs.observation"][5]
+    )
+    np.testing.assert_array_equal(transitions[5]["action"], reference["action"][5])
+
+
+def test_find_episode_returns_the_rows_of_one_episode(logged):
+    directory, reference = logged
+    reader = RolloutReader(directory)
+    episode_seed = int(reference["episode_seed"][EPISODE_STEPS])
+    episode = reader.find_episode(episode_seed)
+    rows = slice(EPISODE_STEPS, 2 * EPISODE_STEPS)
+    np.testing.assert_array_equal(episode["step"], np.arange(EPISODE_STEPS))
+    np.testing.assert_array_equal(episode["action"], reference["action"][rows])
+    # within an episode the next observation is the next row's observation
+    np.testing.assert_array_equal(
+        episode["next_obs.observation"][:-1], episode["obs.observation"][1:]
+    )
+    with pytest.raises(SystemError):
+        reader.find_episode(-2)
+
+
+def test_found_episode_replays_from_its_seed(logged):
+    directory, reference = logged
+    episode_seed = int(reference["episode_seed"][-1])
+    episode = RolloutReader(directory).find_episode(episode_seed)
+    env = NeuroRoboticsEnv(headless=True, seed=123)
+    try:
+        replay = replay_episode(env, episode_seed, episode["action"])
+    finally:
+        env.close()
+    np.testing.assert_array_equal(
+        replay["observations"][0]["observation"], episode["obs.observation"][0]
+    )
+    for key in replay["observations"][0]:
+        np.testing.assert_array_equal(
+            [observation[key] for observation in replay["observations"][1:]],
+            episode[f"next_obs.{key}"],
+        )
+    np.testing.assert_array_equal(replay["rewards"], episode["reward"])
+
+
+def test_reader_refuses_unknown_columns_and_missing_manifests(logged, tmp_path):
+    directory, _ = logged
+    with pytest.raises(SystemError):
+        RolloutReader(directory, columns=["obs.pixels"])
+    with pytest.raises(SystemError):
+        RolloutReader(tmp_path / "empty")
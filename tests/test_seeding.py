@@ -0,0 +1,41 @@
+import numpy as np
+
+from neuro_robotics.utils.common.seeding import EPISODE_SEED_BOUND
+from neuro_robotics.utils.common.seeding import make_generator
+from neuro_robotics.utils.common.seeding import spawn_seeds
+
+
+def test_seeded_generators_replay_the_same_stream():
+    generator, seed = make_generator(123)
+    replay, replay_seed = make_generator(123)
+    assert seed == replay_seed == 123
+    np.testing.assert_array_equal(generator.random(8), replay.random(8))
+
+
+def test_unseeded_generator_reports_a_replayable_seed():
+    generator, seed = make_generator()
+    assert isinstance(seed, int)
+    replay, _ = make_generator(seed)
+    np.testing.assert_array_equal(
+        generator.integers(EPISODE_SEED_BOUND, size=8),
+        replay.integers(EPISODE_SEED_BOUND, size=8),
+    )
+
+
+def test_spawned_seeds_are_deterministic_and_distinct():
+    seeds = spawn_seeds(7, 16)
+    assert seeds == spawn_seeds(7, 16)
+    assert len(set(seeds)) == 16
+    assert all(isinstance(seed, int) and seed >= 0 for seed in seeds)
+    # a larger pool extends the smaller one
+    assert spawn_seeds(7, 20)[:16] == seeds
+    assert set(seeds).isdisjoint(spawn_seeds(8, 16))
+
+
+def test_spawned_streams_differ():
+    first, second = (make_generator(seed)[0] for seed in spawn_seeds(0, 2))
+    assert not np.array_equal(first.random(8), second.random(8))
+
+
+def test_unseeded_root_keeps_workers_unseeded():
+    assert spawn_seeds(None, 3) == [None, None, None]
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment.vectorized import make_vec_env
+from neuro_robotics.environment.vectorized import SharedMemoryVecEnv
+from neuro_robotics.utils.common import constants
+
+ENV_IDENTIFIER = "NeuroRobotics-v1"
+NUM_ENVS = 2
+# two episodes per worker, the time limit ends them at 50 steps
+N_STEPS = 120
+
+
+def build(backend):
+    return make_vec_env(
+        ENV_IDENTIFIER,
+        num_envs=NUM_ENVS,
+        backend=backend,
+        start_method="forkserver",
+        env_kwargs=dict(reset_mode=constants.ResetMode.SNAPSHOT.value, headless=True),
+        seed=0,
+    )
+
+
+def rollout(env, actions):
+    observations, rewards, dones, infos = [env.reset()], [], [], []
+    for action in actions:
+        observation, reward, done, info = env.step(action)
+        # shared memory buffers are overwritten by the next step
+        observations.append({key: value.copy() for key, value in observation.items()})
+        rewards.append(reward.copy())
+        dones.append(done.copy())
+        infos.append(info)
+    return observations, np.array(rewards), np.array(dones), infos
+
+
+@pytest.fixture(scope="module")
+def rollouts():
+    actions = (
+        np.random.default_rng(0)
+        .uniform(-1.0, 1.0, size=(N_STEPS, NUM_ENVS, 4))
+        .astype(np.float32)
+    )
+    results = {}
+    for backend in ("dummy", "shared_memory"):
+        env = build(backend)
+        try:
+            results[backend] = rollout(env, actions)
+        finally:
+            env.close()
+    return results
+
+
+def test_backend_is_shared_memory():
+    env = build("shared_memory")
+    try:
+        assert isinstance(env, SharedMemoryVecEnv)
+        assert env.num_envs == NUM_ENVS
+    finally:
+        env.close()
+
+
+def test_observations_match_dummy(rollouts):
+    dummy, shared = rollouts["dummy"][0], rollouts["shared_memory"][0]
+    for dummy_observation, shared_observation in zip(dummy, shared):
+        assert dummy_observation.keys() == shared_observation.keys()
+        for key in dummy_observation:
+            assert shared_observation[key].dtype == dummy_observation[key].dtype
+            np.testing.assert_array_equal(
+                shared_observation[key], dummy_observation[key]
+            )
+
+
+def test_rewards_and_dones_match_dummy(rollouts):
+    _, dummy_rewards, dummy_dones, _ = rollouts["dummy"]
+    _, shared_rewards, shared_dones, _ = rollouts["shared_memory"]
+    np.testing.assert_array_equal(shared_rewards, dummy_rewards)
+    np.testing.assert_array_equal(shared_dones, dummy_dones)
+    assert dummy_dones.sum(axis=0).min() >= 2
+
+
+def test_terminal_observations_match_dummy(rollouts):
+    dummy_infos, shared_infos = rollouts["dummy"][3], rollouts["shared_memory"][3]
+    for dummy_info, shared_info in zip(dummy_infos, shared_infos):
+        for dummy_env_info, shared_env_info in zip(dummy_info, shared_info):
+            assert dummy_env_info["episode_seed"] == shared_env_info["episode_seed"]
+            assert dummy_env_info["is_success"] == shared_env_info["is_success"]
+            assert ("terminal_observation" in dummy_env_info) == (
+                "terminal_observation" in shared_env_info
+            )
+            if "terminal_observation" in dummy_env_info:
+                for key, value in dummy_env_info["terminal_observation"].items():
+                    np.testing.assert_array_equal(
+                        shared_env_info["terminal_observation"][key], value
+                    )
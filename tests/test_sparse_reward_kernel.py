@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.environment.reward import SparseRewardKernel
+
+DISTANCE_THRESHOLD = 0.05
+
+
+@pytest.fixture
+def kernel():
+    return SparseRewardKernel(DISTANCE_THRESHOLD)
+
+
+def goal_batch(shape, seed=0):
+    """achieved goals on both sides of the threshold around random desired goals"""
+    rng = np.random.default_rng(seed)
+    desired_goal = rng.uniform(-1.0, 1.0, size=shape + (3,)).astype(np.float32)
+    offset = rng.uniform(0.0, 2 * DISTANCE_THRESHOLD, size=shape + (1,))
+    direction = rng.normal(size=shape + (3,))
+    direction /= np.linalg.norm(direction, axis=-1, keepdims=True)
+    achieved_goal = (desired_goal + offset * direction).astype(np.float32)
+    return achieved_goal, desired_goal
+
+
+def reference_reward(achieved_goal, desired_goal):
+    distance = np.linalg.norm(achieved_goal - desired_goal, axis=-1)
+    return -(distance > DISTANCE_THRESHOLD).astype(np.float32)
+
+
+def test_single_goal_returns_scalar(kernel):
+    goal = np.zeros(3, dtype=np.float32)
+    far_goal = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+    assert kernel.compute_reward(goal, goal, None) == 0.0
+    assert kernel.compute_reward(goal, far_goal, None) == -1.0
+    assert kernel.is_success(goal, goal) == 1.0
+    assert kernel.is_success(goal, far_goal) == 0.0
+
+
+@pytest.mark.parametrize("shape", [(1,), (7,), (256,), (4, 5)])
+def test_batch_matches_reference(kernel, shape):
+    achieved_goal, desired_goal = goal_batch(shape)
+    reward = kernel.compute_reward(achieved_goal, desired_goal, None)
+    assert reward.shape == shape
+    assert reward.dtype == np.float32
+    np.testing.assert_array_equal(reward, reference_reward(achieved_goal, desired_goal))
+    success = kernel.is_success(achieved_goal, desired_goal)
+    np.testing.assert_array_equal(
+        success, 1.0 + reference_reward(achieved_goal, desired_goal)
+    )
+
+
+def test_scratch_buffers_are_reused(kernel):
+    achieved_goal, desired_goal = goal_batch((64,))
+    first = kernel.compute_reward(achieved_goal, desired_goal, None)
+    second = kernel.compute_reward(achieved_goal[:32], desired_goal[:32], None)
+    assert np.shares_memory(first, second)
+
+
+def test_writes_into_contiguous_out(kernel):
+    achieved_goal, desired_goal = goal_batch((4, 5))
+    out = np.full((4, 5), 7.0, dtype=np.float32)
+    reward = kernel.compute_reward(achieved_goal, desired_goal, None, out=out)
+    assert reward is out
+    np.testing.assert_array_equal(out, reference_reward(achieved_goal, desired_goal))
+
+
+def test_writes_into_strided_out(kernel):
+    achieved_goal, desired_goal = goal_batch((16,))
+    rewards = np.full((16, 2), 7.0, dtype=np.float32)
+    out = rewards[:, 0]
+    assert not out.flags.c_contiguous
+    kernel.compute_reward(achieved_goal, desired_goal, None, out=out)
+    np.testing.assert_array_equal(
+        rewards[:, 0], reference_reward(achieved_goal, desired_goal)
+    )
+    np.testing.assert_array_equal(rewards[:, 1], 7.0)
+
+    kernel.is_success(achieved_goal, desired_goal, out=rewards[:, 1])
+    np.testing.assert_array_equal(
+        rewards[:, 1], 1.0 + reference_reward(achieved_goal, desired_goal)
+    )
+
+
+def test_writes_into_uncollapsible_out(kernel):
+    """a flat reshape of this out is a copy, the rewards must still land in out"""
+    achieved_goal, desired_goal = goal_batch((4, 5))
+    rewards = np.full((4, 6), 7.0, dtype=np.float32)
+    out = rewards[:, :5]
+    kernel.compute_reward(achieved_goal, desired_goal, None, out=out)
+    np.testing.assert_array_equal(
+        rewards[:, :5], reference_reward(achieved_goal, desired_goal)
+    )
+    np.testing.assert_array_equal(rewards[:, 5], 7.0)
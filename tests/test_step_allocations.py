@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from neuro_robotics.benchmarks import step_allocations
+from neuro_robotics.benchmarks.step_allocations import measure
+from neuro_robotics.benchmarks.step_allocations import NumpyAllocationCounter
+from neuro_robotics.environment import NeuroRoboticsEnv
+from neuro_robotics.environment.vectorized import BatchedNeuroRoboticsEnv
+from neuro_robotics.utils.common import constants
+
+N_WARMUP = 60
+N_STEPS = 200
+
+pytestmark = pytest.mark.skipif(
+    not NumpyAllocationCounter.supported(),
+    reason="numpy memory handlers are not reachable on this numpy ABI",
+)
+
+
+def test_counter_sees_freed_temporaries():
+    array = np.ones(4)
+    with NumpyAllocationCounter() as counter:
+        np.add(array, array, out=array)
+        array[:2].fill(0.0)
+    assert counter.count == 0
+    with NumpyAllocationCounter() as counter:
+        # the sum is freed right away, a snapshot would never see it
+        float((array + 1.0).sum())
+        np.clip(array, -1.0, 1.0, out=array)
+    assert counter.count >= 2
+
+
+def test_unknown_abi_is_refused(monkeypatch):
+    monkeypatch.setattr(step_allocations, "KNOWN_ABI_VERSIONS", ())
+    assert not NumpyAllocationCounter.supported()
+    with pytest.raises(SystemError):
+        with NumpyAllocationCounter():
+            pass
+
+
+@pytest.mark.parametrize(
+    "copy_observations,allocations_per_step", [(False, 0), (True, 3)]
+)
+def test_steady_state_step_allocations(copy_observations, allocations_per_step):
+    actions = (
+        np.random.default_rng(0)
+        .uniform(-1.0, 1.0, size=(N_WARMUP + N_STEPS, 4))
+        .astype(np.float32)
+    )
+    env = NeuroRoboticsEnv(
+        reset_mode=constants.ResetMode.SNAPSHOT.value,
+        headless=True,
+        seed=0,
+        copy_observations=copy_observations,
+    )
+    try:
+        result = measure(env, actions, N_WARMUP)
+    finally:
+        env.close()
+    # owned observations copy their three keys, nothing else is allocated
+    assert result["allocations_per_step"] == allocations_per_step
+
+
+def test_batched_step_allocates_only_returned_arrays():
+    num_envs = 4
+    env = BatchedNeuroRoboticsEnv(num_envs, headless=True, seed=0)
+    rng = np.random.default_rng(0)
+    try:
+        env.reset()
+        for _ in range(N_WARMUP):
+            env.step(rng.uniform(-1.0, 1.0, size=(num_envs, 4)).astype(np.float32))
+        counts = []
+        for _ in range(N_STEPS):
+            actions = rng.uniform(-1.0, 1.0, size=(num_envs, 4)).astype(np.float32)
+            with NumpyAllocationCounter() as counter:
+                _, _, dones, _ = env.step(actions)
+            if not dones.any():
+                counts.append(counter.count)
+    finally:
+        env.close()
+    assert counts
+    # the learner keeps the returned observation keys, rewards and dones
+    n_observation_keys = len(env.observation_space.spaces)
+    assert set(counts) == {n_observation_keys + 2}